@@ -0,0 +1,161 @@
+To avoid hitting the database on every status poll, single-task lookups go through a read-through cache. The cache stores the Pydantic response model, so a hit skips both the query and the ORM-to-schema conversion.
+
+The default backend is a bounded in-process LRU with a TTL. Setting `TASK_CACHE_URL` to a Redis URL switches to a shared backend, so that invalidations are seen by every worker.
+
+```python
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+TASK_CACHE_SIZE = int(os.environ.get("TASK_CACHE_SIZE", 10_000))
+TASK_CACHE_TTL = float(os.environ.get("TASK_CACHE_TTL", 5.0))
+TASK_CACHE_URL = os.environ.get("TASK_CACHE_URL")
+
+class CacheBackend(ABC):
+    """
+    Storage used by ReadThroughCache. Values are Pydantic models.
+    """
+    evictions = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[BaseModel]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: BaseModel):
+        ...
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+class LRUTTLBackend(CacheBackend):
+    """
+    Bounded in-process cache. Least recently used entries are evicted once
+    `maxsize` is reached, and entries older than `ttl` seconds are never served.
+    """
+    def __init__(self, maxsize: int = TASK_CACHE_SIZE, ttl: float = TASK_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+class RedisBackend(CacheBackend):
+    """
+    Shared cache for multi-worker deployments. Any client exposing Redis
+    `get`/`set`/`delete` works, e.g. `redis.Redis` or `fakeredis.FakeRedis` in tests.
+    Evictions are handled by Redis itself and are not counted here.
+    """
+    def __init__(self, client, model: Type[BaseModel], ttl: float = TASK_CACHE_TTL, prefix: str = "cache:"):
+        self.client = client
+        self.model = model
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return None if raw is None else self.model.parse_raw(raw)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, value.json(), px=int(self.ttl * 1000))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+def make_backend(name: str, model: Type[BaseModel]) -> CacheBackend:
+    if TASK_CACHE_URL:
+        import redis  # only required when a shared cache is configured
+
+        return RedisBackend(redis.Redis.from_url(TASK_CACHE_URL), model, prefix=f"{name}:")
+    return LRUTTLBackend()
+
+_caches: Dict[str, "ReadThroughCache"] = {}
+
+class ReadThroughCache:
+    """
+    Caches `model.from_orm(loader())` by key. Misses that load nothing are not cached.
+    With `register=False` the cache is left out of `invalidate_task` and `cache_stats`.
+    """
+    def __init__(
+        self,
+        name: str,
+        model: Type[BaseModel],
+        backend: Optional[CacheBackend] = None,
+        register: bool = True,
+    ):
+        self.name = name
+        self.model = model
+        self.backend = backend or make_backend(name, model)
+        self.hits = 0
+        self.misses = 0
+        # Sync endpoints run in a threadpool, and += on an attribute is not atomic
+        self._lock = threading.Lock()
+        if register:
+            _caches[name] = self
+
+    def get(self, key: Any, loader: Callable[[], Any]):
+        key = str(key)
+        value = self.backend.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value
+        with self._lock:
+            self.misses += 1
+        obj = loader()
+        if obj is None:
+            return None
+        value = self.model.from_orm(obj)
+        self.backend.set(key, value)
+        return value
+
+    def invalidate(self, key: Any):
+        self.backend.delete(str(key))
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {"hits": hits, "misses": misses, "evictions": self.backend.evictions}
+
+def invalidate_task(task_id: int):
+    """
+    Drop a task from every task cache. Call after the write has been committed.
+    """
+    for cache in _caches.values():
+        cache.invalidate(task_id)
+
+def cache_stats():
+    return {name: cache.stats() for name, cache in _caches.items()}
+```
+
+`tasks.py` and `startup_event.py` each create a `ReadThroughCache` for their own `Task` response model. Writes to a task call `invalidate_task`, which drops the id from every registered cache, so one router never serves a status that was changed through the other. `GET /cache/stats` reports each registered cache's counters; like `/debug/profile`, it needs the `X-Profiler-Token` header.
@@ -0,0 +1,55 @@
+Updates to a task overwrite its row in place. Without a change log, a client that wants to stay in sync has to re-read every task. `task_changes` is an append-only log with one row per create, update or delete. Each row holds a monotonic `seq`, the task id, the operation, and the fields that changed with their new values.
+
+Writers call `record_changes` with the same session as the write, so an entry commits or rolls back together with the change it describes. Readers page through `changes_since(seq)`, so a client catching up does O(changes) work instead of O(tasks).
+
+```python
+from datetime import datetime
+from typing import Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import JSON, Column, DateTime, Integer, String, insert, text
+from sqlalchemy.orm import Session
+
+from .database import Base
+
+class TaskChange(Base):
+    __tablename__ = "task_changes"
+    # AUTOINCREMENT: SQLite never reuses the seq of a deleted tail row
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)  # "create", "update" or "delete"
+    fields = Column(JSON, nullable=False, default=dict)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+# Arbitrary key for the PostgreSQL advisory lock that orders change-log writers
+CHANGELOG_LOCK_KEY = 0x7461736B
+
+def change(task_id: int, op: str, fields: Dict = None) -> Dict:
+    return {"task_id": task_id, "op": op, "fields": jsonable_encoder(fields or {})}
+
+def record_changes(db: Session, changes: List[Dict]):
+    """
+    Append `changes` (built with `change`) in the caller's transaction.
+    """
+    if not changes:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        # Sequence values are handed out before commit, so two concurrent writers
+        # could commit seq 11 before seq 10 and a reader at since=10 would skip it.
+        # Serializing writers makes seq order match commit order.
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHANGELOG_LOCK_KEY})
+    db.execute(insert(TaskChange), changes)
+
+def changes_since(db: Session, since: int = 0, limit: int = 1000) -> List[TaskChange]:
+    return (
+        db.query(TaskChange)
+        .filter(TaskChange.seq > since)
+        .order_by(TaskChange.seq)
+        .limit(limit)
+        .all()
+    )
+```
+
+SQLite allows only one writer at a time, so its `seq` values already commit in order. On PostgreSQL the advisory lock is held only from the log insert until commit, at the end of each write transaction.
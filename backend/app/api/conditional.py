@@ -0,0 +1,52 @@
+Polling clients mostly re-fetch resources that have not changed. These helpers implement conditional GET: the endpoints compute an ETag from a resource's revision (or, for lists, from an aggregate over the rows' revisions) and answer `If-None-Match` / `If-Modified-Since` with an empty 304 when the client is up to date.
+
+```python
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+def make_etag(*parts) -> str:
+    """
+    Strong ETag built from the given version components.
+    """
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+def _as_utc(dt: datetime) -> datetime:
+    # Columns store naive UTC; HTTP dates have one-second resolution
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.replace(microsecond=0)
+
+def http_date(dt: datetime) -> str:
+    return format_datetime(_as_utc(dt), usegmt=True)
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match uses weak comparison, so a W/ prefix is ignored
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = _as_utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified) <= since
+    return False
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
+```
+
+`Task`, `Comment` and `NotificationDB` each carry a `revision` column (its `onupdate` is `revision + 1`, so every UPDATE bumps it) and an `updated_at` timestamp. A single resource uses its own revision for the ETag. A list uses the row count, the highest id and the sum of revisions, so inserts, deletes and updates all change the tag.
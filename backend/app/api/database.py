@@ -0,0 +1,143 @@
+All routers share one database module. It holds one pooled engine for the synchronous routers, one async engine for notifications, and the per-request session dependencies `get_db` and `get_async_session`. Everything is tuned through environment variables:
+
+- `DATABASE_URL` / `NOTIFICATIONS_DATABASE_URL`: connection URLs (SQLite files by default)
+- `DB_POOL_SIZE`, `DB_MAX_OVERFLOW`, `DB_POOL_TIMEOUT`, `DB_POOL_RECYCLE`: pool sizing
+- `DB_STATEMENT_TIMEOUT_MS`: PostgreSQL `statement_timeout`, or SQLite `busy_timeout`
+
+SQLite connections are switched to WAL with `synchronous=NORMAL`. Readers then no longer block the writer, and commits skip the per-transaction fsync of the rollback journal.
+
+```python
+import os
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./tms.db")
+# Same database as DATABASE_URL by default: broadcasts read tasks and comments
+ASYNC_DATABASE_URL = os.environ.get("NOTIFICATIONS_DATABASE_URL", "sqlite+aiosqlite:///./tms.db")
+POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 20))
+MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 30))
+POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", 5000))
+
+class PoolMetrics:
+    def __init__(self):
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+class _TimedCheckout:
+    """
+    Counts checkouts and times how long each one waits for a free connection.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeout:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+def _engine_options(url: str, poolclass):
+    options = {"pool_pre_ping": True}
+    if url.startswith("sqlite") and (":memory:" in url or url.split("://", 1)[1] == ""):
+        return options  # in-memory SQLite keeps SQLAlchemy's single-connection pool
+    options.update(
+        poolclass=poolclass,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_recycle=POOL_RECYCLE,
+    )
+    if url.startswith("postgresql"):
+        options["connect_args"] = {"options": f"-c statement_timeout={STATEMENT_TIMEOUT_MS}"}
+    return options
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={STATEMENT_TIMEOUT_MS}")
+    cursor.close()
+
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL, TimedQueuePool))
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL, TimedAsyncQueuePool))
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _sqlite_pragmas)
+if async_engine.dialect.name == "sqlite":
+    event.listen(async_engine.sync_engine, "connect", _sqlite_pragmas)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False so committed rows can still be serialized after the commit
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+Base = declarative_base()
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def get_session_factory():
+    # For responses that outlive the request, such as streams, which open and close their own session
+    return SessionLocal
+
+async def get_async_session():
+    async with AsyncSessionLocal() as session:
+        yield session
+
+def pool_stats():
+    stats = {}
+    for name, pool in (("sync", engine.pool), ("async", async_engine.pool)):
+        # In-memory SQLite keeps a SingletonThreadPool/StaticPool, which has no counters
+        stats[name] = {
+            key: getattr(pool, attr)()
+            for key, attr in (("checked_out", "checkedout"), ("overflow", "overflow"), ("size", "size"))
+            if hasattr(pool, attr)
+        }
+        metrics = getattr(pool, "metrics", None)
+        if metrics is not None:
+            stats[name].update(
+                checkouts=metrics.checkouts,
+                wait_seconds=metrics.wait_seconds,
+                max_wait_seconds=metrics.max_wait_seconds,
+                timeouts=metrics.timeouts,
+            )
+    return stats
+```
+
+Routers import `get_db` (or `get_async_session` for notifications) from here and do not define their own. Tests can still override a single dependency with `app.dependency_overrides[get_db]`. Streaming responses outlive the request's dependencies, so they take a session factory from `get_session_factory` instead; tests override that one as well.
+
+`pool_stats()` backs `GET /db/pool`. `checkouts` counts every checkout, whether it waited or not, so the average wait is `wait_seconds / checkouts`. Like `/debug/profile`, the endpoint needs the `X-Profiler-Token` header.
@@ -0,0 +1,35 @@
+For large list responses, most of the CPU goes into validating ORM objects through the `orm_mode` response models and then encoding them with the stdlib `json` module. `RowsResponse` is an opt-in shortcut. The endpoint selects exactly the response model's columns as row tuples, and `orjson` turns them straight into bytes. Rows read from our own tables already have the right shape, so they skip the second validation.
+
+Set `FAST_JSON=1` to enable it. `orjson` is only needed then.
+
+```python
+import os
+from typing import Iterable, Sequence
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional, only required with FAST_JSON=1
+    orjson = None
+
+FAST_JSON = os.environ.get("FAST_JSON") == "1"
+
+if FAST_JSON and orjson is None:
+    raise RuntimeError("FAST_JSON=1 requires the orjson package")
+
+class RowsResponse(Response):
+    """
+    JSON array of objects built from row tuples and their column names.
+    orjson encodes datetimes in the same ISO 8601 form as the default path.
+    """
+    media_type = "application/json"
+
+    def __init__(self, rows: Iterable[Sequence], names: Sequence[str], **kwargs):
+        super().__init__(content=[dict(zip(names, row)) for row in rows], **kwargs)
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+```
+
+`read_tasks`, `read_comments` and `read_notifications` check `fastjson.FAST_JSON` through the module attribute rather than importing the flag, so tests and benchmarks can switch it per run. Only the plain list responses take the fast path. Cursor envelopes, projections and conditional 304 responses are unchanged.
@@ -10,19 +10,25 @@ To implement the comments feature, we will need the following:
 Here is the code:
 
 ```python
-from typing import List
-from fastapi import FastAPI, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import json
+from typing import List, Optional, Union
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 from pydantic import BaseModel
-from . import models, schemas, crud
-from .database import SessionLocal, engine
+from . import crud, fastjson, models, schemas
+from .conditional import is_not_modified, make_etag, not_modified_response, validator_headers
+from .database import engine, get_db, get_session_factory
+from .metrics import instrument
 
 models.Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
+instrument(app)
 
 class CommentBase(BaseModel):
     text: str
+    author_id: Optional[int] = None
 
 class CommentCreate(CommentBase):
     pass
@@ -33,12 +39,9 @@ class Comment(CommentBase):
     class Config:
         orm_mode = True
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+class CommentPage(BaseModel):
+    items: List[Comment]
+    next_cursor: Optional[str] = None
 
 @app.post("/tasks/{task_id}/comments/", response_model=Comment)
 def create_comment(task_id: int, comment: CommentCreate, db: Session = Depends(get_db)):
@@ -47,29 +50,131 @@ def create_comment(task_id: int, comment: CommentCreate, db: Session = Depends(g
     """
     return crud.create_comment(db=db, comment=comment, task_id=task_id)
 
-@app.get("/tasks/{task_id}/comments/", response_model=List[Comment])
-def read_comments(task_id: int, db: Session = Depends(get_db)):
+@app.get("/tasks/{task_id}/comments/", response_model=Union[CommentPage, List[Comment]])
+def read_comments(
+    task_id: int,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
     """
     Get all comments on a task.
+
+    Passing `cursor` (empty for the first page) returns a `CommentPage` of at
+    most `limit` comments, oldest first, with `next_cursor` for the next page.
+    Without `cursor`, the first `limit` comments are returned as a plain list.
+
+    The ETag is checked with a single aggregate query, so a matching
+    `If-None-Match` returns 304 without loading any comment rows.
     """
-    comments = crud.get_comments(db, task_id=task_id)
+    try:
+        after_id = crud.decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    page_limit = limit + 1 if cursor is not None else limit
+    version = crud.get_comments_version(db, task_id=task_id, after_id=after_id, limit=page_limit)
+    etag = make_etag("comments", task_id, cursor, page_limit, version.count, version.max_id, version.revisions)
+    if is_not_modified(request, etag, version.updated_at):
+        return not_modified_response(etag, version.updated_at)
+    headers = validator_headers(etag, version.updated_at)
+    response.headers.update(headers)
+    if cursor is not None:
+        return crud.get_comments_page(db, task_id=task_id, after_id=after_id, limit=limit)
+    if fastjson.FAST_JSON:
+        # A returned Response does not inherit headers set on `response`
+        rows = crud.get_comment_rows(db, task_id=task_id, limit=limit)
+        return fastjson.RowsResponse(rows, crud.COMMENT_FIELDS, headers=headers)
+    comments = crud.get_comments(db, task_id=task_id, limit=limit)
     if comments is None:
         raise HTTPException(status_code=404, detail="Comments not found")
     return comments
+
+@app.get("/tasks/{task_id}/comments/export")
+def export_comments(task_id: int, session_factory: sessionmaker = Depends(get_session_factory)):
+    """
+    Stream every comment on a task as NDJSON, one comment per line.
+
+    Rows are read in batches, so the full list is never held in memory.
+    """
+    def lines():
+        # The stream outlives the request's dependencies, so it owns its session
+        db = session_factory()
+        try:
+            for row in crud.iter_comments(db, task_id=task_id):
+                yield json.dumps({name: getattr(row, name) for name in crud.COMMENT_FIELDS}) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 ```
 
 In the `crud.py` file:
 
 ```python
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from . import models, schemas
-
-def get_comments(db: Session, task_id: int):
-    return db.query(models.Comment).filter(models.Comment.task_id == task_id).all()
+from . import models, schemas, search
+
+def comments_query(db: Session, task_id: int, after_id: int = None, limit: int = None):
+    # Served by the (task_id, id) index: a range scan in id order
+    query = db.query(models.Comment).filter(models.Comment.task_id == task_id)
+    if after_id is not None:
+        query = query.filter(models.Comment.id > after_id)
+    return query.order_by(models.Comment.id).limit(limit)
+
+def get_comments(db: Session, task_id: int, limit: int = None):
+    return comments_query(db, task_id, limit=limit).all()
+
+# Same fields as the Comment response model
+COMMENT_FIELDS = ["id", "task_id", "text", "author_id"]
+
+def get_comment_rows(db: Session, task_id: int, limit: int = None):
+    columns = [getattr(models.Comment, name) for name in COMMENT_FIELDS]
+    return (
+        db.query(*columns)
+        .filter(models.Comment.task_id == task_id)
+        .order_by(models.Comment.id)
+        .limit(limit)
+        .all()
+    )
+
+def decode_cursor(cursor: str):
+    try:
+        return int(cursor)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+def get_comments_page(db: Session, task_id: int, after_id: int = None, limit: int = 100):
+    # Fetch one extra row to know whether another page exists
+    comments = comments_query(db, task_id, after_id, limit + 1).all()
+    next_cursor = str(comments[limit - 1].id) if len(comments) > limit else None
+    return schemas.CommentPage(items=comments[:limit], next_cursor=next_cursor)
+
+def get_comments_version(db: Session, task_id: int, after_id: int = None, limit: int = None):
+    page = comments_query(db, task_id, after_id, limit).subquery()
+    return db.query(
+        func.count(page.c.id).label("count"),
+        func.max(page.c.id).label("max_id"),
+        func.sum(page.c.revision).label("revisions"),
+        func.max(page.c.updated_at).label("updated_at"),
+    ).one()
+
+def iter_comments(db: Session, task_id: int, batch_size: int = 1000):
+    columns = [getattr(models.Comment, name) for name in COMMENT_FIELDS]
+    return (
+        db.query(*columns)
+        .filter(models.Comment.task_id == task_id)
+        .order_by(models.Comment.id)
+        .yield_per(batch_size)
+    )
 
 def create_comment(db: Session, comment: schemas.CommentCreate, task_id: int):
-    db_comment = models.Comment(text=comment.text, task_id=task_id)
+    db_comment = models.Comment(text=comment.text, author_id=comment.author_id, task_id=task_id)
     db.add(db_comment)
+    db.flush()
+    search.index_comment(db, db_comment)
     db.commit()
     db.refresh(db_comment)
     return db_comment
@@ -78,7 +183,8 @@ def create_comment(db: Session, comment: schemas.CommentCreate, task_id: int):
 In the `models.py` file:
 
 ```python
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from datetime import datetime
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, literal_column
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -92,10 +198,19 @@ class Comment(Base):
     __tablename__ = "comments"
 
     id = Column(Integer, primary_key=True, index=True)
-    text = Column(String, index=True)
+    text = Column(String)
     task_id = Column(Integer, ForeignKey("tasks.id"))
+    author_id = Column(Integer, nullable=True)
+    revision = Column(Integer, nullable=False, default=1, onupdate=literal_column("revision") + 1)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     task = relationship("Task", back_populates="comments")
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        Index("ix_comments_task_id_id", "task_id", "id"),
+    )
 ```
 
 For the unit test, you can use the `TestClient` from `fastapi.testclient` to simulate HTTP requests and check the responses.
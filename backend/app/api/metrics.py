@@ -0,0 +1,202 @@
+Request metrics for every router. `MetricsMiddleware` times each request and labels it with the route template (`/tasks/{task_id}`), not the raw path, so label cardinality stays bounded. For each request it also records the response size, the number of SQL statements and the time spent running them, and the time spent in named phases such as bcrypt hashing.
+
+SQL statements are counted by listeners on the `Engine` class, so every engine is covered, including the async engines' `sync_engine`. The current request's counters live in a context variable. Starlette copies the context into the threadpool for sync endpoints and dependencies, and SQLAlchemy copies it into the greenlets behind async sessions, so statements are always charged to the request that ran them. Outside a request the listeners return immediately.
+
+```python
+import os
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Optional, Tuple
+
+from fastapi import FastAPI, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SERVER_TIMING = os.environ.get("SERVER_TIMING") == "1"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+UNMATCHED = "unmatched"  # 404s are grouped so arbitrary paths cannot create new series
+
+class RequestStats:
+    __slots__ = ("sql_count", "sql_seconds", "phases")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.phases: Dict[str, float] = {}
+
+    def server_timing(self, total: float) -> bytes:
+        parts = [f'db;dur={self.sql_seconds * 1000:.2f};desc="{self.sql_count} queries"']
+        parts += [f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in self.phases.items()]
+        parts.append(f"app;dur={total * 1000:.2f}")
+        return ", ".join(parts).encode()
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+@contextmanager
+def timed(phase: str):
+    """
+    Add the time spent in the block to the current request's `phase` total.
+    """
+    stats = _current.get()
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        if stats is not None:
+            stats.phases[phase] = stats.phases.get(phase, 0.0) + perf_counter() - start
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        # One statement runs at a time per connection; a failed one is overwritten by the next
+        conn.info["metrics_start"] = perf_counter()
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None:
+        stats.sql_count += 1
+        stats.sql_seconds += perf_counter() - conn.info.pop("metrics_start", perf_counter())
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+class RouteMetrics:
+    __slots__ = ("latency", "size", "sql_count", "sql_seconds", "phases")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.phases: Dict[str, float] = {}
+
+class MetricsRegistry:
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, seconds: float, size: int, stats: RequestStats):
+        with self._lock:
+            metrics = self.routes.get((method, route))
+            if metrics is None:
+                metrics = self.routes[(method, route)] = RouteMetrics()
+            metrics.latency.observe(seconds)
+            metrics.size.observe(size)
+            metrics.sql_count += stats.sql_count
+            metrics.sql_seconds += stats.sql_seconds
+            for phase, phase_seconds in stats.phases.items():
+                metrics.phases[phase] = metrics.phases.get(phase, 0.0) + phase_seconds
+
+    def render(self) -> str:
+        """
+        All series in the Prometheus text exposition format.
+        """
+        with self._lock:
+            routes = sorted(self.routes.items())
+            lines = []
+            _histogram(lines, "http_request_duration_seconds", "Request latency", routes, "latency")
+            _histogram(lines, "http_response_size_bytes", "Response body size", routes, "size")
+            lines += ["# HELP db_statements_total SQL statements run", "# TYPE db_statements_total counter"]
+            lines += [f"db_statements_total{{{_labels(key)}}} {m.sql_count}" for key, m in routes]
+            lines += [
+                "# HELP db_statement_seconds_total Time spent running SQL statements",
+                "# TYPE db_statement_seconds_total counter",
+            ]
+            lines += [f"db_statement_seconds_total{{{_labels(key)}}} {m.sql_seconds}" for key, m in routes]
+            lines += [
+                "# HELP http_request_phase_seconds_total Time spent in named phases such as bcrypt",
+                "# TYPE http_request_phase_seconds_total counter",
+            ]
+            lines += [
+                f'http_request_phase_seconds_total{{{_labels(key)},phase="{phase}"}} {seconds}'
+                for key, m in routes
+                for phase, seconds in sorted(m.phases.items())
+            ]
+        return "\n".join(lines) + "\n"
+
+def _labels(key: Tuple[str, str]) -> str:
+    method, route = key
+    return f'method="{method}",route="{route}"'
+
+def _histogram(lines, name, help_text, routes, attr):
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for key, metrics in routes:
+        histogram = getattr(metrics, attr)
+        labels = _labels(key)
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        cumulative += histogram.counts[-1]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+
+registry = MetricsRegistry()
+
+class MetricsMiddleware:
+    """
+    Plain ASGI middleware; BaseHTTPMiddleware would cost more than the measurement itself.
+    """
+    def __init__(self, app, registry: MetricsRegistry = registry, server_timing: bool = SERVER_TIMING):
+        self.app = app
+        self.registry = registry
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = perf_counter()
+        size = 0
+
+        async def send_with_metrics(message):
+            nonlocal size
+            if message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif self.server_timing and message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing(perf_counter() - start)))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _current.reset(token)
+            # The router stores the matched route in the scope it was given
+            route = scope.get("route")
+            self.registry.observe(
+                scope["method"], getattr(route, "path", UNMATCHED), perf_counter() - start, size, stats
+            )
+
+def instrument(app: FastAPI, registry: MetricsRegistry = registry, server_timing: bool = SERVER_TIMING):
+    """
+    Add the metrics middleware and a `GET /metrics` endpoint to `app`.
+    """
+    app.add_middleware(MetricsMiddleware, registry=registry, server_timing=server_timing)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def read_metrics():
+        return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+```
+
+`tasks.py`, `notifications.py`, `register.py`, `generated_endpoint.py` and `startup_event.py` each call `instrument(app)`. The registry is per process, so with several workers Prometheus scrapes each worker and sums the series.
+
+The bcrypt calls in `register.py` run inside `timed("bcrypt")`, which shows up as the `bcrypt` phase. The recorded time includes any wait for a free hash worker, which is the latency the client actually sees. Set `SERVER_TIMING=1` to also send a `Server-Timing` header, for example `db;dur=1.84;desc="3 queries", bcrypt;dur=212.40, app;dur=215.02`. Browser dev tools show it in the request's timing tab. The header is sent with the response status, so `app` covers the time up to the first byte.
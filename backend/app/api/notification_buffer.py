@@ -0,0 +1,109 @@
+A task event fans out to many users. With one INSERT, COMMIT and refresh per notification, that becomes a burst of tiny transactions. `WriteBehindBuffer` is the opt-in alternative. Callers submit rows to an in-memory buffer, and one background worker writes them as a multi-row `INSERT ... RETURNING`. It flushes once `max_rows` rows are waiting or `max_delay` seconds after the first row of the batch arrived. Each caller awaits a future that resolves to its own inserted row, so a response is still only sent after the row has been committed.
+
+The buffer holds at most `max_pending` unwritten rows. Beyond that, `submit` raises `BufferFull` instead of queuing without bound, and `stop` flushes everything already accepted before returning.
+
+```python
+import asyncio
+import os
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+from sqlalchemy import insert
+
+FLUSH_ROWS = int(os.environ.get("NOTIFICATIONS_FLUSH_ROWS", 500))
+FLUSH_MS = int(os.environ.get("NOTIFICATIONS_FLUSH_MS", 10))
+MAX_PENDING = int(os.environ.get("NOTIFICATIONS_MAX_PENDING", 10_000))
+
+class BufferFull(Exception):
+    """
+    Raised by submit when max_pending rows are already waiting to be written
+    """
+
+class WriteBehindBuffer:
+    def __init__(
+        self, model, session_factory,
+        max_rows: int = FLUSH_ROWS, max_delay: float = FLUSH_MS / 1000, max_pending: int = MAX_PENDING,
+    ):
+        self.model = model
+        self.session_factory = session_factory
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.flushes = 0
+        self.rows_written = 0
+        self._pending: Deque[Tuple[Dict, asyncio.Future]] = deque()
+        self._worker = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._stopping
+
+    async def start(self):
+        self._stopping = False
+        self._has_rows = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Flush every submitted row, then stop the worker.
+        """
+        if self._worker is None:
+            return
+        self._stopping = True
+        self._has_rows.set()
+        self._batch_full.set()
+        await self._worker
+        self._worker = None
+
+    async def submit(self, values: Dict):
+        if not self.running:
+            raise RuntimeError("Write-behind buffer is not running")
+        if len(self._pending) >= self.max_pending:
+            raise BufferFull()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((values, future))
+        self._has_rows.set()
+        if len(self._pending) >= self.max_rows:
+            self._batch_full.set()
+        return await future
+
+    async def _run(self):
+        while True:
+            if not self._pending:
+                if self._stopping:
+                    return
+                self._has_rows.clear()
+                await self._has_rows.wait()
+                continue
+            if len(self._pending) < self.max_rows and not self._stopping:
+                # Give the batch up to max_delay to fill up
+                self._batch_full.clear()
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+            batch = [self._pending.popleft() for _ in range(min(self.max_rows, len(self._pending)))]
+            await self._flush(batch)
+
+    async def _flush(self, batch):
+        # sort_by_parameter_order pairs each RETURNING row with the caller that submitted it
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        try:
+            async with self.session_factory() as session:
+                rows = (await session.scalars(stmt, [values for values, _ in batch])).all()
+                await session.commit()
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self.flushes += 1
+        self.rows_written += len(rows)
+        for (_, future), row in zip(batch, rows):
+            if not future.done():  # the caller may have gone away; the row is written regardless
+                future.set_result(row)
+```
+
+A write failure (for example, a lost connection) fails every caller in that batch, and the rows are not retried. Each row's outcome is still reported to its own caller, just as on the per-row path. The session factory must use `expire_on_commit=False` (like `AsyncSessionLocal`), so the returned rows can be serialized after the commit.
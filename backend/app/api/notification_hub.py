@@ -0,0 +1,146 @@
+Instead of polling `GET /notifications/{user_id}`, clients can keep a Server-Sent Events stream open. `create_notification` publishes each new notification to a hub, and the hub fans it out to every open stream of that user.
+
+The hub itself is per-process. Moving events between processes is the broker's job: `InProcessBroker` delivers straight back to the local hub (single worker), and `RedisBroker` relays through a Redis pub/sub channel, so every worker's hub receives every event.
+
+```python
+import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+SUBSCRIBER_QUEUE_SIZE = int(os.environ.get("NOTIFICATIONS_QUEUE_SIZE", 100))
+# Events per pub/sub message when publishing a batch through Redis
+PUBLISH_BATCH_SIZE = 1000
+BROKER_URL = os.environ.get("NOTIFICATIONS_BROKER_URL")
+
+@dataclass
+class Event:
+    user_id: int
+    id: int
+    data: str
+
+@dataclass
+class Lagged:
+    """
+    Queued in place of the events dropped for a slow subscriber. The stream
+    re-reads everything after `after_id` from the database.
+    """
+    after_id: int
+
+class Broker(ABC):
+    """
+    Moves published events to the hub of every worker.
+    """
+    async def start(self, deliver: Callable[[Event], None]):
+        self.deliver = deliver
+
+    async def stop(self):
+        pass
+
+    @abstractmethod
+    async def publish(self, event: Event):
+        ...
+
+    async def publish_many(self, events: List[Event]):
+        for event in events:
+            await self.publish(event)
+
+class InProcessBroker(Broker):
+    async def publish(self, event):
+        self.deliver(event)
+
+class RedisBroker(Broker):
+    def __init__(self, url: str, channel: str = "notifications"):
+        self.url = url
+        self.channel = channel
+        self.client = None
+        self.pubsub = None
+        self._listener = None
+
+    async def start(self, deliver):
+        import redis.asyncio as redis  # only required for multi-worker deployments
+
+        await super().start(deliver)
+        self.client = redis.from_url(self.url)
+        self.pubsub = self.client.pubsub()
+        await self.pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        async for message in self.pubsub.listen():
+            if message["type"] == "message":
+                data = json.loads(message["data"])
+                for event in data if isinstance(data, list) else [data]:
+                    self.deliver(Event(**event))
+
+    async def stop(self):
+        # Safe to call when start() never ran or failed part way
+        if self._listener is not None:
+            self._listener.cancel()
+        if self.pubsub is not None:
+            await self.pubsub.close()
+        if self.client is not None:
+            await self.client.close()
+
+    async def publish(self, event):
+        await self.client.publish(self.channel, json.dumps(asdict(event)))
+
+    async def publish_many(self, events):
+        for i in range(0, len(events), PUBLISH_BATCH_SIZE):
+            batch = [asdict(event) for event in events[i:i + PUBLISH_BATCH_SIZE]]
+            await self.client.publish(self.channel, json.dumps(batch))
+
+class NotificationHub:
+    def __init__(self, broker: Optional[Broker] = None, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.broker = broker or (RedisBroker(BROKER_URL) if BROKER_URL else InProcessBroker())
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        # Bound up front so that publishing works even if start() never ran
+        self.broker.deliver = self.deliver
+
+    async def start(self):
+        await self.broker.start(self.deliver)
+
+    async def stop(self):
+        await self.broker.stop()
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue):
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def connection_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def publish(self, user_id: int, event_id: int, data: str):
+        await self.broker.publish(Event(user_id=user_id, id=event_id, data=data))
+
+    async def publish_many(self, events: List[Event]):
+        await self.broker.publish_many(events)
+
+    def deliver(self, event: Event):
+        for queue in list(self._subscribers.get(event.user_id, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Never block the publisher on a slow client: drop its backlog and
+                # let the stream catch up from the database instead.
+                pending = [queue.get_nowait() for _ in range(queue.qsize())] + [event]
+                after_id = min(e.after_id if isinstance(e, Lagged) else e.id - 1 for e in pending)
+                queue.put_nowait(Lagged(after_id=after_id))
+
+hub = NotificationHub()
+```
+
+Each open stream holds only an `asyncio.Queue`. A stream does not hold a database session while it is idle, so thousands of idle connections do not hold connections from the pool. Setting `NOTIFICATIONS_BROKER_URL` switches to the Redis broker for deployments with several workers.
@@ -0,0 +1,111 @@
+Notifications are never deleted, so the table and each user's listing keep growing. `RetentionWorker` removes read notifications older than a configurable age. By default it moves them into a compact `notifications_archive` table; it can also drop them outright. It runs periodically in the background, or once on demand through `run_once`.
+
+It works in small batches of `batch_size` rows, each its own short transaction, with a pause between batches. A batch never holds locks for long, so `create_notification` and the read endpoints keep running while a large backlog is processed.
+
+```python
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, insert, select, true
+
+RETENTION_DAYS = os.environ.get("NOTIFICATIONS_RETENTION_DAYS")  # unset: retention disabled
+RETENTION_MODE = os.environ.get("NOTIFICATIONS_RETENTION_MODE", "archive")  # or "delete"
+RETENTION_INTERVAL = float(os.environ.get("NOTIFICATIONS_RETENTION_INTERVAL", 3600))
+RETENTION_BATCH_SIZE = int(os.environ.get("NOTIFICATIONS_RETENTION_BATCH_SIZE", 500))
+
+ARCHIVED_FIELDS = ["id", "task_id", "user_id", "message", "created_at"]
+
+@dataclass
+class RetentionReport:
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    finished_at: Optional[datetime] = None
+
+class RetentionWorker:
+    def __init__(
+        self, model, archive_model, session_factory, max_age: timedelta,
+        archive: bool = True, batch_size: int = RETENTION_BATCH_SIZE,
+        pause: float = 0.01, interval: float = RETENTION_INTERVAL,
+    ):
+        self.model = model
+        self.archive_model = archive_model
+        self.session_factory = session_factory
+        self.max_age = max_age
+        self.archive = archive
+        self.batch_size = batch_size
+        self.pause = pause
+        self.interval = interval
+        self.last_report: Optional[RetentionReport] = None
+        self.last_error: Optional[str] = None
+        self._worker = None
+
+    async def run_once(self) -> RetentionReport:
+        report = RetentionReport()
+        start = time.perf_counter()
+        cutoff = datetime.utcnow() - self.max_age
+        while True:
+            moved = await self._process_batch(cutoff)
+            if not moved:
+                break
+            report.rows += moved
+            report.batches += 1
+            if moved < self.batch_size:
+                break
+            await asyncio.sleep(self.pause)  # let other writers in between batches
+        report.seconds = time.perf_counter() - start
+        report.finished_at = datetime.utcnow()
+        self.last_report = report
+        return report
+
+    async def _process_batch(self, cutoff: datetime) -> int:
+        model = self.model
+        expired = (
+            select(model.id)
+            .where(model.read == true(), model.created_at < cutoff)
+            .order_by(model.created_at)
+            .limit(self.batch_size)
+        )
+        # DELETE ... RETURNING claims the rows: a concurrent worker deleting the
+        # same batch gets nothing back, so no row is archived twice
+        stmt = (
+            delete(model)
+            .where(model.id.in_(expired.scalar_subquery()))
+            .returning(*(getattr(model, name) for name in ARCHIVED_FIELDS))
+            .execution_options(synchronize_session=False)
+        )
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+            if rows and self.archive:
+                await session.execute(insert(self.archive_model), [row._asdict() for row in rows])
+            await session.commit()
+        return len(rows)
+
+    async def start(self):
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+                self.last_error = None
+            except Exception as exc:  # keep the worker alive; the next run retries
+                self.last_error = str(exc)
+            await asyncio.sleep(self.interval)
+```
+
+Set `NOTIFICATIONS_RETENTION_DAYS` to enable the worker. `NOTIFICATIONS_RETENTION_MODE=delete` drops expired notifications instead of archiving them. Unread notifications are never touched, however old they are. The `(read, created_at)` index on `notifications` lets each batch find its rows without scanning the table.
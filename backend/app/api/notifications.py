@@ -3,16 +3,33 @@ To implement the notifications feature, we'll create an endpoint to create a not
 Here's the complete code:
 
 ```python
-from typing import List
-from fastapi import FastAPI, HTTPException, Depends, status
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from sqlalchemy import Boolean, Column, Integer, String, DateTime
+import asyncio
+import json
+import os
+from collections import deque
+from dataclasses import asdict
+from typing import List, Literal, Optional
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, conlist, root_validator
+from sqlalchemy import (
+    ARRAY, Boolean, Column, Index, Integer, String, DateTime, bindparam, column, false, func, insert,
+    literal, literal_column, select, table, union, update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from datetime import datetime, timedelta
 import uvicorn
 
+from . import fastjson
+from .conditional import is_not_modified, make_etag, not_modified_response, validator_headers
+from .database import AsyncSessionLocal as SessionLocal, async_engine as engine, get_async_session as get_session
+from .metrics import instrument
+from .profiler import add_profiler
+from .notification_buffer import BufferFull, WriteBehindBuffer
+from .notification_hub import Event, Lagged, hub
+from .notification_retention import RETENTION_DAYS, RETENTION_MODE, RetentionWorker
+
 Base = declarative_base()
 
 class NotificationDB(Base):
@@ -24,6 +41,31 @@ class NotificationDB(Base):
     message = Column(String)
     read = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    revision = Column(Integer, nullable=False, default=1, onupdate=literal_column("revision") + 1)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Serves unread-only listings and unread counts without touching read history
+        Index("ix_notifications_user_id_read_id", "user_id", "read", "id"),
+        # Lets the retention worker find expired read notifications without a table scan
+        Index("ix_notifications_read_created_at", "read", "created_at"),
+    )
+
+class NotificationArchiveDB(Base):
+    """
+    Cold storage for expired read notifications; only the columns worth keeping.
+    """
+    __tablename__ = "notifications_archive"
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer)
+    user_id = Column(Integer)
+    message = Column(String)
+    created_at = Column(DateTime)
+
+    __table_args__ = (Index("ix_notifications_archive_user_id_id", "user_id", "id"),)
 
 class NotificationBase(BaseModel):
     task_id: int
@@ -41,40 +83,393 @@ class Notification(NotificationBase):
     class Config:
         orm_mode = True
 
+class UnreadCount(BaseModel):
+    user_id: int
+    unread: int
+
+class MarkRead(BaseModel):
+    ids: Optional[conlist(int, min_items=1, max_items=1000)] = None
+    up_to_id: Optional[int] = None
+
+    @root_validator
+    def check_one_selector(cls, values):
+        if (values.get("ids") is None) == (values.get("up_to_id") is None):
+            raise ValueError("Provide exactly one of ids or up_to_id")
+        return values
+
+class MarkReadResult(BaseModel):
+    user_id: int
+    updated: int
+
+class Broadcast(BaseModel):
+    task_id: int
+    message: str
+    user_ids: Optional[conlist(int, min_items=1, max_items=50_000)] = None
+    audience: Optional[Literal["task_owner_and_commenters"]] = None
+
+    @root_validator
+    def check_one_audience(cls, values):
+        if (values.get("user_ids") is None) == (values.get("audience") is None):
+            raise ValueError("Provide exactly one of user_ids or audience")
+        return values
+
+class BroadcastResult(BaseModel):
+    task_id: int
+    recipients: int
+
+class RetentionRun(BaseModel):
+    rows: int
+    batches: int
+    seconds: float
+    finished_at: Optional[datetime] = None
+
+class RetentionStatus(BaseModel):
+    enabled: bool
+    mode: str
+    last_run: Optional[RetentionRun] = None
+    last_error: Optional[str] = None
+
 app = FastAPI()
+instrument(app)
+add_profiler(app)
+
+# Opt-in buffered ingest for create_notification (see notification_buffer.py)
+WRITE_BEHIND = os.environ.get("NOTIFICATIONS_WRITE_BEHIND") == "1"
+notification_buffer = WriteBehindBuffer(NotificationDB, SessionLocal)
+
+retention_worker = RetentionWorker(
+    NotificationDB, NotificationArchiveDB, SessionLocal,
+    max_age=timedelta(days=float(RETENTION_DAYS or 30)),
+    archive=RETENTION_MODE != "delete",
+)
+
+NOTIFICATIONS_BUSY = HTTPException(
+    status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"}
+)
+
+@app.on_event("startup")
+async def startup_event():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await hub.start()
+    if WRITE_BEHIND:
+        await notification_buffer.start()
+    if RETENTION_DAYS:
+        await retention_worker.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await retention_worker.stop()
+    # Flush buffered notifications while the engine is still open
+    await notification_buffer.stop()
+    await hub.stop()
+    await engine.dispose()
 
 @app.post("/notifications/", response_model=Notification)
-async def create_notification(notification: NotificationCreate):
+async def create_notification(notification: NotificationCreate, session: AsyncSession = Depends(get_session)):
     """
     Create a new notification.
     """
-    db_notification = NotificationDB(**notification.dict())
-    session.add(db_notification)
-    session.commit()
-    session.refresh(db_notification)
+    if notification_buffer.running:
+        try:
+            db_notification = await notification_buffer.submit(notification.dict())
+        except BufferFull:
+            raise NOTIFICATIONS_BUSY
+    else:
+        db_notification = NotificationDB(**notification.dict())
+        session.add(db_notification)
+        await session.commit()
+        await session.refresh(db_notification)
+    payload = Notification.from_orm(db_notification)
+    await hub.publish(payload.user_id, payload.id, payload.json())
     return db_notification
 
+# Registered before /notifications/{user_id} so that "retention" is not matched as a user id
+@app.get("/notifications/retention", response_model=RetentionStatus)
+async def read_retention_status():
+    """
+    Rows processed and time spent by the latest retention run.
+    """
+    report = retention_worker.last_report
+    return RetentionStatus(
+        enabled=bool(RETENTION_DAYS),
+        mode=RETENTION_MODE,
+        last_run=asdict(report) if report else None,
+        last_error=retention_worker.last_error,
+    )
+
+# Same fields as the Notification response model
+NOTIFICATION_FIELDS = ["task_id", "user_id", "message", "id", "read", "created_at"]
+
+def notifications_query(user_id: int, unread_only: bool, since_id: Optional[int], limit: Optional[int]):
+    query = select(NotificationDB).where(NotificationDB.user_id == user_id)
+    if unread_only:
+        query = query.where(NotificationDB.read == false())
+    if since_id is not None:
+        query = query.where(NotificationDB.id > since_id)
+    return query.order_by(NotificationDB.id).limit(limit)
+
 @app.get("/notifications/{user_id}", response_model=List[Notification])
-async def read_notifications(user_id: int):
+async def read_notifications(
+    user_id: int,
+    request: Request,
+    response: Response,
+    unread_only: bool = False,
+    since_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    session: AsyncSession = Depends(get_session),
+):
     """
-    Get all notifications for a specific user.
+    Get notifications for a specific user, oldest first.
+
+    `unread_only` skips read notifications. `since_id` returns only ids after
+    it, and together with `limit` it doubles as a cursor: pass the last id
+    received to get the next page.
+
+    A matching `If-None-Match` returns 304 after one aggregate query over the
+    requested page, without loading any notification rows.
     """
-    notifications = session.query(NotificationDB).filter(NotificationDB.user_id == user_id).all()
+    query = notifications_query(user_id, unread_only, since_id, limit)
+    page = query.subquery()
+    version = (
+        await session.execute(
+            select(
+                func.count(page.c.id),
+                func.max(page.c.id),
+                func.sum(page.c.revision),
+                func.max(page.c.updated_at),
+            )
+        )
+    ).one()
+    count, max_id, revisions, updated_at = version
+    etag = make_etag("notifications", user_id, unread_only, since_id, limit, count, max_id, revisions)
+    if is_not_modified(request, etag, updated_at):
+        return not_modified_response(etag, updated_at)
+    headers = validator_headers(etag, updated_at)
+    response.headers.update(headers)
+    if fastjson.FAST_JSON:
+        columns = [getattr(NotificationDB, name) for name in NOTIFICATION_FIELDS]
+        result = await session.execute(query.with_only_columns(*columns))
+        # A returned Response does not inherit headers set on `response`
+        return fastjson.RowsResponse(result.all(), NOTIFICATION_FIELDS, headers=headers)
+    result = await session.execute(query)
+    notifications = result.scalars().all()
     if notifications is None:
         raise HTTPException(status_code=404, detail="Notifications not found")
     return notifications
 
+@app.get("/notifications/{user_id}/unread_count", response_model=UnreadCount)
+async def read_unread_count(user_id: int, session: AsyncSession = Depends(get_session)):
+    """
+    Number of unread notifications for a user, for badges.
+
+    Counted from the (user_id, read, id) index, so the cost depends on the
+    number of unread notifications, not on the size of the user's history.
+    """
+    unread = await session.scalar(
+        select(func.count(NotificationDB.id)).where(
+            NotificationDB.user_id == user_id, NotificationDB.read == false()
+        )
+    )
+    return UnreadCount(user_id=user_id, unread=unread)
+
 @app.put("/notifications/{notification_id}", response_model=Notification)
-async def mark_notification_as_read(notification_id: int):
+async def mark_notification_as_read(notification_id: int, session: AsyncSession = Depends(get_session)):
     """
     Mark a specific notification as read.
     """
-    notification = session.query(NotificationDB).get(notification_id)
+    notification = await session.get(NotificationDB, notification_id)
     if notification is None:
         raise HTTPException(status_code=404, detail="Notification not found")
     notification.read = True
-    session.commit()
+    await session.commit()
     return notification
+
+async def mark_read(session: AsyncSession, user_id: int, *criteria) -> int:
+    # One set-based UPDATE; the revision bump is spelled out like in the bulk task update
+    result = await session.execute(
+        update(NotificationDB)
+        .where(NotificationDB.user_id == user_id, NotificationDB.read == false(), *criteria)
+        .values(read=True, revision=NotificationDB.revision + 1)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+@app.put("/notifications/{user_id}/read-all", response_model=MarkReadResult)
+async def mark_all_notifications_as_read(user_id: int, session: AsyncSession = Depends(get_session)):
+    """
+    Mark every unread notification of a user as read.
+    """
+    updated = await mark_read(session, user_id)
+    return MarkReadResult(user_id=user_id, updated=updated)
+
+@app.put("/notifications/{user_id}/read", response_model=MarkReadResult)
+async def mark_notifications_as_read(
+    user_id: int, selection: MarkRead, session: AsyncSession = Depends(get_session)
+):
+    """
+    Mark a batch of a user's notifications as read, given either a list of
+    `ids` or an `up_to_id` watermark (every notification with id <= up_to_id).
+    """
+    if selection.ids is not None:
+        criterion = NotificationDB.id.in_(selection.ids)
+    else:
+        criterion = NotificationDB.id <= selection.up_to_id
+    updated = await mark_read(session, user_id, criterion)
+    return MarkReadResult(user_id=user_id, updated=updated)
+
+# Only the columns needed to resolve a task's audience; these tables belong to the tasks app
+tasks_table = table("tasks", column("id"), column("owner_id"))
+comments_table = table("comments", column("task_id"), column("author_id"))
+
+def broadcast_recipients(session: AsyncSession, broadcast: Broadcast):
+    """
+    A SELECT of distinct `user_id`s to notify, evaluated inside the INSERT.
+    """
+    if broadcast.user_ids is not None:
+        # One bound parameter however long the list is, unpacked by the database
+        ids = list(dict.fromkeys(broadcast.user_ids))
+        if session.bind.dialect.name == "postgresql":
+            values = func.unnest(bindparam("user_ids", ids, type_=ARRAY(Integer))).table_valued("value")
+        else:
+            values = func.json_each(json.dumps(ids)).table_valued("value")
+        return select(values.c.value.label("user_id"))
+    owner = select(tasks_table.c.owner_id.label("user_id")).where(
+        tasks_table.c.id == broadcast.task_id, tasks_table.c.owner_id.isnot(None)
+    )
+    commenters = select(comments_table.c.author_id).where(
+        comments_table.c.task_id == broadcast.task_id, comments_table.c.author_id.isnot(None)
+    )
+    return union(owner, commenters)  # UNION also removes duplicates
+
+@app.post("/notifications/broadcast", response_model=BroadcastResult)
+async def broadcast_notification(broadcast: Broadcast, session: AsyncSession = Depends(get_session)):
+    """
+    Create the same notification for many users with a single INSERT ... SELECT.
+    """
+    now = datetime.utcnow()
+    recipients = broadcast_recipients(session, broadcast).subquery()
+    stmt = (
+        insert(NotificationDB)
+        .from_select(
+            ["task_id", "user_id", "message", "read", "created_at", "revision", "updated_at"],
+            select(
+                literal(broadcast.task_id, Integer),
+                recipients.c.user_id,
+                literal(broadcast.message, String),
+                false(),
+                literal(now, DateTime),
+                literal(1, Integer),
+                literal(now, DateTime),
+            ),
+        )
+        .returning(NotificationDB.id, NotificationDB.user_id)
+    )
+    rows = (await session.execute(stmt)).all()
+    await session.commit()
+
+    # Serialize the shared fields once; only id and user_id differ per recipient
+    template = json.loads(
+        Notification(
+            task_id=broadcast.task_id, user_id=0, message=broadcast.message, id=0, read=False, created_at=now
+        ).json()
+    )
+    await hub.publish_many(
+        [
+            Event(user_id=row.user_id, id=row.id, data=json.dumps(dict(template, user_id=row.user_id, id=row.id)))
+            for row in rows
+        ]
+    )
+    return BroadcastResult(task_id=broadcast.task_id, recipients=len(rows))
+
+KEEPALIVE_SECONDS = 15
+# Rows per query when a stream catches up from the database
+RESUME_PAGE_SIZE = 500
+# Ids remembered per stream, to skip live events a replay already sent
+SEEN_IDS = 10_000
+
+def format_sse(event_id: int, data: str) -> str:
+    return f"id: {event_id}\nevent: notification\ndata: {data}\n\n"
+
+async def notifications_after(user_id: int, after_id: int, limit: int = RESUME_PAGE_SIZE) -> List[Notification]:
+    # Short-lived session: an open stream must not pin a pooled connection
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(NotificationDB)
+            .where(NotificationDB.user_id == user_id, NotificationDB.id > after_id)
+            .order_by(NotificationDB.id)
+            .limit(limit)
+        )
+        return [Notification.from_orm(n) for n in result.scalars()]
+
+async def backlog_after(user_id: int, after_id: int):
+    """
+    Every notification of a user after `after_id`, read one bounded page at a time
+    """
+    while True:
+        page = await notifications_after(user_id, after_id, RESUME_PAGE_SIZE)
+        for notification in page:
+            yield notification
+        if len(page) < RESUME_PAGE_SIZE:
+            return
+        after_id = page[-1].id
+
+@app.get("/notifications/{user_id}/stream")
+async def stream_notifications(user_id: int, last_event_id: Optional[int] = Header(None)):
+    """
+    Server-Sent Events stream of new notifications for a user.
+
+    Reconnecting clients send `Last-Event-ID` and first receive every
+    notification created after that id.
+    """
+    async def events():
+        # Live events are not in id order (per-row commits, batched flushes, several
+        # workers), so duplicates are found by id rather than against a high-water mark
+        seen = set()
+        order = deque()
+
+        def mark(event_id):
+            seen.add(event_id)
+            order.append(event_id)
+            if len(order) > SEEN_IDS:
+                seen.discard(order.popleft())
+
+        # Subscribe before reading the backlog so nothing published in between is missed.
+        # Inside the generator, so a response that is never iterated leaves no subscriber behind.
+        queue = hub.subscribe(user_id)
+        try:
+            if last_event_id is not None:
+                async for notification in backlog_after(user_id, last_event_id):
+                    mark(notification.id)
+                    yield format_sse(notification.id, notification.json())
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if isinstance(event, Lagged):
+                    after_id = event.after_id
+                    if last_event_id is not None:
+                        after_id = max(after_id, last_event_id)
+                    async for notification in backlog_after(user_id, after_id):
+                        if notification.id not in seen:
+                            mark(notification.id)
+                            yield format_sse(notification.id, notification.json())
+                    continue
+                if event.id in seen:
+                    continue
+                mark(event.id)
+                yield format_sse(event.id, event.data)
+        finally:
+            hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 ```
 
 For testing, you can use Pytest:
@@ -102,4 +497,4 @@ def test_mark_notification_as_read():
     assert data["read"] is True
 ```
 
-This is a basic implementation and may require additional enhancements like adding authentication and implementing a database connection.
\ No newline at end of file
+`GET /notifications/{user_id}/stream` pushes new notifications as Server-Sent Events as soon as `create_notification` publishes them to the hub (see `notification_hub.py`), so clients no longer need to poll. Each request gets its own `AsyncSession` from the `get_session` dependency, so queries no longer block the event loop or share state between requests. With `NOTIFICATIONS_RETENTION_DAYS` set, a background `RetentionWorker` (see `notification_retention.py`) archives read notifications older than that many days, in small batches. Listings therefore stay short for long-lived users. `GET /notifications/retention` reports the rows and time of the latest run. `POST /notifications/broadcast` notifies many users in one request. The recipients are either an explicit `user_ids` list or the `task_owner_and_commenters` audience of the task. They are resolved and inserted by one `INSERT ... SELECT` in the database, so the task and comment tables must be in the same database as the notifications (the default). With `NOTIFICATIONS_WRITE_BEHIND=1`, `create_notification` hands rows to `notification_buffer` instead of committing each one. Concurrent requests are then written together in multi-row inserts, and a full buffer answers 503 with `Retry-After`. The engine and `get_session` come from the shared `database.py`, and its pool is tuned with the same `DB_POOL_*` environment variables as the synchronous routers. This is a basic implementation and may require additional enhancements like adding authentication.
\ No newline at end of file
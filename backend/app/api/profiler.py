@@ -0,0 +1,216 @@
+When a live worker gets slow, `POST /debug/profile` profiles it in place for a few seconds, with no restart. A background thread samples the Python stack of every thread at a fixed interval. The samples are returned in the collapsed-stack format read by `flamegraph.pl`, speedscope and similar tools, together with the SQL statements that took the most time during the window.
+
+Two modes are supported:
+
+- `wall` counts one sample per thread per tick, whatever the thread is doing. It shows where requests wait: on the pool, on the database, on bcrypt.
+- `cpu` weights each stack by the CPU time, in microseconds, that its thread used since the previous tick. Threads that are waiting do not show up. It relies on per-thread CPU clocks (`time.pthread_getcpuclockid`), so it is only available on Unix.
+
+The endpoint is disabled unless `PROFILER_TOKEN` is set, and then it needs that token in the `X-Profiler-Token` header. Other ops-only endpoints, such as `GET /db/pool`, reuse the same check through the `require_profiler_token` dependency. While no profile is running it costs nothing: the sampler thread and the SQL listeners exist only for the length of the window.
+
+```python
+import asyncio
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Literal, Optional
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+PROFILER_TOKEN = os.environ.get("PROFILER_TOKEN")  # unset: the endpoint answers 404
+PROFILE_MAX_SECONDS = float(os.environ.get("PROFILE_MAX_SECONDS", 60))
+
+MAX_DEPTH = 128  # frames kept per stack, innermost first
+MAX_STATEMENTS = 10_000  # distinct statement texts tracked per profile
+TOP_STATEMENTS = 20
+OTHER_STATEMENTS = "(other statements)"
+
+class SqlStatement(BaseModel):
+    statement: str
+    count: int
+    seconds: float
+
+class ProfileReport(BaseModel):
+    mode: str
+    seconds: float
+    interval: float
+    samples: int
+    collapsed: str
+    top_sql: List[SqlStatement]
+
+class SamplingProfiler:
+    """
+    Samples every thread's stack every `interval` seconds between `start` and `stop`,
+    and times each SQL statement run on any engine in the meantime.
+    """
+    def __init__(self, mode: str = "wall", interval: float = 0.01):
+        if mode not in ("wall", "cpu"):
+            raise ValueError(f"Unknown mode: {mode}")
+        if mode == "cpu" and not hasattr(time, "pthread_getcpuclockid"):
+            raise ValueError("CPU mode is not supported on this platform")
+        self.mode = mode
+        self.interval = interval
+        self.samples = 0
+        self.stacks = Counter()
+        self.statements: Dict[str, List] = {}  # statement -> [count, seconds]
+        self._labels = {}  # code object -> frame label
+        self._cpu_times: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            weight = self._cpu_delta(ident) if self.mode == "cpu" else 1
+            if weight:
+                self.stacks[self._collapse(names.get(ident, str(ident)), frame)] += weight
+        self.samples += 1
+
+    def _cpu_delta(self, ident: int) -> int:
+        try:
+            now = time.clock_gettime(time.pthread_getcpuclockid(ident))
+        except OSError:  # the thread exited after the frames were taken
+            return 0
+        # A thread's first sample only sets its baseline
+        last = self._cpu_times.get(ident, now)
+        self._cpu_times[ident] = now
+        return int((now - last) * 1_000_000)
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        parts = []
+        while frame is not None and len(parts) < MAX_DEPTH:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = (
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                )
+            parts.append(label)
+            frame = frame.f_back
+        parts.append(thread_name)
+        # Root first, separated by semicolons: the collapsed-stack format
+        return ";".join(reversed(parts))
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["profiler_start"] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info.pop("profiler_start", time.perf_counter())
+        with self._lock:
+            entry = self.statements.get(statement)
+            if entry is None:
+                if len(self.statements) >= MAX_STATEMENTS:
+                    statement = OTHER_STATEMENTS
+                entry = self.statements.setdefault(statement, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top_statements(self, limit: int = TOP_STATEMENTS):
+        with self._lock:
+            ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {"statement": statement, "count": count, "seconds": seconds}
+            for statement, (count, seconds) in ranked[:limit]
+        ]
+
+def require_profiler_token(x_profiler_token: Optional[str] = Header(None)):
+    """
+    Dependency for ops-only endpoints: 404 while `PROFILER_TOKEN` is unset, 403 on a wrong token
+    """
+    if not PROFILER_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_profiler_token is None or not secrets.compare_digest(
+        x_profiler_token.encode(), PROFILER_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Invalid profiler token")
+
+# Only one profile runs per process at a time
+_profiling = threading.Lock()
+
+def add_profiler(app: FastAPI):
+    """
+    Add `POST /debug/profile` to `app`.
+    """
+    @app.post(
+        "/debug/profile",
+        response_model=ProfileReport,
+        include_in_schema=False,
+        dependencies=[Depends(require_profiler_token)],
+    )
+    async def profile(
+        seconds: float = Query(10, gt=0, le=PROFILE_MAX_SECONDS),
+        mode: Literal["wall", "cpu"] = "wall",
+        interval_ms: float = Query(10, ge=1, le=1000),
+        format: Literal["json", "collapsed"] = "json",
+    ):
+        """
+        Sample this worker for `seconds` and return its stacks and top SQL statements
+        """
+        try:
+            profiler = SamplingProfiler(mode, interval_ms / 1000)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not _profiling.acquire(blocking=False):
+            raise HTTPException(status_code=409, detail="A profile is already running")
+        try:
+            profiler.start()
+            try:
+                # Sleeping on the event loop keeps it free to serve the traffic being profiled
+                await asyncio.sleep(seconds)
+            finally:
+                # stop() joins the sampler thread, up to one interval: keep that off the event loop
+                await run_in_threadpool(profiler.stop)
+        finally:
+            _profiling.release()
+        if format == "collapsed":
+            return PlainTextResponse(
+                profiler.collapsed(),
+                headers={"Content-Disposition": f'attachment; filename="profile-{mode}.folded"'},
+            )
+        return {
+            "mode": mode,
+            "seconds": seconds,
+            "interval": profiler.interval,
+            "samples": profiler.samples,
+            "collapsed": profiler.collapsed(),
+            "top_sql": profiler.top_statements(),
+        }
+```
+
+`tasks.py` and `notifications.py` call `add_profiler(app)`. For example, a 30 second CPU profile can be saved and turned into a flamegraph with:
+
+    curl -X POST -H "X-Profiler-Token: $PROFILER_TOKEN" \
+        "http://worker:8000/debug/profile?seconds=30&mode=cpu&format=collapsed" > cpu.folded
+    flamegraph.pl cpu.folded > cpu.svg
+
+Each stack starts with the thread name, so the event loop, the threadpool workers and the background workers appear as separate towers. The default 10 ms interval keeps the overhead small; the benchmark in `tests/test_profiler.py` measures it. Only one profile runs per process at a time. A second request gets 409. With several workers, each request profiles whichever worker received it.
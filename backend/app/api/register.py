@@ -13,6 +13,16 @@ class UserRegister(UserBase):
 class UserLogin(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=8, max_length=50)
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+
+class TokenUser(BaseModel):
+    id: int
+    username: str
+    jti: str
+    exp: int
 ```
 
 Next, we'll create the User database model:
@@ -35,16 +45,53 @@ class UserDB(Base):
 Now, let's create the services for user registration and login:
 
 ```python
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
+from .metrics import timed
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt runs on a dedicated process pool so it never holds the request thread's GIL.
+# HASH_QUEUE_LIMIT caps in-flight hashes (running + queued); keep it below the
+# server's threadpool size so waiting logins cannot starve other endpoints.
+HASH_WORKERS = int(os.environ.get("HASH_WORKERS", 2))
+HASH_QUEUE_LIMIT = int(os.environ.get("HASH_QUEUE_LIMIT", 16))
+
+_hash_pool = ProcessPoolExecutor(max_workers=HASH_WORKERS)
+_hash_slots = threading.BoundedSemaphore(HASH_QUEUE_LIMIT)
+
+# Verified against for unknown usernames so they cost the same as a wrong password
+DUMMY_HASH = pwd_context.hash("dummy password for timing")
+
+class HashPoolSaturated(Exception):
+    pass
+
+def _hash_password(password: str):
+    return pwd_context.hash(password)
+
+def _verify_password(password: str, hashed_password: str):
+    return pwd_context.verify(password, hashed_password)
+
+def _run_in_hash_pool(fn, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise HashPoolSaturated()
+    try:
+        with timed("bcrypt"):
+            return _hash_pool.submit(fn, *args).result()
+    finally:
+        _hash_slots.release()
+
+def shutdown_hash_pool():
+    _hash_pool.shutdown(wait=True)
+
 def get_user(db: Session, username: str):
     return db.query(UserDB).filter(UserDB.username == username).first()
 
 def create_user(db: Session, user: UserRegister):
-    hashed_password = pwd_context.hash(user.password)
+    hashed_password = _run_in_hash_pool(_hash_password, user.password)
     db_user = UserDB(email=user.email, username=user.username, hashed_password=hashed_password)
     db.add(db_user)
     db.commit()
@@ -54,12 +101,68 @@ def create_user(db: Session, user: UserRegister):
 def authenticate_user(db: Session, username: str, password: str):
     user = get_user(db, username)
     if not user:
+        _run_in_hash_pool(_verify_password, password, DUMMY_HASH)
         return False
-    if not pwd_context.verify(password, user.hashed_password):
+    if not _run_in_hash_pool(_verify_password, password, user.hashed_password):
         return False
     return user
 ```
 
+Access tokens are signed JWTs carrying the user's id and username, so protected routes can authenticate a request without touching the database. Recently verified tokens are kept in a small LRU, which turns repeat verification into a dictionary lookup, and revoked token ids go on an in-memory denylist until they expire:
+
+```python
+import secrets
+import time
+import uuid
+import jwt
+from .cache import LRUTTLBackend
+
+# Must be set explicitly (and shared) when running more than one worker
+SECRET_KEY = os.environ.get("AUTH_SECRET_KEY") or secrets.token_urlsafe(32)
+ALGORITHM = "HS256"
+ACCESS_TOKEN_TTL = int(os.environ.get("ACCESS_TOKEN_TTL", 15 * 60))
+
+_verified_tokens = LRUTTLBackend(maxsize=4096, ttl=60)
+_denylist = {}  # jti -> exp
+
+class InvalidToken(Exception):
+    pass
+
+def create_access_token(user: UserDB) -> str:
+    now = int(time.time())
+    claims = {
+        "sub": str(user.id),
+        "username": user.username,
+        "jti": uuid.uuid4().hex,
+        "iat": now,
+        "exp": now + ACCESS_TOKEN_TTL,
+    }
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+def verify_access_token(token: str) -> TokenUser:
+    user = _verified_tokens.get(token)
+    if user is None:
+        try:
+            claims = jwt.decode(
+                token, SECRET_KEY, algorithms=[ALGORITHM], options={"require": ["exp", "sub", "jti"]}
+            )
+        except jwt.InvalidTokenError:
+            raise InvalidToken()
+        user = TokenUser(id=int(claims["sub"]), username=claims["username"], jti=claims["jti"], exp=claims["exp"])
+        _verified_tokens.set(token, user)
+    # A cached token can still expire or be revoked after it was verified
+    if user.exp <= time.time() or user.jti in _denylist:
+        raise InvalidToken()
+    return user
+
+def revoke_token(user: TokenUser):
+    now = time.time()
+    for jti, exp in list(_denylist.items()):
+        if exp <= now:
+            del _denylist[jti]
+    _denylist[user.jti] = user.exp
+```
+
 Now, let's define the FastAPI endpoints:
 
 ```python
@@ -68,17 +171,34 @@ from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.security.oauth2 import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from typing import Optional
+from .database import get_db
+from .metrics import instrument
 
 app = FastAPI()
+instrument(app)
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
-def get_db():
-    db = SessionLocal()
+HASH_POOL_BUSY = HTTPException(
+    status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"}
+)
+
+def get_current_active_user(token: str = Depends(oauth2_scheme)) -> TokenUser:
+    """
+    Authenticate a request from its bearer token alone, without a database lookup
+    """
     try:
-        yield db
-    finally:
-        db.close()
+        return verify_access_token(token)
+    except InvalidToken:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+@app.on_event("shutdown")
+def shutdown_event():
+    shutdown_hash_pool()
 
 @app.post("/register", response_model=UserBase)
 def register(user: UserRegister, db: Session = Depends(get_db)):
@@ -88,18 +208,31 @@ def register(user: UserRegister, db: Session = Depends(get_db)):
     db_user = get_user(db, username=user.username)
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
-    user_in_db = create_user(db, user)
+    try:
+        user_in_db = create_user(db, user)
+    except HashPoolSaturated:
+        raise HASH_POOL_BUSY
     return user_in_db
 
-@app.post("/login", response_model=str)
+@app.post("/login", response_model=Token)
 def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """
     Login an existing user
     """
-    user = authenticate_user(db, form_data.username, form_data.password)
+    try:
+        user = authenticate_user(db, form_data.username, form_data.password)
+    except HashPoolSaturated:
+        raise HASH_POOL_BUSY
     if not user:
         raise HTTPException(status_code=400, detail="Invalid username or password")
-    return {"access_token": user.id, "token_type": "bearer"}
+    return {"access_token": create_access_token(user), "token_type": "bearer"}
+
+@app.post("/logout", status_code=204)
+def logout(current_user: TokenUser = Depends(get_current_active_user)):
+    """
+    Revoke the current access token
+    """
+    revoke_token(current_user)
 ```
 
 Finally, let's add some tests:
@@ -127,4 +260,4 @@ def test_login_wrong_password():
     response = client.post("/login", data={"username": "testuser", "password": "wrongpassword"})
     assert response.status_code == 400
 ```
-This code covers the basic user registration and login functionality. It uses best practices such as dependency injection and Pydantic models for data validation. It also uses Passlib for password hashing.
\ No newline at end of file
+This code covers the basic user registration and login functionality. It uses best practices such as dependency injection and Pydantic models for data validation. It also uses Passlib for password hashing. The bcrypt work runs on a size-limited process pool (`HASH_WORKERS`). When more than `HASH_QUEUE_LIMIT` hashes are in flight, requests are rejected with a 503 instead of queueing. Unknown usernames are checked against a dummy hash so they take as long as a wrong password. Logging in returns a signed JWT. `get_current_active_user` verifies it without a database round-trip, and `/logout` revokes it. The denylist lives in process memory, so revocations are per worker.
\ No newline at end of file
@@ -0,0 +1,193 @@
+B-tree indexes on `title`, `description` and `text` cannot answer keyword searches, so task search uses a real inverted index. Locally that is SQLite FTS5. On PostgreSQL it is a `tsvector` column with a GIN index. The backend is chosen from the session's dialect, so callers only use the module-level functions below.
+
+The index is kept up to date in the same transaction as the write. The service layer calls `index_tasks` / `remove_tasks` when tasks are created, updated or deleted, and `index_comment` when a comment is posted.
+
+```python
+from typing import Dict, Iterable, List
+
+from sqlalchemy import event, inspect, select, text
+from sqlalchemy.orm import Session
+
+from . import models
+
+# Task ids per IN (...) list, under SQLite's bound-parameter limit
+ID_CHUNK_SIZE = 500
+
+class SQLiteSearch:
+    """
+    Two FTS5 tables: task_fts keyed by task id, comment_fts keyed by comment id.
+    """
+    # search table -> (DDL, backfill from the indexed table)
+    tables = {
+        "task_fts": (
+            ["CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5(title, description)"],
+            "INSERT INTO task_fts (rowid, title, description) "
+            "SELECT id, coalesce(title, ''), coalesce(description, '') FROM tasks",
+        ),
+        "comment_fts": (
+            ["CREATE VIRTUAL TABLE IF NOT EXISTS comment_fts USING fts5(text, task_id UNINDEXED)"],
+            "INSERT INTO comment_fts (rowid, text, task_id) SELECT id, coalesce(text, ''), task_id FROM comments",
+        ),
+    }
+
+    def index_tasks(self, db: Session, rows: List[Dict]):
+        self.remove_tasks(db, [row["id"] for row in rows], comments=False)
+        db.execute(
+            text("INSERT INTO task_fts (rowid, title, description) VALUES (:id, :title, :description)"),
+            rows,
+        )
+
+    def remove_tasks(self, db: Session, ids: List[int], comments: bool = True):
+        db.execute(text("DELETE FROM task_fts WHERE rowid = :id"), [{"id": id} for id in ids])
+        if not comments:
+            return
+        # comment_fts.task_id is UNINDEXED, so filtering on it scans the whole table.
+        # Find the comment ids through ix_comments_task_id_id and delete by rowid instead.
+        comment_ids = []
+        for i in range(0, len(ids), ID_CHUNK_SIZE):
+            chunk = ids[i:i + ID_CHUNK_SIZE]
+            comment_ids += db.scalars(select(models.Comment.id).where(models.Comment.task_id.in_(chunk))).all()
+        if comment_ids:
+            db.execute(text("DELETE FROM comment_fts WHERE rowid = :id"), [{"id": id} for id in comment_ids])
+
+    def index_comment(self, db: Session, comment_id: int, task_id: int, body: str):
+        db.execute(
+            text("INSERT INTO comment_fts (rowid, text, task_id) VALUES (:id, :text, :task_id)"),
+            {"id": comment_id, "text": body, "task_id": task_id},
+        )
+
+    def search(self, db: Session, q: str, limit: int):
+        # Quote every term so user input is never parsed as FTS5 query syntax
+        match = " ".join('"' + term.replace('"', '""') + '"' for term in q.split())
+        # bm25() is lower for better matches; a task's best title/description/comment hit wins
+        return db.execute(
+            text(
+                """
+                SELECT task_id, MIN(score) AS score FROM (
+                    SELECT rowid AS task_id, bm25(task_fts) AS score FROM task_fts WHERE task_fts MATCH :match
+                    UNION ALL
+                    SELECT task_id, bm25(comment_fts) AS score FROM comment_fts WHERE comment_fts MATCH :match
+                ) GROUP BY task_id ORDER BY score LIMIT :limit
+                """
+            ),
+            {"match": match, "limit": limit},
+        ).all()
+
+class PostgresSearch:
+    """
+    tsvector documents with GIN indexes, one row per task and per comment.
+    """
+    tables = {
+        "task_search": (
+            [
+                "CREATE TABLE IF NOT EXISTS task_search ("
+                "task_id INTEGER PRIMARY KEY REFERENCES tasks (id) ON DELETE CASCADE, document TSVECTOR NOT NULL)",
+                "CREATE INDEX IF NOT EXISTS ix_task_search_document ON task_search USING GIN (document)",
+            ],
+            "INSERT INTO task_search (task_id, document) "
+            "SELECT id, setweight(to_tsvector('english', coalesce(title, '')), 'A') "
+            "|| to_tsvector('english', coalesce(description, '')) FROM tasks",
+        ),
+        "comment_search": (
+            [
+                "CREATE TABLE IF NOT EXISTS comment_search ("
+                "comment_id INTEGER PRIMARY KEY REFERENCES comments (id) ON DELETE CASCADE, "
+                "task_id INTEGER NOT NULL, document TSVECTOR NOT NULL)",
+                "CREATE INDEX IF NOT EXISTS ix_comment_search_document ON comment_search USING GIN (document)",
+                "CREATE INDEX IF NOT EXISTS ix_comment_search_task_id ON comment_search (task_id)",
+            ],
+            "INSERT INTO comment_search (comment_id, task_id, document) "
+            "SELECT id, task_id, to_tsvector('english', coalesce(text, '')) FROM comments WHERE task_id IS NOT NULL",
+        ),
+    }
+
+    def index_tasks(self, db: Session, rows: List[Dict]):
+        db.execute(
+            text(
+                "INSERT INTO task_search (task_id, document) "
+                "VALUES (:id, setweight(to_tsvector('english', :title), 'A') || to_tsvector('english', :description)) "
+                "ON CONFLICT (task_id) DO UPDATE SET document = EXCLUDED.document"
+            ),
+            rows,
+        )
+
+    def remove_tasks(self, db: Session, ids: List[int], comments: bool = True):
+        db.execute(text("DELETE FROM task_search WHERE task_id = ANY(:ids)"), {"ids": ids})
+        if comments:
+            db.execute(text("DELETE FROM comment_search WHERE task_id = ANY(:ids)"), {"ids": ids})
+
+    def index_comment(self, db: Session, comment_id: int, task_id: int, body: str):
+        db.execute(
+            text(
+                "INSERT INTO comment_search (comment_id, task_id, document) "
+                "VALUES (:id, :task_id, to_tsvector('english', :text))"
+            ),
+            {"id": comment_id, "text": body, "task_id": task_id},
+        )
+
+    def search(self, db: Session, q: str, limit: int):
+        return db.execute(
+            text(
+                """
+                SELECT task_id, MAX(score) AS score FROM (
+                    SELECT task_id, ts_rank(document, query) AS score
+                    FROM task_search, websearch_to_tsquery('english', :q) AS query WHERE document @@ query
+                    UNION ALL
+                    SELECT task_id, ts_rank(document, query) AS score
+                    FROM comment_search, websearch_to_tsquery('english', :q) AS query WHERE document @@ query
+                ) AS hits GROUP BY task_id ORDER BY score DESC LIMIT :limit
+                """
+            ),
+            {"q": q, "limit": limit},
+        ).all()
+
+BACKENDS = {"sqlite": SQLiteSearch(), "postgresql": PostgresSearch()}
+
+def create_search_tables(connection):
+    """
+    Create any missing search table and index every existing row into it, once.
+    """
+    backend = BACKENDS.get(connection.dialect.name)
+    if backend is None:
+        return
+    existing = set(inspect(connection).get_table_names())
+    for name, (statements, backfill) in backend.tables.items():
+        if name in existing:
+            continue
+        for statement in statements:
+            connection.execute(text(statement))
+        connection.execute(text(backfill))
+
+# Metadata-level after_create fires on every create_all, including against a database whose
+# tables all exist already, unlike the table-level event that only fires for new tables
+@event.listens_for(models.Base.metadata, "after_create")
+def _create_search_tables(target, connection, **kw):
+    create_search_tables(connection)
+
+def _backend(db: Session):
+    return BACKENDS[db.get_bind().dialect.name]
+
+def index_tasks(db: Session, tasks: Iterable):
+    rows = [{"id": t.id, "title": t.title or "", "description": t.description or ""} for t in tasks]
+    if rows:
+        _backend(db).index_tasks(db, rows)
+
+def remove_tasks(db: Session, ids: List[int], comments: bool = True):
+    if ids:
+        _backend(db).remove_tasks(db, ids, comments=comments)
+
+def index_comment(db: Session, comment: models.Comment):
+    _backend(db).index_comment(db, comment.id, comment.task_id, comment.text or "")
+
+def search_task_ids(db: Session, q: str, limit: int = 20) -> List[int]:
+    """
+    Ids of the tasks matching `q`, best match first.
+    """
+    if not q.split():
+        return []
+    return [row.task_id for row in _backend(db).search(db, q, limit)]
+```
+
+The search tables are created by `create_search_tables`, which runs after every `metadata.create_all()`. It only touches search tables that are missing, and it fills a new one from the rows already in `tasks` / `comments`, so an existing database gets a complete index on its first start with this module.
+
+Title matches are weighted above description matches on PostgreSQL (`setweight ... 'A'`). FTS5's `bm25()` gives similar results for the shorter title column without extra configuration. A task matches when its title, its description or any of its comments match, and it is ranked by its best hit.
@@ -0,0 +1,147 @@
+Dashboards show how many tasks each owner has open and done, overall and per priority. Counting those from `tasks` on every read means scanning all of an owner's tasks. Instead, `task_summary` keeps one counter per `(owner_id, priority, status)`. The service layer adjusts the counters with `apply_deltas` in the same transaction as every create, update and delete, so a summary read only touches a handful of counter rows.
+
+"Overdue" depends on the clock, so it cannot be kept as a counter. It is computed at read time as an index-only range count on `ix_tasks_owner_id_status_due_date`.
+
+`reconcile` rebuilds the counters from `tasks` and reports every counter that had drifted. It locks the counters while it runs, so `POST /task-summary/reconcile` is an ops-only endpoint behind the profiler token. Both the counters and the overdue count treat a NULL status as open (`is_open`).
+
+```python
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Tuple
+
+from sqlalchemy import Boolean, Column, Integer, case, delete, false, func, insert, or_, text, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import Base
+
+class TaskSummary(Base):
+    __tablename__ = "task_summary"
+
+    owner_id = Column(Integer, primary_key=True)
+    priority = Column(Integer, primary_key=True)
+    status = Column(Boolean, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+SummaryKey = Tuple[int, int, bool]
+
+UPSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+def summary_key(task) -> SummaryKey:
+    return (task.owner_id, task.priority, bool(task.status))
+
+def apply_deltas(db: Session, deltas: Dict[SummaryKey, int]):
+    """
+    Add each delta to its counter in the caller's transaction, creating missing counters.
+    """
+    rows = [
+        {"owner_id": owner_id, "priority": priority, "status": status, "count": delta}
+        for (owner_id, priority, status), delta in deltas.items()
+        if delta and owner_id is not None and priority is not None
+    ]
+    if not rows:
+        return
+    stmt = UPSERTS[db.get_bind().dialect.name](TaskSummary)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["owner_id", "priority", "status"],
+        set_={"count": TaskSummary.count + stmt.excluded["count"]},
+    )
+    db.execute(stmt, rows)
+
+def task_key(db: Session, task_id: int):
+    row = (
+        db.query(models.Task.owner_id, models.Task.priority, models.Task.status)
+        .filter(models.Task.id == task_id)
+        .one_or_none()
+    )
+    return summary_key(row) if row is not None else None
+
+def moved(before: SummaryKey, after: SummaryKey) -> Dict[SummaryKey, int]:
+    if before == after:
+        return {}
+    return {before: -1, after: 1}
+
+def is_open():
+    # A NULL status counts as open, like bool(task.status) in summary_key. Spelled as an OR
+    # rather than coalesce() so the overdue count can still range-scan the status index.
+    return or_(models.Task.status == false(), models.Task.status.is_(None))
+
+def get_summary(db: Session, owner_id: int, now: datetime = None):
+    counters = (
+        db.query(TaskSummary.priority, TaskSummary.status, TaskSummary.count)
+        .filter(TaskSummary.owner_id == owner_id)
+        .all()
+    )
+    by_priority = {}
+    for priority, status, count in counters:
+        bucket = by_priority.setdefault(priority, {"priority": priority, "open": 0, "done": 0})
+        bucket["done" if status else "open"] += count
+    overdue = (
+        db.query(func.count())
+        .select_from(models.Task)
+        .filter(
+            models.Task.owner_id == owner_id,
+            is_open(),
+            models.Task.due_date < (now or datetime.utcnow()),
+        )
+        .scalar()
+    )
+    return {
+        "owner_id": owner_id,
+        "open": sum(bucket["open"] for bucket in by_priority.values()),
+        "done": sum(bucket["done"] for bucket in by_priority.values()),
+        "overdue": overdue,
+        "by_priority": [by_priority[priority] for priority in sorted(by_priority)],
+    }
+
+def reconcile(db: Session):
+    """
+    Recount every counter from `tasks`, replace the stored counters, and report the drift.
+    """
+    start = time.perf_counter()
+    if db.get_bind().dialect.name == "postgresql":
+        # Waits for in-flight writers and blocks new ones until the rebuild commits
+        db.execute(text("LOCK TABLE task_summary IN EXCLUSIVE MODE"))
+    # Deleting first also takes SQLite's write lock before the recount
+    stored = Counter(
+        {
+            (owner_id, priority, status): count
+            for owner_id, priority, status, count in db.execute(
+                delete(TaskSummary).returning(
+                    TaskSummary.owner_id, TaskSummary.priority, TaskSummary.status, TaskSummary.count
+                )
+            )
+        }
+    )
+    # NULL and false have to land in the same group
+    open_or_done = case((is_open(), false()), else_=true())
+    actual = Counter(
+        {
+            (owner_id, priority, bool(status)): count
+            for owner_id, priority, status, count in db.query(
+                models.Task.owner_id, models.Task.priority, open_or_done, func.count()
+            )
+            .filter(models.Task.owner_id.isnot(None), models.Task.priority.isnot(None))
+            .group_by(models.Task.owner_id, models.Task.priority, open_or_done)
+        }
+    )
+    if actual:
+        db.execute(
+            insert(TaskSummary),
+            [
+                {"owner_id": owner_id, "priority": priority, "status": status, "count": count}
+                for (owner_id, priority, status), count in actual.items()
+            ],
+        )
+    db.commit()
+    drift = [
+        {"owner_id": key[0], "priority": key[1], "status": key[2], "stored": stored[key], "actual": actual[key]}
+        for key in sorted(set(stored) | set(actual))
+        if stored[key] != actual[key]
+    ]
+    return {"counters": len(actual), "drift": drift, "seconds": time.perf_counter() - start}
+```
+
+Tasks without an owner or priority are not counted. Counters that reach zero are kept, so the next task with that key becomes a plain increment.
@@ -3,7 +3,8 @@ Here's a basic implementation of your requirements using FastAPI, Pydantic, SQLA
 Database Models (using SQLAlchemy):
 
 ```python
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime
+from datetime import datetime
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Index, literal_column
 from sqlalchemy.orm import relationship
 
 from database import Base
@@ -19,15 +20,33 @@ class Task(Base):
     __tablename__ = "tasks"
 
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    description = Column(String, index=True)
-    due_date = Column(DateTime, index=True)
-    priority = Column(Integer, index=True)
+    title = Column(String)
+    description = Column(String)
+    # Keyset pagination orders by (due_date, priority, id), and a NULL key would
+    # drop out of its row-value comparison, so neither may be NULL
+    due_date = Column(DateTime, nullable=False)
+    priority = Column(Integer, nullable=False)
     status = Column(Boolean, default=False)
     owner_id = Column(Integer, ForeignKey("users.id"))
+    revision = Column(Integer, nullable=False, default=1, onupdate=literal_column("revision") + 1)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     owner = relationship("User", back_populates="tasks")
 
+    # Every UPDATE bumps `revision`, which is what the task ETag is built from. It is not a
+    # version_id_col: concurrent writers stay last-writer-wins instead of raising StaleDataError.
+    # eager_defaults reads the new value back, so it is never lazy-loaded after a commit.
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Matches the keyset ordering used by cursor pagination in get_tasks_page
+        Index("ix_tasks_due_date_priority_id", "due_date", "priority", "id"),
+        # One index per supported filter shape of read_tasks (see TaskFilters)
+        Index("ix_tasks_owner_id_status_due_date", "owner_id", "status", "due_date"),
+        Index("ix_tasks_status_priority_id", "status", "priority", "id"),
+        Index("ix_tasks_priority_id", "priority", "id"),
+    )
+
 
 User.tasks = relationship("Task", back_populates="owner", cascade="all, delete-orphan")
 ```
@@ -35,7 +54,8 @@ User.tasks = relationship("Task", back_populates="owner", cascade="all, delete-o
 Pydantic Models:
 
 ```python
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, conlist, validator
 from datetime import datetime
 
 class TaskBase(BaseModel):
@@ -51,16 +71,139 @@ class TaskCreate(TaskBase):
 class Task(TaskBase):
     id: int
     owner_id: int
+    revision: int
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+class TaskPage(BaseModel):
+    items: List[Task]
+    next_cursor: Optional[str] = None
+
+class TaskFilters(BaseModel):
+    owner_id: Optional[int] = None
+    status: Optional[bool] = None
+    priority_min: Optional[int] = None
+    priority_max: Optional[int] = None
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
+
+TaskSort = Literal["id", "due_date", "-due_date", "priority", "-priority"]
+
+class TaskPatch(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    priority: Optional[int] = None
+    status: Optional[bool] = None
+
+    # Fields may be left out, but an explicit null would be written to the column
+    @validator("title", "due_date", "priority", "status")
+    def check_not_null(cls, value):
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class TaskBulkCreate(BaseModel):
+    tasks: conlist(TaskCreate, min_items=1, max_items=5000)
+
+class TaskBulkUpdate(BaseModel):
+    ids: conlist(int, min_items=1, max_items=5000)
+    changes: TaskPatch
+
+class TaskBulkDelete(BaseModel):
+    ids: conlist(int, min_items=1, max_items=5000)
+
+class BulkItemResult(BaseModel):
+    id: int
+    status: str  # "created", "updated", "deleted" or "not_found"
+
+class BulkResult(BaseModel):
+    results: List[BulkItemResult]
+
+class TaskOwner(BaseModel):
+    id: int
+    username: str
+
+    class Config:
+        orm_mode = True
+
+class CommentSummary(BaseModel):
+    id: int
+    text: str
+    author_id: Optional[int] = None
+
+    class Config:
+        orm_mode = True
+
+class TaskLookup(BaseModel):
+    ids: conlist(int, min_items=1, max_items=5000)
+
+class TaskLookupItem(BaseModel):
+    id: int
+    found: bool
+    task: Optional[Task] = None
+
+class TaskLookupResult(BaseModel):
+    results: List[TaskLookupItem]
+
+class TaskChange(BaseModel):
+    seq: int
+    task_id: int
+    op: str  # "create", "update" or "delete"
+    fields: dict
+    changed_at: datetime
 
     class Config:
         orm_mode = True
+
+class TaskChangePage(BaseModel):
+    items: List[TaskChange]
+    next_since: int
+
+class PriorityCounts(BaseModel):
+    priority: int
+    open: int
+    done: int
+
+class TaskSummary(BaseModel):
+    owner_id: int
+    open: int
+    done: int
+    overdue: int
+    by_priority: List[PriorityCounts]
+
+class SummaryDrift(BaseModel):
+    owner_id: int
+    priority: int
+    status: bool
+    stored: int
+    actual: int
+
+class SummaryReconcileReport(BaseModel):
+    counters: int
+    drift: List[SummaryDrift]
+    seconds: float
 ```
 
 Service Layer Code:
 
 ```python
+import base64
+import json
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, func, insert, select, tuple_, update
 from sqlalchemy.orm import Session
-from . import models, schemas
+from . import models, schemas, search
+from .cache import ReadThroughCache, invalidate_task
+from .changelog import change, changes_since, record_changes
+from .task_summary import apply_deltas, get_summary, moved, reconcile, summary_key
+
+task_cache = ReadThroughCache("task", schemas.Task)
 
 def get_user(db: Session, user_id: int):
     return db.query(models.User).filter(models.User.id == user_id).first()
@@ -68,81 +211,579 @@ def get_user(db: Session, user_id: int):
 def create_user_task(db: Session, task: schemas.TaskCreate, user_id: int):
     db_task = models.Task(**task.dict(), owner_id=user_id)
     db.add(db_task)
+    db.flush()
+    search.index_tasks(db, [db_task])
+    record_changes(db, [change(db_task.id, "create", _task_values(db_task))])
+    apply_deltas(db, {summary_key(db_task): 1})
     db.commit()
     db.refresh(db_task)
     return db_task
 
-def get_tasks(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.Task).offset(skip).limit(limit).all()
+# Ids per IN (...) list. Multi-row INSERTs bind one parameter per column and row,
+# so create_user_tasks sizes its chunks from MAX_BOUND_PARAMETERS instead.
+BULK_CHUNK_SIZE = 500
+# SQLite builds before 3.32 accept at most 999 bound parameters per statement
+MAX_BOUND_PARAMETERS = 999
+
+def _chunks(items, size=BULK_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def create_user_tasks(db: Session, tasks: List[schemas.TaskCreate], user_id: int):
+    rows = [dict(task.dict(), owner_id=user_id) for task in tasks]
+    created = []
+    # Column defaults (revision, updated_at) are bound per row too, so count every column
+    rows_per_insert = MAX_BOUND_PARAMETERS // len(models.Task.__table__.columns)
+    for chunk in _chunks(rows, rows_per_insert):
+        # executemany with sort_by_parameter_order: RETURNING rows come back in input order,
+        # which a plain multi-row VALUES does not guarantee
+        stmt = insert(models.Task).returning(*TASK_FIELDS.values(), sort_by_parameter_order=True)
+        created.extend(db.execute(stmt, chunk).all())
+    search.index_tasks(db, created)
+    record_changes(db, [change(row.id, "create", _task_values(row)) for row in created])
+    apply_deltas(db, Counter(summary_key(row) for row in created))
+    db.commit()
+    return [schemas.BulkItemResult(id=row.id, status="created") for row in created]
+
+def _owned_by(owner_id: Optional[int], ids: List[int]):
+    # Bulk writes only touch the caller's tasks; other ids are reported as not_found
+    criteria = [models.Task.id.in_(ids)]
+    if owner_id is not None:
+        criteria.append(models.Task.owner_id == owner_id)
+    return criteria
+
+def update_tasks(db: Session, ids: List[int], changes: schemas.TaskPatch, owner_id: Optional[int] = None):
+    values = changes.dict(exclude_unset=True)
+    if not values:
+        raise ValueError("No fields to update")
+    updated = set()
+    # Summary keys before the update, only needed when the update can move a task between counters
+    before = {}
+    for chunk in _chunks(ids):
+        if "priority" in values or "status" in values:
+            before.update(
+                (row.id, summary_key(row))
+                for row in db.query(models.Task.id, models.Task.owner_id, models.Task.priority, models.Task.status)
+                .filter(*_owned_by(owner_id, chunk))
+                .with_for_update()
+            )
+        stmt = (
+            update(models.Task)
+            .where(*_owned_by(owner_id, chunk))
+            .values(**values, revision=models.Task.revision + 1)
+            .returning(models.Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated.update(db.execute(stmt).scalars())
+    if updated and ("title" in values or "description" in values):
+        search.index_tasks(
+            db,
+            db.query(models.Task.id, models.Task.title, models.Task.description)
+            .filter(models.Task.id.in_(updated))
+            .all(),
+        )
+    record_changes(db, [change(id, "update", values) for id in sorted(updated)])
+    deltas = Counter()
+    for id, (owner_id, priority, status) in before.items():
+        if id in updated:
+            after = (owner_id, values.get("priority", priority), bool(values.get("status", status)))
+            deltas.update(moved((owner_id, priority, status), after))
+    apply_deltas(db, deltas)
+    db.commit()
+    for id in updated:
+        invalidate_task(id)
+    return [
+        schemas.BulkItemResult(id=id, status="updated" if id in updated else "not_found")
+        for id in ids
+    ]
+
+def delete_tasks(db: Session, ids: List[int], owner_id: Optional[int] = None):
+    deleted = set()
+    deltas = Counter()
+    for chunk in _chunks(ids):
+        stmt = (
+            delete(models.Task)
+            .where(*_owned_by(owner_id, chunk))
+            .returning(models.Task.id, models.Task.owner_id, models.Task.priority, models.Task.status)
+            .execution_options(synchronize_session=False)
+        )
+        rows = db.execute(stmt).all()
+        deleted.update(row.id for row in rows)
+        deltas.subtract(summary_key(row) for row in rows)
+    search.remove_tasks(db, list(deleted))
+    record_changes(db, [change(id, "delete") for id in sorted(deleted)])
+    apply_deltas(db, deltas)
+    db.commit()
+    for id in deleted:
+        invalidate_task(id)
+    return [
+        schemas.BulkItemResult(id=id, status="deleted" if id in deleted else "not_found")
+        for id in ids
+    ]
+
+TASK_SORTS = {
+    "id": (models.Task.id,),
+    # Same column order as ix_tasks_due_date_priority_id, so no sort step is needed
+    "due_date": (models.Task.due_date, models.Task.priority, models.Task.id),
+    "-due_date": (models.Task.due_date.desc(), models.Task.priority.desc(), models.Task.id.desc()),
+    "priority": (models.Task.priority, models.Task.id),
+    "-priority": (models.Task.priority.desc(), models.Task.id.desc()),
+}
+
+def filter_tasks(query, filters: schemas.TaskFilters = None):
+    if filters is None:
+        return query
+    if filters.owner_id is not None:
+        query = query.filter(models.Task.owner_id == filters.owner_id)
+    if filters.status is not None:
+        query = query.filter(models.Task.status == filters.status)
+    if filters.priority_min is not None:
+        query = query.filter(models.Task.priority >= filters.priority_min)
+    if filters.priority_max is not None:
+        query = query.filter(models.Task.priority <= filters.priority_max)
+    if filters.due_after is not None:
+        query = query.filter(models.Task.due_date >= filters.due_after)
+    if filters.due_before is not None:
+        query = query.filter(models.Task.due_date < filters.due_before)
+    return query
+
+def tasks_query(db: Session, filters: schemas.TaskFilters = None, sort: str = None, columns=None):
+    query = filter_tasks(db.query(*columns) if columns else db.query(models.Task), filters)
+    if sort is not None:
+        query = query.order_by(*TASK_SORTS[sort])
+    return query
+
+def get_tasks(db: Session, skip: int = 0, limit: int = 100, filters: schemas.TaskFilters = None, sort: str = None):
+    return tasks_query(db, filters, sort).offset(skip).limit(limit).all()
+
+TASK_FIELDS = {
+    name: getattr(models.Task, name)
+    for name in ("id", "title", "description", "due_date", "priority", "status", "owner_id", "revision", "updated_at")
+}
+DATETIME_FIELDS = {"due_date", "updated_at"}
+# Bookkeeping columns that are not reported as changed fields in the change log
+UNLOGGED_FIELDS = {"id", "revision", "updated_at"}
+
+def _task_values(row):
+    return {name: getattr(row, name) for name in TASK_FIELDS if name not in UNLOGGED_FIELDS}
+KEYSET_FIELDS = ["due_date", "priority", "id"]
+
+def parse_fields(fields: str) -> List[str]:
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    if not names:
+        raise ValueError("fields must not be empty")
+    unknown = [name for name in names if name not in TASK_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+TASK_INCLUDES = ("owner", "comments_count", "latest_comment")
+
+def parse_include(include: str) -> List[str]:
+    names = list(dict.fromkeys(name.strip() for name in include.split(",") if name.strip()))
+    unknown = [name for name in names if name not in TASK_INCLUDES]
+    if unknown:
+        raise ValueError(f"Unknown include: {', '.join(unknown)}")
+    return names
+
+def with_includes(db: Session, tasks, includes: List[str]) -> List[dict]:
+    """
+    Serialize `tasks` with the requested related data. Each include costs one
+    query for the whole list (per 500 tasks), never one per task.
+    """
+    ids = [task.id for task in tasks]
+    owners, counts, latest = {}, {}, {}
+    if "owner" in includes:
+        owner_ids = list({task.owner_id for task in tasks if task.owner_id is not None})
+        for chunk in _chunks(owner_ids):
+            owners.update((user.id, user) for user in db.query(models.User).filter(models.User.id.in_(chunk)))
+    for chunk in _chunks(ids):
+        if "comments_count" in includes:
+            counts.update(
+                db.query(models.Comment.task_id, func.count())
+                .filter(models.Comment.task_id.in_(chunk))
+                .group_by(models.Comment.task_id)
+            )
+        if "latest_comment" in includes:
+            # Newest comment id per task, answered from the (task_id, id) index
+            newest = (
+                select(func.max(models.Comment.id))
+                .where(models.Comment.task_id.in_(chunk))
+                .group_by(models.Comment.task_id)
+            )
+            latest.update(
+                (comment.task_id, comment)
+                for comment in db.query(models.Comment).filter(models.Comment.id.in_(newest))
+            )
+    items = []
+    for task in tasks:
+        item = schemas.Task.from_orm(task).dict()
+        if "owner" in includes:
+            owner = owners.get(task.owner_id)
+            item["owner"] = schemas.TaskOwner.from_orm(owner).dict() if owner else None
+        if "comments_count" in includes:
+            item["comments_count"] = counts.get(task.id, 0)
+        if "latest_comment" in includes:
+            comment = latest.get(task.id)
+            item["latest_comment"] = schemas.CommentSummary.from_orm(comment).dict() if comment else None
+        items.append(item)
+    return jsonable_encoder(items)
+
+def _project(rows, names: List[str]):
+    # Plain dicts straight from the selected columns: no ORM entities, no schema validation
+    dates = [name for name in names if name in DATETIME_FIELDS]
+    items = []
+    for row in rows:
+        item = {name: getattr(row, name) for name in names}
+        for name in dates:
+            if item[name] is not None:
+                item[name] = item[name].isoformat()
+        items.append(item)
+    return items
+
+def get_task_rows(
+    db: Session, names: List[str], skip: int = 0, limit: int = 100,
+    filters: schemas.TaskFilters = None, sort: str = None,
+):
+    columns = [TASK_FIELDS[name] for name in names]
+    return tasks_query(db, filters, sort, columns=columns).offset(skip).limit(limit).all()
+
+def get_task_fields(
+    db: Session, names: List[str], skip: int = 0, limit: int = 100,
+    filters: schemas.TaskFilters = None, sort: str = None,
+):
+    return _project(get_task_rows(db, names, skip=skip, limit=limit, filters=filters, sort=sort), names)
+
+def encode_cursor(task: models.Task):
+    key = [task.due_date.isoformat(), task.priority, task.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+def decode_cursor(cursor: str):
+    try:
+        due_date, priority, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(due_date), int(priority), int(id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+def get_tasks_page(
+    db: Session, cursor: str = None, limit: int = 100,
+    filters: schemas.TaskFilters = None, names: List[str] = None, includes: List[str] = None,
+):
+    """
+    Keyset pagination over (due_date, priority, id). Resuming from a cursor is
+    an index seek, so every page costs the same regardless of its depth.
+
+    With `names`, only those columns (plus the keyset columns) are selected
+    and the page is returned as a plain dict of projected items. With
+    `includes`, it is a plain dict of items carrying the related data.
+    """
+    key = (models.Task.due_date, models.Task.priority, models.Task.id)
+    if names:
+        columns = [TASK_FIELDS[name] for name in dict.fromkeys(names + KEYSET_FIELDS)]
+        query = filter_tasks(db.query(*columns), filters)
+    else:
+        query = filter_tasks(db.query(models.Task), filters)
+    if cursor:
+        query = query.filter(tuple_(*key) > tuple_(*decode_cursor(cursor)))
+    # Fetch one extra row to know whether another page exists
+    tasks = query.order_by(*key).limit(limit + 1).all()
+    next_cursor = encode_cursor(tasks[limit - 1]) if len(tasks) > limit else None
+    if names:
+        return {"items": _project(tasks[:limit], names), "next_cursor": next_cursor}
+    if includes:
+        return {"items": with_includes(db, tasks[:limit], includes), "next_cursor": next_cursor}
+    return schemas.TaskPage(items=tasks[:limit], next_cursor=next_cursor)
 
 def get_task(db: Session, id: int):
     return db.query(models.Task).filter(models.Task.id == id).first()
 
-def update_task(db: Session, task: schemas.Task):
-    db_task = get_task(db, task.id)
+def lookup_tasks(db: Session, ids: List[int]):
+    tasks = {}
+    for chunk in _chunks(list(dict.fromkeys(ids))):
+        tasks.update((task.id, task) for task in db.query(models.Task).filter(models.Task.id.in_(chunk)))
+    return [schemas.TaskLookupItem(id=id, found=id in tasks, task=tasks.get(id)) for id in ids]
+
+def get_task_cached(db: Session, id: int):
+    return task_cache.get(id, lambda: get_task(db, id))
+
+def get_task_changes(db: Session, since: int = 0, limit: int = 1000):
+    changes = changes_since(db, since, limit)
+    next_since = changes[-1].seq if changes else since
+    return schemas.TaskChangePage(items=changes, next_since=next_since)
+
+def get_task_summary(db: Session, owner_id: int):
+    return schemas.TaskSummary(**get_summary(db, owner_id))
+
+def reconcile_task_summary(db: Session):
+    return schemas.SummaryReconcileReport(**reconcile(db))
+
+def search_tasks(db: Session, q: str, limit: int = 20):
+    ids = search.search_task_ids(db, q, limit)
+    tasks = {task.id: task for task in db.query(models.Task).filter(models.Task.id.in_(ids))}
+    return [tasks[id] for id in ids if id in tasks]
+
+def update_task(db: Session, task_id: int, task: schemas.TaskCreate):
+    db_task = get_task(db, task_id)
     if db_task is None:
         return None
-    for var, value in vars(task).items():
-        setattr(db_task, var, value) if value else None
+    before = summary_key(db_task)
+    changed = {}
+    # exclude_unset rather than a truthiness check, so that status=False and priority=0 are applied
+    for var, value in task.dict(exclude_unset=True).items():
+        if getattr(db_task, var) != value:
+            setattr(db_task, var, value)
+            if var not in UNLOGGED_FIELDS:
+                changed[var] = value
     db.add(db_task)
+    db.flush()
+    search.index_tasks(db, [db_task])
+    if changed:
+        record_changes(db, [change(db_task.id, "update", changed)])
+    apply_deltas(db, moved(before, summary_key(db_task)))
     db.commit()
+    invalidate_task(db_task.id)
     db.refresh(db_task)
     return db_task
 
 def delete_task(db: Session, id: int):
     db_task = get_task(db, id)
+    if db_task is None:
+        return None
+    # Before db.delete, so the comment lookup does not autoflush the pending delete
+    search.remove_tasks(db, [id])
     db.delete(db_task)
+    record_changes(db, [change(id, "delete")])
+    apply_deltas(db, {summary_key(db_task): -1})
     db.commit()
+    invalidate_task(id)
     return db_task
 ```
 
 FastAPI Endpoints:
 
 ```python
-from typing import List
-from fastapi import Depends, FastAPI, HTTPException, status
+import json
+from typing import List, Optional, Union
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from . import models, schemas, services
-from .database import SessionLocal
+from . import fastjson, models, schemas, services
+from .cache import cache_stats
+from .conditional import is_not_modified, make_etag, not_modified_response, validator_headers
+from .database import get_db, pool_stats
+from .metrics import instrument
+from .profiler import add_profiler, require_profiler_token
+from .register import TokenUser, get_current_active_user
 
 app = FastAPI()
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+instrument(app)
+add_profiler(app)
 
 @app.post("/tasks/", response_model=schemas.Task)
 def create_task(
     task: schemas.TaskCreate,
     db: Session = Depends(get_db),
-    current_user: schemas.User = Depends(get_current_active_user),
+    current_user: TokenUser = Depends(get_current_active_user),
 ):
     """
     Create new tasks with title, description, due date, priority, and status
     """
     return services.create_user_task(db=db, task=task, user_id=current_user.id)
 
-@app.get("/tasks/", response_model=List[schemas.Task])
-def read_tasks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@app.get("/tasks/", response_model=Union[schemas.TaskPage, List[schemas.Task]])
+def read_tasks(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    sort: Optional[schemas.TaskSort] = None,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    filters: schemas.TaskFilters = Depends(),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve tasks
+
+    Tasks can be filtered by `owner_id`, `status`, `priority_min`/`priority_max`
+    and `due_after`/`due_before`, and ordered with `sort` (prefix `-` for
+    descending). Every filter combination is served by a composite index.
+
+    Passing `cursor` (empty for the first page) switches to keyset pagination
+    and returns a `TaskPage` envelope with `next_cursor`. Without it, the
+    legacy `skip`/`limit` list is returned. `limit` is between 1 and 1000.
+
+    `fields` (e.g. `id,title,status,due_date`) selects only those columns in
+    SQL and returns plain objects with just those keys.
+
+    `include` (any of `owner,comments_count,latest_comment`) adds related data
+    to each task, loaded with one query per include for the whole page.
     """
-    tasks = services.get_tasks(db, skip=skip, limit=limit)
+    try:
+        names = services.parse_fields(fields) if fields is not None else None
+        includes = services.parse_include(include) if include is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if names and includes:
+        raise HTTPException(status_code=400, detail="include cannot be combined with fields")
+    if cursor is not None:
+        if sort is not None:
+            raise HTTPException(status_code=400, detail="sort cannot be combined with cursor pagination")
+        try:
+            page = services.get_tasks_page(
+                db, cursor=cursor, limit=limit, filters=filters, names=names, includes=includes
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return JSONResponse(page) if names or includes else page
+    if names:
+        # Already plain JSON types, so skip response_model validation
+        return JSONResponse(
+            services.get_task_fields(db, names, skip=skip, limit=limit, filters=filters, sort=sort)
+        )
+    if includes:
+        tasks = services.get_tasks(db, skip=skip, limit=limit, filters=filters, sort=sort)
+        return JSONResponse(services.with_includes(db, tasks, includes))
+    if fastjson.FAST_JSON:
+        names = list(services.TASK_FIELDS)
+        rows = services.get_task_rows(db, names, skip=skip, limit=limit, filters=filters, sort=sort)
+        return fastjson.RowsResponse(rows, names)
+    tasks = services.get_tasks(db, skip=skip, limit=limit, filters=filters, sort=sort)
     return tasks
 
+# The bulk, search and changes routes must be registered before /tasks/{task_id}
+# so that "bulk", "search" and "changes" are not matched as a task id.
+@app.get("/tasks/changes", response_model=schemas.TaskChangePage)
+def read_task_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: Session = Depends(get_db),
+):
+    """
+    Task changes with a sequence number greater than `since`, oldest first.
+    Pass the returned `next_since` back to fetch the next batch.
+    """
+    return services.get_task_changes(db, since=since, limit=limit)
+
+@app.get("/tasks/search", response_model=List[schemas.Task])
+def search_tasks(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Full-text search over task titles, descriptions and comments, best match first
+    """
+    return services.search_tasks(db, q, limit=limit)
+
+@app.post("/tasks/lookup", response_model=schemas.TaskLookupResult)
+def lookup_tasks(payload: schemas.TaskLookup, db: Session = Depends(get_db)):
+    """
+    Fetch many tasks by id in one request, in request order, with `found: false` for missing ids
+    """
+    return schemas.TaskLookupResult(results=services.lookup_tasks(db, payload.ids))
+
+@app.post("/tasks/bulk", response_model=schemas.BulkResult)
+def create_tasks_bulk(
+    payload: schemas.TaskBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: TokenUser = Depends(get_current_active_user),
+):
+    """
+    Create many tasks with multi-row INSERTs in a single transaction
+    """
+    results = services.create_user_tasks(db, payload.tasks, user_id=current_user.id)
+    return schemas.BulkResult(results=results)
+
+@app.patch("/tasks/bulk", response_model=schemas.BulkResult)
+def update_tasks_bulk(
+    payload: schemas.TaskBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: TokenUser = Depends(get_current_active_user),
+):
+    """
+    Apply the same changes to many of the caller's tasks with UPDATE ... WHERE id IN
+    """
+    try:
+        results = services.update_tasks(db, payload.ids, payload.changes, owner_id=current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return schemas.BulkResult(results=results)
+
+@app.delete("/tasks/bulk", response_model=schemas.BulkResult)
+def delete_tasks_bulk(
+    payload: schemas.TaskBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: TokenUser = Depends(get_current_active_user),
+):
+    """
+    Delete many of the caller's tasks with a set-based DELETE
+    """
+    results = services.delete_tasks(db, payload.ids, owner_id=current_user.id)
+    return schemas.BulkResult(results=results)
+
 @app.get("/tasks/{task_id}", response_model=schemas.Task)
-def read_task(task_id: int, db: Session = Depends(get_db)):
+def read_task(
+    task_id: int, request: Request, response: Response,
+    include: Optional[str] = None, db: Session = Depends(get_db),
+):
     """
     Retrieve a task by its ID
+
+    Responds 304 when `If-None-Match` matches the task's current ETag.
+    `include` works as on the task list.
     """
-    task = services.get_task(db, task_id)
+    try:
+        includes = services.parse_include(include) if include is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    task = services.get_task_cached(db, task_id)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
+    if includes:
+        item = services.with_includes(db, [task], includes)[0]
+        # Related data changes without bumping the task's revision, so it is part of the tag
+        etag = make_etag("task", task.id, task.revision, json.dumps(item, sort_keys=True))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        return JSONResponse(item, headers=validator_headers(etag))
+    etag = make_etag("task", task.id, task.revision)
+    if is_not_modified(request, etag, task.updated_at):
+        return not_modified_response(etag, task.updated_at)
+    response.headers.update(validator_headers(etag, task.updated_at))
     return task
 
+@app.get("/cache/stats", dependencies=[Depends(require_profiler_token)])
+def read_cache_stats():
+    """
+    Hit, miss and eviction counters for each read-through cache
+    """
+    return cache_stats()
+
+@app.get("/users/{user_id}/task-summary", response_model=schemas.TaskSummary)
+def read_task_summary(user_id: int, db: Session = Depends(get_db)):
+    """
+    Open, done and overdue task counts of a user, overall and per priority
+    """
+    return services.get_task_summary(db, user_id)
+
+@app.post(
+    "/task-summary/reconcile",
+    response_model=schemas.SummaryReconcileReport,
+    dependencies=[Depends(require_profiler_token)],
+)
+def reconcile_task_summary(db: Session = Depends(get_db)):
+    """
+    Rebuild the task summary counters from the tasks table and report any drift
+    """
+    return services.reconcile_task_summary(db)
+
+@app.get("/db/pool", dependencies=[Depends(require_profiler_token)])
+def read_pool_stats():
+    """
+    Checked-out connections, overflow and checkout wait times for each engine's pool
+    """
+    return pool_stats()
+
 @app.patch("/tasks/{task_id}", response_model=schemas.Task)
 def update_task(
     task_id: int, task: schemas.TaskCreate, db: Session = Depends(get_db)
@@ -150,7 +791,7 @@ def update_task(
     """
     Update a task by its ID
     """
-    updated_task = services.update_task(db, task)
+    updated_task = services.update_task(db, task_id, task)
     if updated_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     return updated_task
@@ -191,4 +832,8 @@ def test_create_task():
     assert response.json()["title"] == "test task"
 ```
 
-Please note that the above code assumes there is a `get_current_active_user` function which authenticates a user and returns a User object. This function should be implemented according to the authentication method used (OAuth, JWT, etc.).
\ No newline at end of file
+`get_current_active_user` comes from `register.py`. It verifies the signed bearer token issued by `/login` and returns the user's id and username from the token's claims, so creating tasks needs no database lookup for authentication.
+
+Every create, update and delete also appends to the task change log (`changelog.py`) in the same transaction. Clients keep a local copy in sync by polling `GET /tasks/changes?since=<seq>` with the `next_since` of their previous call. They only re-fetch everything if they have never synced.
+
+`GET /users/{user_id}/task-summary` reads the per-owner counters that `task_summary.py` maintains in the same transactions as task writes. `POST /task-summary/reconcile` recounts them from scratch. A non-empty `drift` in its report means some write path is missing a counter update.
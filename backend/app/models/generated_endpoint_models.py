@@ -3,10 +3,12 @@ Based on the provided code, you already have Pydantic models for request/respons
 - `CommentBase`: Used as a base model for creating and reading comments.
 - `CommentCreate`: Request model used to create a new comment.
 - `Comment`: Response model used to represent a comment.
+- `CommentPage`: Response envelope returned when `GET /tasks/{task_id}/comments/` is called with a `cursor`.
 
 The complete set of models should look like this:
 
 ```python
+from typing import List, Optional
 from pydantic import BaseModel
 
 class CommentBase(BaseModel):
@@ -14,6 +16,7 @@ class CommentBase(BaseModel):
     Base model for comments.
     """
     text: str
+    author_id: Optional[int] = None
 
 class CommentCreate(CommentBase):
     """
@@ -29,6 +32,13 @@ class Comment(CommentBase):
     task_id: int
     class Config:
         orm_mode = True
+
+class CommentPage(BaseModel):
+    """
+    Response model for cursor-paginated comment listings.
+    """
+    items: List[Comment]
+    next_cursor: Optional[str] = None
 ```
 
 These models are used in the service layer (`crud.py`) to handle the business logic of creating and reading comments. 
@@ -36,12 +46,13 @@ These models are used in the service layer (`crud.py`) to handle the business lo
 In the case of the database models, you also have:
 
 - `Task`: Represents a task in the database. Contains a foreign key relationship with comments.
-- `Comment`: Represents a comment in the database. Contains a foreign key to the task it is associated with.
+- `Comment`: Represents a comment in the database. Contains a foreign key to the task it is associated with, and the optional `author_id` of the user who wrote it, which the notification broadcast uses to find a task's commenters. The `(task_id, id)` index serves per-task listings in id order; the free-text `text` column is not indexed. Its `revision` and `updated_at` columns are used to build the ETag and `Last-Modified` headers of the comment listing.
 
 These models look like this:
 
 ```python
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from datetime import datetime
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, literal_column
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -59,9 +70,14 @@ class Comment(Base):
     """
     __tablename__ = "comments"
     id = Column(Integer, primary_key=True, index=True)
-    text = Column(String, index=True)
+    text = Column(String)
     task_id = Column(Integer, ForeignKey("tasks.id"))
+    author_id = Column(Integer, nullable=True)
+    revision = Column(Integer, nullable=False, default=1, onupdate=literal_column("revision") + 1)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     task = relationship("Task", back_populates="comments")
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (Index("ix_comments_task_id_id", "task_id", "id"),)
 ```
 
 In terms of unit tests, provided tests are checking the HTTP status code and the response content of the `create_comment` and `read_comments` endpoints. 
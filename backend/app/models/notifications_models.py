@@ -32,4 +32,54 @@ class Notification(NotificationBase):
         orm_mode = True
 ```
 
+4. `UnreadCount`: Response model for `GET /notifications/{user_id}/unread_count`, used by badges that only need the number of unread notifications.
+
+```python
+class UnreadCount(BaseModel):
+    user_id: int
+    unread: int
+```
+
+5. `MarkRead` and `MarkReadResult`: Request and response models for batch read acknowledgements. `MarkRead` takes exactly one of a list of `ids` or an `up_to_id` watermark. `MarkReadResult` reports how many notifications were actually flipped from unread to read.
+
+```python
+class MarkRead(BaseModel):
+    ids: Optional[conlist(int, min_items=1, max_items=1000)] = None
+    up_to_id: Optional[int] = None
+
+class MarkReadResult(BaseModel):
+    user_id: int
+    updated: int
+```
+
+6. `Broadcast` and `BroadcastResult`: Request and response models for `POST /notifications/broadcast`. `Broadcast` takes a `task_id`, a `message`, and exactly one of an explicit `user_ids` list (up to 50,000) or the `task_owner_and_commenters` audience. `BroadcastResult` reports how many notifications were created.
+
+```python
+class Broadcast(BaseModel):
+    task_id: int
+    message: str
+    user_ids: Optional[conlist(int, min_items=1, max_items=50_000)] = None
+    audience: Optional[Literal["task_owner_and_commenters"]] = None
+
+class BroadcastResult(BaseModel):
+    task_id: int
+    recipients: int
+```
+
+7. `RetentionStatus`: Response model for `GET /notifications/retention`. It reports whether the retention worker is enabled, whether it archives or deletes, and the `RetentionRun` (rows processed, batches, seconds spent) of its latest run.
+
+```python
+class RetentionRun(BaseModel):
+    rows: int
+    batches: int
+    seconds: float
+    finished_at: Optional[datetime] = None
+
+class RetentionStatus(BaseModel):
+    enabled: bool
+    mode: str
+    last_run: Optional[RetentionRun] = None
+    last_error: Optional[str] = None
+```
+
 There are no additional data transfer objects required for the provided code. The `NotificationCreate` model is used as a data transfer object to send data from the client to the server when creating a new notification, and the `Notification` model is used as a data transfer object to send data from the server to the client when reading notifications.
\ No newline at end of file
@@ -5,8 +5,11 @@ class Task(BaseModel):
     id: int
     title: str
     status: bool
+
+    class Config:
+        orm_mode = True
 ```
-The `Task` model is both a request and a response model. In the `track_task_status` endpoint, it is used as a response model to structure the data returned to the client. In the `update_task_status` endpoint, it is used as a request model to validate the incoming data.
+The `Task` model is both a request and a response model. In the `track_task_status` endpoint, it is used as a response model to structure the data returned to the client. In the `update_task_status` endpoint, it is used as a request model to validate the incoming data. `orm_mode` lets it be built from a `TaskModel` row, which is how the status cache stores tasks.
 
 ```python
 class TaskUpdate(BaseModel):
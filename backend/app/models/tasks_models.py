@@ -3,7 +3,8 @@ The Pydantic models and data transfer objects have already been included in the
 For the request and response models, we have the `TaskCreate` and `Task` classes:
 
 ```python
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, conlist, validator
 from datetime import datetime
 
 class TaskBase(BaseModel):
@@ -19,19 +20,145 @@ class TaskCreate(TaskBase):
 class Task(TaskBase):
     id: int
     owner_id: int
+    revision: int
+    updated_at: datetime
 
     class Config:
         orm_mode = True
+
+class TaskPage(BaseModel):
+    items: List[Task]
+    next_cursor: Optional[str] = None
+
+class TaskFilters(BaseModel):
+    owner_id: Optional[int] = None
+    status: Optional[bool] = None
+    priority_min: Optional[int] = None
+    priority_max: Optional[int] = None
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
+
+TaskSort = Literal["id", "due_date", "-due_date", "priority", "-priority"]
+
+class TaskPatch(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    priority: Optional[int] = None
+    status: Optional[bool] = None
+
+    # Fields may be left out, but an explicit null would be written to the column
+    @validator("title", "due_date", "priority", "status")
+    def check_not_null(cls, value):
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class TaskBulkCreate(BaseModel):
+    tasks: conlist(TaskCreate, min_items=1, max_items=5000)
+
+class TaskBulkUpdate(BaseModel):
+    ids: conlist(int, min_items=1, max_items=5000)
+    changes: TaskPatch
+
+class TaskBulkDelete(BaseModel):
+    ids: conlist(int, min_items=1, max_items=5000)
+
+class BulkItemResult(BaseModel):
+    id: int
+    status: str
+
+class BulkResult(BaseModel):
+    results: List[BulkItemResult]
+
+class TaskOwner(BaseModel):
+    id: int
+    username: str
+
+    class Config:
+        orm_mode = True
+
+class CommentSummary(BaseModel):
+    id: int
+    text: str
+    author_id: Optional[int] = None
+
+    class Config:
+        orm_mode = True
+
+class TaskLookup(BaseModel):
+    ids: conlist(int, min_items=1, max_items=5000)
+
+class TaskLookupItem(BaseModel):
+    id: int
+    found: bool
+    task: Optional[Task] = None
+
+class TaskLookupResult(BaseModel):
+    results: List[TaskLookupItem]
+
+class TaskChange(BaseModel):
+    seq: int
+    task_id: int
+    op: str
+    fields: dict
+    changed_at: datetime
+
+    class Config:
+        orm_mode = True
+
+class TaskChangePage(BaseModel):
+    items: List[TaskChange]
+    next_since: int
+
+class PriorityCounts(BaseModel):
+    priority: int
+    open: int
+    done: int
+
+class TaskSummary(BaseModel):
+    owner_id: int
+    open: int
+    done: int
+    overdue: int
+    by_priority: List[PriorityCounts]
+
+class SummaryDrift(BaseModel):
+    owner_id: int
+    priority: int
+    status: bool
+    stored: int
+    actual: int
+
+class SummaryReconcileReport(BaseModel):
+    counters: int
+    drift: List[SummaryDrift]
+    seconds: float
 ```
 
 `TaskCreate` is used as the request model. When creating a task, a request body containing the task's title, description, due date, priority, and status should be sent. Pydantic will automatically validate these fields based on their type hints.
 
-`Task` is used as the response model. It includes all the fields from `TaskCreate`, as well as the task's `id` and `owner_id` which are generated by the server. These are sent back to the client in the response body after creating a task. This model is also used when retrieving tasks.
+`Task` is used as the response model. It includes all the fields from `TaskCreate`, as well as the task's `id`, `owner_id`, `revision` and `updated_at`, which are generated by the server. `revision` and `updated_at` also back the `ETag` and `Last-Modified` headers of `GET /tasks/{task_id}`. These are sent back to the client in the response body after creating a task. This model is also used when retrieving tasks.
+
+`TaskPage` is the response envelope for cursor pagination on `GET /tasks/`. It wraps a page of `Task` items together with an opaque `next_cursor`, which is `None` on the last page.
+
+`TaskFilters` holds the optional query parameters of `GET /tasks/`, and `TaskSort` lists the accepted `sort` values.
+
+The bulk endpoints use `TaskBulkCreate`, `TaskBulkUpdate` and `TaskBulkDelete` as request models, each capped at 5,000 items. `TaskBulkUpdate` applies one `TaskPatch` (only the fields that are set) to every listed id. Only `description` may be set to `null`. All three respond with a `BulkResult`: one `BulkItemResult` per requested item, in request order, whose `status` is `created`, `updated`, `deleted` or `not_found`.
+
+`TaskOwner` and `CommentSummary` describe the related data that `include=owner,comments_count,latest_comment` adds to tasks on `GET /tasks/` and `GET /tasks/{task_id}`: an `owner` object, an integer `comments_count` and the `latest_comment`. Only the requested keys are added, so a response without `include` is unchanged.
+
+`TaskLookup` is the request model of `POST /tasks/lookup`, with up to 5,000 `ids`. The `TaskLookupResult` response has one `TaskLookupItem` per requested id, in request order and including duplicates. Each item carries the `task`, or `found: false` and no task when the id does not exist.
+
+`TaskChangePage` is the response of `GET /tasks/changes`. Each `TaskChange` carries its log sequence number `seq`, the task id, the operation (`create`, `update` or `delete`) and the changed fields with their new values. `next_since` is the `since` value for the next call.
+
+`TaskSummary` is the response of `GET /users/{user_id}/task-summary`. It holds a user's open, done and overdue task counts, plus open/done per priority in `by_priority`. `SummaryReconcileReport` is returned by `POST /task-summary/reconcile`. It lists every `SummaryDrift`, meaning a counter whose stored value differed from the recount, before the counters were replaced.
 
 Data Transfer Objects (DTOs) are used in the service layer to interact with the database. These are SQLAlchemy models:
 
 ```python
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime
+from datetime import datetime
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Index, literal_column
 from sqlalchemy.orm import relationship
 
 from database import Base
@@ -47,17 +174,28 @@ class Task(Base):
     __tablename__ = "tasks"
 
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    description = Column(String, index=True)
-    due_date = Column(DateTime, index=True)
-    priority = Column(Integer, index=True)
+    title = Column(String)
+    description = Column(String)
+    due_date = Column(DateTime, nullable=False)
+    priority = Column(Integer, nullable=False)
     status = Column(Boolean, default=False)
     owner_id = Column(Integer, ForeignKey("users.id"))
+    revision = Column(Integer, nullable=False, default=1, onupdate=literal_column("revision") + 1)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     owner = relationship("User", back_populates="tasks")
 
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        Index("ix_tasks_due_date_priority_id", "due_date", "priority", "id"),
+        Index("ix_tasks_owner_id_status_due_date", "owner_id", "status", "due_date"),
+        Index("ix_tasks_status_priority_id", "status", "priority", "id"),
+        Index("ix_tasks_priority_id", "priority", "id"),
+    )
+
 
 User.tasks = relationship("Task", back_populates="owner", cascade="all, delete-orphan")
 ```
 
-In this case, `Task` is a DTO representing a task in the database. It includes fields for the task's ID, title, description, due date, priority, status, and owner ID. The `User` DTO represents a user in the database and includes fields for the user's ID, username, and password.
\ No newline at end of file
+In this case, `Task` is a DTO representing a task in the database. It includes fields for the task's ID, title, description, due date, priority, status, and owner ID. `title` and `description` are not B-tree indexed; keyword search over them goes through the full-text index in `search.py`. Every UPDATE increments `revision` through its `onupdate` expression. The composite `(due_date, priority, id)` index backs the keyset ordering used by cursor pagination. The other composite indexes back the task list filters: `(owner_id, status, due_date)` for per-owner views, `(status, priority, id)` for status and priority filters, and `(priority, id)` for priority-only filters and sorting. The `User` DTO represents a user in the database and includes fields for the user's ID, username, and password.
\ No newline at end of file
@@ -0,0 +1,68 @@
+Shared test configuration. Every request made through a `TestClient` during a test gets a budget of SQL statements. A request that runs more fails the test, which catches N+1 query patterns before they reach production. Mark a test with `@pytest.mark.max_statements(n)` to give it a tighter (or, for deliberately chunked bulk requests, looser) budget.
+
+Benchmarks are marked with `@pytest.mark.perf` and are skipped unless `RUN_BENCHMARKS=1` is set. They can import `timed` from here to time a callable.
+
+```python
+import os
+import time
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.testclient import TestClient
+
+MAX_STATEMENTS_PER_REQUEST = 10
+RUN_BENCHMARKS = bool(os.environ.get("RUN_BENCHMARKS"))
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "max_statements(n): fail if any request in the test runs more than n SQL statements"
+    )
+    # Not "benchmark": pytest-benchmark reserves that marker for its own options
+    config.addinivalue_line("markers", "perf: timing test, skipped unless RUN_BENCHMARKS=1 is set")
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if item.get_closest_marker("perf"):
+            item.add_marker(skip)
+
+def timed(fn, repeat=20):
+    """
+    Mean seconds per call of `fn` over `repeat` calls, after one warm-up call
+    """
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+@pytest.fixture(autouse=True)
+def sql_statement_budget(request, monkeypatch):
+    marker = request.node.get_closest_marker("max_statements")
+    limit = marker.args[0] if marker else MAX_STATEMENTS_PER_REQUEST
+    statements = []
+
+    # Listening on the Engine class covers every engine, including async engines' sync_engine
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    send = TestClient.request
+
+    def counted_request(self, method, url, *args, **kwargs):
+        statements.clear()
+        response = send(self, method, url, *args, **kwargs)
+        assert len(statements) <= limit, (
+            f"{method} {url} ran {len(statements)} SQL statements (limit {limit}):\n" + "\n".join(statements)
+        )
+        return response
+
+    event.listen(Engine, "before_cursor_execute", count)
+    monkeypatch.setattr(TestClient, "request", counted_request)
+    yield
+    event.remove(Engine, "before_cursor_execute", count)
+```
+
+Only statements run while a request is in flight are counted. Test setup, fixtures and direct service calls are not part of any request's budget.
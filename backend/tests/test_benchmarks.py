@@ -0,0 +1,96 @@
+Here is a benchmark suite for the high-volume list endpoints, built on `pytest-benchmark`. Each endpoint runs once on the default `response_model` path and once on the `FAST_JSON` path, against an in-memory database seeded with 1,000 rows. pytest-benchmark reports requests/sec in its `OPS` column, and `--benchmark-autosave` / `--benchmark-compare` track it between runs.
+
+```python
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import fastjson
+import generated_endpoint, notifications, tasks
+import models
+
+ROWS = 1_000
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.perf
+
+@pytest.fixture(scope="module")
+def sync_db():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    models.Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    db.add_all(
+        models.Task(
+            title=f"task {i}", description="benchmark", due_date=datetime(2024, 1, 1),
+            priority=i % 5, status=False, owner_id=1,
+        )
+        for i in range(ROWS)
+    )
+    db.add_all(models.Comment(text=f"comment {i}", task_id=1) for i in range(ROWS))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return override_get_db
+
+@pytest.fixture(scope="module")
+def tasks_client(sync_db):
+    tasks.app.dependency_overrides[tasks.get_db] = sync_db
+    return TestClient(tasks.app)
+
+@pytest.fixture(scope="module")
+def comments_client(sync_db):
+    generated_endpoint.app.dependency_overrides[generated_endpoint.get_db] = sync_db
+    return TestClient(generated_endpoint.app)
+
+@pytest.fixture(scope="module")
+def notifications_client():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_session():
+        async with SessionLocal() as session:
+            yield session
+
+    notifications.app.dependency_overrides[notifications.get_session] = override_get_session
+    notifications.engine = engine
+    with TestClient(notifications.app) as client:  # runs startup, which creates the tables
+        for i in range(ROWS):
+            client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": f"notification {i}"})
+        yield client
+
+ENDPOINTS = {
+    "read_tasks": ("tasks_client", f"/tasks/?limit={ROWS}"),
+    "read_comments": ("comments_client", f"/tasks/1/comments/?limit={ROWS}"),
+    "read_notifications": ("notifications_client", "/notifications/1"),
+}
+
+@pytest.mark.parametrize("fast_json", [False, True], ids=["default", "fast_json"])
+@pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+def test_list_endpoint_throughput(benchmark, request, monkeypatch, endpoint, fast_json):
+    client_fixture, url = ENDPOINTS[endpoint]
+    client = request.getfixturevalue(client_fixture)
+    monkeypatch.setattr(fastjson, "FAST_JSON", fast_json)
+    benchmark.group = endpoint
+
+    response = benchmark(client.get, url)
+
+    assert response.status_code == 200
+    assert len(response.json()) == ROWS
+```
+
+Run it with `RUN_BENCHMARKS=1 pytest tests/test_benchmarks.py --benchmark-autosave`. Later runs can be compared with `--benchmark-compare`. Results are grouped per endpoint, so the default and `fast_json` rows sit next to each other.
@@ -0,0 +1,113 @@
+Here are unit tests for the read-through task cache, covering hits and misses, LRU eviction, TTL expiry, invalidation and the shared Redis backend:
+
+```python
+import time
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from pydantic import BaseModel
+
+import cache as cache_module
+from cache import CacheBackend, LRUTTLBackend, ReadThroughCache, RedisBackend, cache_stats, invalidate_task
+
+class Task(BaseModel):
+    id: int
+    title: str
+    status: bool
+
+    class Config:
+        orm_mode = True
+
+def row(id, title="Test task", status=False):
+    return SimpleNamespace(id=id, title=title, status=status)
+
+@pytest.fixture
+def cache():
+    return ReadThroughCache("test_task", Task, backend=LRUTTLBackend(maxsize=2, ttl=60), register=False)
+
+def test_read_through_hit_and_miss(cache):
+    calls = []
+    loader = lambda: calls.append(1) or row(1)
+
+    assert cache.get(1, loader) == Task(id=1, title="Test task", status=False)
+    assert cache.get(1, loader) == Task(id=1, title="Test task", status=False)
+    assert len(calls) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+def test_missing_rows_are_not_cached(cache):
+    assert cache.get(1, lambda: None) is None
+    assert cache.get(1, lambda: row(1)).id == 1
+    assert cache.stats()["misses"] == 2
+
+def test_lru_eviction(cache):
+    cache.get(1, lambda: row(1))
+    cache.get(2, lambda: row(2))
+    cache.get(1, lambda: row(1))  # 1 is now the most recently used
+    cache.get(3, lambda: row(3))
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.backend.get("1") is not None
+    assert cache.backend.get("2") is None
+
+def test_ttl_expiry():
+    cache = ReadThroughCache("test_ttl", Task, backend=LRUTTLBackend(maxsize=10, ttl=0.01), register=False)
+    cache.get(1, lambda: row(1))
+    time.sleep(0.02)
+    assert cache.get(1, lambda: row(1, status=True)).status is True
+    assert cache.stats()["misses"] == 2
+
+def test_invalidate_task_clears_every_cache(monkeypatch):
+    monkeypatch.setattr(cache_module, "_caches", {})
+    first = ReadThroughCache("test_first", Task, backend=LRUTTLBackend())
+    other = ReadThroughCache("test_other", Task, backend=LRUTTLBackend())
+    first.get(1, lambda: row(1))
+    other.get(1, lambda: row(1))
+
+    invalidate_task(1)
+
+    assert first.backend.get("1") is None
+    assert other.backend.get("1") is None
+    assert set(cache_stats()) == {"test_first", "test_other"}
+
+def test_unregistered_caches_stay_out_of_the_registry(cache):
+    assert "test_task" not in cache_stats()
+
+def test_backends_must_implement_every_method():
+    class GetOnly(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+def test_redis_backend_is_shared_between_workers():
+    server = fakeredis.FakeServer()
+    worker_a = ReadThroughCache("test_redis_a", Task, backend=RedisBackend(fakeredis.FakeRedis(server=server), Task), register=False)
+    worker_b = ReadThroughCache("test_redis_b", Task, backend=RedisBackend(fakeredis.FakeRedis(server=server), Task), register=False)
+
+    worker_a.get(1, lambda: row(1))
+    assert worker_b.get(1, lambda: pytest.fail("should be served from the shared cache")).id == 1
+
+    worker_a.invalidate(1)
+    assert worker_b.get(1, lambda: row(1, status=True)).status is True
+```
+
+`fakeredis` stands in for a local Redis server, so the shared backend can be tested without any external service. Two caches created from the same `FakeServer` behave like two workers sharing one Redis instance. The test caches pass `register=False`, or swap in an empty `_caches`, so they never show up in the application's `invalidate_task` or `/cache/stats`.
+
+`GET /cache/stats` is ops-only, guarded by the profiler token:
+
+```python
+from fastapi.testclient import TestClient
+
+import profiler
+from main import app
+
+def test_cache_stats_endpoint_requires_the_profiler_token(monkeypatch):
+    client = TestClient(app)
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", "secret")
+    assert client.get("/cache/stats").status_code == 403
+    response = client.get("/cache/stats", headers={"X-Profiler-Token": "secret"})
+    assert response.status_code == 200
+    assert "task" in response.json()
+```
@@ -0,0 +1,84 @@
+Here are tests for the shared database module. They cover the SQLite pragmas, the pool metrics, and a burst stress test: many concurrent requests run against a deliberately small pool, and the test checks that they all finish and return their connections.
+
+```python
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.orm import sessionmaker
+
+from database import TimedQueuePool, _sqlite_pragmas
+
+def make_engine(path, pool_size, max_overflow, pool_timeout):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        poolclass=TimedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+    )
+    event.listen(engine, "connect", _sqlite_pragmas)
+    return engine
+
+def test_sqlite_pragmas(tmp_path):
+    engine = make_engine(tmp_path / "pragmas.db", pool_size=1, max_overflow=0, pool_timeout=1)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+def test_pool_timeout_is_counted(tmp_path):
+    engine = make_engine(tmp_path / "timeout.db", pool_size=1, max_overflow=0, pool_timeout=0.1)
+    with engine.connect():
+        with pytest.raises(PoolTimeout):
+            engine.connect()
+    assert engine.pool.metrics.timeouts == 1
+    assert engine.pool.checkedout() == 0
+
+def test_burst_does_not_exhaust_pool(tmp_path):
+    engine = make_engine(tmp_path / "burst.db", pool_size=4, max_overflow=4, pool_timeout=10)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE hits (id INTEGER PRIMARY KEY, n INTEGER)"))
+    SessionLocal = sessionmaker(bind=engine)
+
+    def request(n):
+        db = SessionLocal()
+        try:
+            db.execute(text("SELECT COUNT(*) FROM hits")).scalar()
+            db.execute(text("INSERT INTO hits (n) VALUES (:n)"), {"n": n})
+            db.commit()
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        list(executor.map(request, range(1000), timeout=60))
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM hits")).scalar() == 1000
+    assert engine.pool.checkedout() == 0
+    assert engine.pool.overflow() <= 4
+    assert engine.pool.metrics.timeouts == 0
+    assert engine.pool.metrics.checkouts >= 1000
+```
+
+The burst test runs 1,000 requests on 64 threads against a pool of 4 connections plus 4 overflow, so most requests have to wait for a connection. Every request has to finish within the timeout, and afterwards every connection must be back in the pool. `metrics.wait_seconds / metrics.checkouts` and `metrics.max_wait_seconds` show how long requests queued for a connection. `GET /db/pool` reports the same numbers in production. It is an ops-only endpoint, guarded like `/debug/profile`:
+
+```python
+from fastapi.testclient import TestClient
+
+import profiler
+from main import app
+
+client = TestClient(app)
+
+def test_pool_stats_endpoint_requires_the_profiler_token(monkeypatch):
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", None)
+    assert client.get("/db/pool").status_code == 404
+
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", "secret")
+    assert client.get("/db/pool").status_code == 403
+    response = client.get("/db/pool", headers={"X-Profiler-Token": "secret"})
+    assert response.status_code == 200
+    assert set(response.json()) == {"sync", "async"}
+```
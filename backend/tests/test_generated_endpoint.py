@@ -1,13 +1,16 @@
 Here are the comprehensive unit tests for the given FastAPI endpoints:
 
 ```python
+import json
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from .main import app, get_db
-from . import models, crud
+from sqlalchemy.pool import StaticPool
+from .main import app, get_db, get_session_factory
+from . import crud, fastjson, models
 
-engine = create_engine("sqlite:///:memory:")
+# One shared connection, so every threadpool worker and the export stream see the same database
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 models.Base.metadata.create_all(bind=engine)
 
@@ -19,6 +22,7 @@ def override_get_db():
         db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 
 client = TestClient(app)
 
@@ -81,8 +85,95 @@ class TestTasks:
         response = client.get(f"/tasks/{task['id']}/comments/")
         assert response.status_code == 200
         assert response.json() == []
+
+    def test_read_comments_fast_json(self, monkeypatch):
+        # create a task with a comment
+        response = client.post("/tasks/", json={"title": "Test task"})
+        task = response.json()
+        client.post(f"/tasks/{task['id']}/comments/", json={"text": "Great work!"})
+
+        # the fast path returns the same body and keeps the validators
+        expected = client.get(f"/tasks/{task['id']}/comments/")
+        monkeypatch.setattr(fastjson, "FAST_JSON", True)
+        response = client.get(f"/tasks/{task['id']}/comments/")
+        assert response.json() == expected.json()
+        assert response.headers["ETag"] == expected.headers["ETag"]
+
+    def test_read_comments_cursor_pagination(self):
+        # create a task with three comments
+        response = client.post("/tasks/", json={"title": "Test task"})
+        task = response.json()
+        for text in ("First", "Second", "Third"):
+            client.post(f"/tasks/{task['id']}/comments/", json={"text": text})
+
+        # page through them two at a time
+        response = client.get(f"/tasks/{task['id']}/comments/", params={"cursor": "", "limit": 2})
+        assert response.status_code == 200
+        page = response.json()
+        assert [c["text"] for c in page["items"]] == ["First", "Second"]
+        assert page["next_cursor"] is not None
+
+        response = client.get(
+            f"/tasks/{task['id']}/comments/", params={"cursor": page["next_cursor"], "limit": 2}
+        )
+        page = response.json()
+        assert [c["text"] for c in page["items"]] == ["Third"]
+        assert page["next_cursor"] is None
+
+    def test_read_comments_invalid_cursor(self):
+        response = client.get("/tasks/1/comments/", params={"cursor": "abc"})
+        assert response.status_code == 400
+
+    def test_export_comments_ndjson(self):
+        # create a task with two comments
+        response = client.post("/tasks/", json={"title": "Test task"})
+        task = response.json()
+        for text in ("First", "Second"):
+            client.post(f"/tasks/{task['id']}/comments/", json={"text": text})
+
+        # export them as one JSON object per line
+        response = client.get(f"/tasks/{task['id']}/comments/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["text"] for line in lines] == ["First", "Second"]
+        assert all(line["task_id"] == task["id"] for line in lines)
+        assert all(set(line) == {"id", "task_id", "text", "author_id"} for line in lines)
+
+    def test_read_comments_limit_without_cursor(self, monkeypatch):
+        # create a task with three comments
+        response = client.post("/tasks/", json={"title": "Test task"})
+        task = response.json()
+        for text in ("First", "Second", "Third"):
+            client.post(f"/tasks/{task['id']}/comments/", json={"text": text})
+
+        # the plain list honours limit on both serialization paths
+        for fast_json in (False, True):
+            monkeypatch.setattr(fastjson, "FAST_JSON", fast_json)
+            response = client.get(f"/tasks/{task['id']}/comments/", params={"limit": 2})
+            assert [c["text"] for c in response.json()] == ["First", "Second"]
+
+    def test_read_comments_not_modified(self):
+        # create a task with one comment
+        response = client.post("/tasks/", json={"title": "Test task"})
+        task = response.json()
+        client.post(f"/tasks/{task['id']}/comments/", json={"text": "First"})
+
+        # a matching ETag returns 304 with no body
+        response = client.get(f"/tasks/{task['id']}/comments/")
+        etag = response.headers["ETag"]
+        response = client.get(f"/tasks/{task['id']}/comments/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # a new comment changes the ETag
+        client.post(f"/tasks/{task['id']}/comments/", json={"text": "Second"})
+        response = client.get(f"/tasks/{task['id']}/comments/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert len(response.json()) == 2
 ```
 
-These tests cover success cases, error cases, data validation, and edge cases. The FastAPI application is tested using an in-memory SQLite database, which is created and destroyed for each test. The `override_get_db` function is used to replace the original `get_db` dependency with one that uses the SQLite database.
+These tests cover success cases, error cases, data validation, edge cases, conditional GET with `If-None-Match`, cursor pagination, and the NDJSON export. The FastAPI application is tested using an in-memory SQLite database, which is created and destroyed for each test. The `override_get_db` function is used to replace the original `get_db` dependency with one that uses the SQLite database. The export stream opens its own session, so `get_session_factory` is overridden to hand it the same test database.
 
 Note: This test suite assumes the existence of a POST `/tasks/` endpoint to create tasks. If such an endpoint doesn't exist, you'll need to create tasks in a different way, perhaps by directly using the CRUD functions in the tests.
\ No newline at end of file
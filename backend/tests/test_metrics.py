@@ -0,0 +1,133 @@
+Here are tests for the request metrics. Each test instruments a small app of its own with a fresh registry, so the series it checks are not mixed up with those of other tests:
+
+```python
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from metrics import MetricsRegistry, instrument, timed
+
+def make_client(server_timing=False):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    app = FastAPI()
+    registry = MetricsRegistry()
+    instrument(app, registry=registry, server_timing=server_timing)
+
+    def get_conn():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            yield conn
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, conn=Depends(get_conn)):
+        return {"id": conn.execute(text("SELECT :id"), {"id": item_id}).scalar()}
+
+    @app.post("/login")
+    def login():
+        with timed("bcrypt"):
+            time.sleep(0.01)
+        return {"ok": True}
+
+    return TestClient(app), registry
+
+def test_records_latency_sql_and_size_per_route_template():
+    client, registry = make_client()
+
+    bodies = [client.get(f"/items/{i}").content for i in (1, 2)]
+    client.get("/nowhere/42")
+
+    metrics = registry.routes[("GET", "/items/{item_id}")]
+    assert sum(metrics.latency.counts) == 2
+    assert metrics.sql_count == 4  # the dependency's statement is charged to the request too
+    assert metrics.sql_seconds > 0
+    assert metrics.size.sum == sum(len(body) for body in bodies)
+    assert sum(registry.routes[("GET", "unmatched")].latency.counts) == 1
+
+def test_metrics_endpoint_renders_prometheus_text():
+    client, _ = make_client()
+    client.get("/items/1")
+    client.post("/login")
+
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    assert "# TYPE http_request_duration_seconds histogram" in lines
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 1' in lines
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/items/{item_id}",le="+Inf"} 1' in lines
+    assert 'db_statements_total{method="GET",route="/items/{item_id}"} 2' in lines
+    bcrypt = next(line for line in lines if line.startswith('http_request_phase_seconds_total{method="POST"'))
+    assert float(bcrypt.split()[-1]) >= 0.01
+
+def test_server_timing_header_is_opt_in():
+    client, _ = make_client()
+    assert "server-timing" not in client.get("/items/1").headers
+
+    client, _ = make_client(server_timing=True)
+    assert client.get("/items/1").headers["server-timing"].startswith('db;dur=')
+    assert 'desc="2 queries"' in client.get("/items/1").headers["server-timing"]
+    assert "bcrypt;dur=" in client.post("/login").headers["server-timing"]
+```
+
+The benchmark below measures what the instrumentation adds to a request. It calls the same tiny app, with one SQL statement per request, directly through ASGI with and without the middleware, and takes the best of several rounds so that scheduler noise does not count. The difference must stay under 50 µs per request:
+
+```python
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI, Response
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from metrics import MetricsRegistry, instrument
+
+REQUESTS = 5_000
+ROUNDS = 5
+
+def _app(instrumented: bool):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    app = FastAPI()
+    if instrumented:
+        instrument(app, registry=MetricsRegistry(), server_timing=True)
+
+    @app.get("/ping/{n}")
+    async def ping(n: int):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return Response(b"pong")
+
+    return app
+
+async def _per_request(app):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            scope = {
+                "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+                "scheme": "http", "path": "/ping/1", "raw_path": b"/ping/1", "root_path": "",
+                "query_string": b"", "headers": [], "server": ("bench", 80), "client": ("bench", 1),
+            }
+            await app(scope, receive, send)
+        best = min(best, (time.perf_counter() - start) / REQUESTS)
+    return best
+
+@pytest.mark.perf
+def test_benchmark_instrumentation_overhead():
+    plain = asyncio.run(_per_request(_app(instrumented=False)))
+    instrumented = asyncio.run(_per_request(_app(instrumented=True)))
+    overhead = instrumented - plain
+    print(f"plain:        {plain * 1e6:.1f} µs/request")
+    print(f"instrumented: {instrumented * 1e6:.1f} µs/request (+{overhead * 1e6:.1f} µs)")
+    assert overhead < 50e-6
+```
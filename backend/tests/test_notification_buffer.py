@@ -0,0 +1,169 @@
+Here are unit tests for the write-behind notification buffer. They cover batching of concurrent submits, flushing on `max_rows`, backpressure, and flush-on-stop:
+
+```python
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+
+from notification_buffer import BufferFull, WriteBehindBuffer
+
+Base = declarative_base()
+
+class Row(Base):
+    __tablename__ = "notifications"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer)
+    message = Column(String)
+    read = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def make_sessions():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def count(sessions):
+    async with sessions() as session:
+        return await session.scalar(select(func.count()).select_from(Row))
+
+def test_concurrent_submits_share_one_flush():
+    async def scenario():
+        sessions = await make_sessions()
+        buffer = WriteBehindBuffer(Row, sessions, max_rows=100, max_delay=0.05)
+        await buffer.start()
+
+        rows = await asyncio.gather(
+            *(buffer.submit({"user_id": i, "message": f"message {i}"}) for i in range(10))
+        )
+        await buffer.stop()
+
+        assert buffer.flushes == 1
+        assert [row.message for row in rows] == [f"message {i}" for i in range(10)]
+        assert len({row.id for row in rows}) == 10
+        assert all(row.read is False and row.created_at is not None for row in rows)
+
+    run(scenario())
+
+def test_full_batch_flushes_without_waiting_for_the_delay():
+    async def scenario():
+        sessions = await make_sessions()
+        buffer = WriteBehindBuffer(Row, sessions, max_rows=3, max_delay=60)
+        await buffer.start()
+
+        rows = await asyncio.wait_for(
+            asyncio.gather(*(buffer.submit({"user_id": 1, "message": "Test"}) for _ in range(3))),
+            timeout=5,
+        )
+        await buffer.stop()
+
+        assert len(rows) == 3
+        assert buffer.flushes == 1
+
+    run(scenario())
+
+def test_submit_beyond_max_pending_is_rejected():
+    async def scenario():
+        sessions = await make_sessions()
+        buffer = WriteBehindBuffer(Row, sessions, max_rows=10, max_delay=60, max_pending=1)
+        await buffer.start()
+
+        first = asyncio.create_task(buffer.submit({"user_id": 1, "message": "first"}))
+        await asyncio.sleep(0)
+        with pytest.raises(BufferFull):
+            await buffer.submit({"user_id": 1, "message": "second"})
+
+        await buffer.stop()
+        assert (await first).message == "first"
+        assert await count(sessions) == 1
+
+    run(scenario())
+
+def test_stop_flushes_pending_rows():
+    async def scenario():
+        sessions = await make_sessions()
+        buffer = WriteBehindBuffer(Row, sessions, max_rows=100, max_delay=60)
+        await buffer.start()
+
+        pending = [asyncio.create_task(buffer.submit({"user_id": 1, "message": "Test"})) for _ in range(5)]
+        await asyncio.sleep(0)
+        await buffer.stop()
+
+        assert all(task.done() for task in pending)
+        assert await count(sessions) == 5
+        with pytest.raises(RuntimeError):
+            await buffer.submit({"user_id": 1, "message": "late"})
+
+    run(scenario())
+```
+
+The buffer is tested with its own small model on an in-memory database, so no application setup is needed. `NotificationDB` is written the same way.
+
+The benchmark below compares inserts/sec for 5,000 concurrent notifications. It runs once on the per-row path used by `create_notification` (add, commit, refresh) and once through the buffer, both on a SQLite file with the application's `NotificationDB` table:
+
+```python
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from main import Base, NotificationDB
+from notification_buffer import WriteBehindBuffer
+
+NOTIFICATIONS = 5_000
+
+async def _sessions(path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=20, max_overflow=0)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def _per_row(path):
+    engine, sessions = await _sessions(path)
+
+    async def create(i):
+        async with sessions() as session:
+            row = NotificationDB(task_id=1, user_id=i % 100, message=f"message {i}")
+            session.add(row)
+            await session.commit()
+            await session.refresh(row)
+            return row
+
+    start = time.perf_counter()
+    await asyncio.gather(*(create(i) for i in range(NOTIFICATIONS)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed
+
+async def _buffered(path):
+    engine, sessions = await _sessions(path)
+    buffer = WriteBehindBuffer(NotificationDB, sessions)
+    await buffer.start()
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(buffer.submit({"task_id": 1, "user_id": i % 100, "message": f"message {i}"}) for i in range(NOTIFICATIONS))
+    )
+    elapsed = time.perf_counter() - start
+    await buffer.stop()
+    await engine.dispose()
+    return elapsed
+
+@pytest.mark.perf
+def test_benchmark_buffered_ingest(tmp_path):
+    per_row = asyncio.run(_per_row(tmp_path / "per_row.db"))
+    buffered = asyncio.run(_buffered(tmp_path / "buffered.db"))
+    print(f"per-row:  {NOTIFICATIONS / per_row:,.0f} inserts/s")
+    print(f"buffered: {NOTIFICATIONS / buffered:,.0f} inserts/s")
+    assert buffered < per_row
+```
@@ -0,0 +1,123 @@
+Here are unit tests for the notification hub, covering fan-out to every stream of a user, isolation between users, unsubscribing, slow subscribers, and the broker contract:
+
+```python
+import asyncio
+
+import pytest
+
+from notification_hub import Broker, Event, InProcessBroker, Lagged, NotificationHub, RedisBroker
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_publish_fans_out_to_every_stream_of_the_user():
+    async def scenario():
+        hub = NotificationHub(broker=InProcessBroker())
+        await hub.start()
+        first, second = hub.subscribe(1), hub.subscribe(1)
+        other = hub.subscribe(2)
+
+        await hub.publish(1, 10, '{"message": "Test"}')
+
+        assert first.get_nowait() == Event(user_id=1, id=10, data='{"message": "Test"}')
+        assert second.get_nowait().id == 10
+        assert other.empty()
+
+    run(scenario())
+
+def test_unsubscribe_removes_the_stream():
+    async def scenario():
+        hub = NotificationHub(broker=InProcessBroker())
+        await hub.start()
+        queue = hub.subscribe(1)
+        hub.unsubscribe(1, queue)
+
+        await hub.publish(1, 10, "{}")
+
+        assert queue.empty()
+        assert hub.connection_count() == 0
+
+    run(scenario())
+
+def test_slow_subscriber_is_told_to_resume_from_the_database():
+    async def scenario():
+        hub = NotificationHub(broker=InProcessBroker(), queue_size=2)
+        await hub.start()
+        queue = hub.subscribe(1)
+
+        for event_id in (5, 6, 7):
+            await hub.publish(1, event_id, "{}")
+
+        # The backlog is replaced by a marker pointing just before the first dropped event
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == Lagged(after_id=4)
+
+    run(scenario())
+
+def test_brokers_must_implement_publish():
+    class Silent(Broker):
+        pass
+
+    with pytest.raises(TypeError):
+        Silent()
+
+def test_redis_broker_stops_without_starting():
+    run(RedisBroker("redis://localhost:6379/0").stop())
+```
+
+These tests drive the hub directly with the in-process broker. The SSE endpoint itself only adds formatting and the database backlog on top.
+
+The benchmark below opens 10,000 idle subscriptions on one hub, each held by a task waiting on its queue the way an idle stream does. It reports memory per connection and the publish-to-delivery latency for 1,000 notifications sent to random users:
+
+```python
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+from notification_hub import InProcessBroker, NotificationHub
+
+CONNECTIONS = 10_000
+PUBLISHES = 1_000
+
+async def _scenario():
+    hub = NotificationHub(broker=InProcessBroker())
+    await hub.start()
+    latencies = []
+
+    async def idle_stream(user_id):
+        queue = hub.subscribe(user_id)
+        try:
+            while True:
+                event = await queue.get()
+                latencies.append(time.perf_counter() - float(event.data))
+        finally:
+            hub.unsubscribe(user_id, queue)
+
+    tracemalloc.start()
+    streams = [asyncio.create_task(idle_stream(user_id)) for user_id in range(CONNECTIONS)]
+    await asyncio.sleep(0)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    for event_id in range(PUBLISHES):
+        await hub.publish(random.randrange(CONNECTIONS), event_id, str(time.perf_counter()))
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.1)
+
+    for stream in streams:
+        stream.cancel()
+    await asyncio.gather(*streams, return_exceptions=True)
+    return memory, latencies
+
+@pytest.mark.perf
+def test_benchmark_idle_connections_and_delivery_latency():
+    memory, latencies = asyncio.run(_scenario())
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{CONNECTIONS} idle connections: {memory / CONNECTIONS:.0f} bytes each")
+    print(f"publish-to-delivery p50: {quantiles[49] * 1e6:.0f} µs, p99: {quantiles[98] * 1e6:.0f} µs")
+    assert len(latencies) == PUBLISHES
+```
@@ -0,0 +1,161 @@
+Here are unit tests for the notification retention worker. They cover archiving in batches, delete mode, leaving unread and recent notifications alone, and running alongside new inserts:
+
+```python
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from main import Base, NotificationArchiveDB, NotificationDB
+from notification_retention import RetentionWorker
+
+OLD = datetime.utcnow() - timedelta(days=90)
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def make_sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'retention.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def seed(sessions):
+    async with sessions() as session:
+        session.add_all(
+            [NotificationDB(task_id=1, user_id=1, message=f"old {i}", read=True, created_at=OLD) for i in range(25)]
+            + [NotificationDB(task_id=1, user_id=1, message="old unread", read=False, created_at=OLD) for _ in range(5)]
+            + [NotificationDB(task_id=1, user_id=1, message="recent", read=True) for _ in range(5)]
+        )
+        await session.commit()
+
+async def count(sessions, model):
+    async with sessions() as session:
+        return await session.scalar(select(func.count()).select_from(model))
+
+def test_archives_expired_read_notifications_in_batches(tmp_path):
+    async def scenario():
+        sessions = await make_sessions(tmp_path)
+        await seed(sessions)
+        worker = RetentionWorker(NotificationDB, NotificationArchiveDB, sessions, max_age=timedelta(days=30), batch_size=10)
+
+        report = await worker.run_once()
+
+        assert (report.rows, report.batches) == (25, 3)
+        assert report.seconds > 0
+        assert worker.last_report is report
+        assert await count(sessions, NotificationDB) == 10
+        assert await count(sessions, NotificationArchiveDB) == 25
+        async with sessions() as session:
+            archived = (await session.scalars(select(NotificationArchiveDB.message))).all()
+        assert all(message.startswith("old ") for message in archived)
+
+        # Nothing left to do on the next run
+        assert (await worker.run_once()).rows == 0
+
+    run(scenario())
+
+def test_delete_mode_skips_the_archive(tmp_path):
+    async def scenario():
+        sessions = await make_sessions(tmp_path)
+        await seed(sessions)
+        worker = RetentionWorker(
+            NotificationDB, NotificationArchiveDB, sessions, max_age=timedelta(days=30), archive=False
+        )
+
+        assert (await worker.run_once()).rows == 25
+        assert await count(sessions, NotificationDB) == 10
+        assert await count(sessions, NotificationArchiveDB) == 0
+
+    run(scenario())
+
+def test_runs_alongside_inserts_and_other_workers(tmp_path):
+    async def scenario():
+        sessions = await make_sessions(tmp_path)
+        await seed(sessions)
+        workers = [
+            RetentionWorker(NotificationDB, NotificationArchiveDB, sessions, max_age=timedelta(days=30), batch_size=5)
+            for _ in range(2)
+        ]
+
+        async def insert(i):
+            async with sessions() as session:
+                session.add(NotificationDB(task_id=1, user_id=2, message=f"new {i}"))
+                await session.commit()
+
+        reports = await asyncio.gather(*(w.run_once() for w in workers), *(insert(i) for i in range(20)))
+
+        # Every expired row was archived exactly once, and no new row was touched
+        assert reports[0].rows + reports[1].rows == 25
+        assert await count(sessions, NotificationArchiveDB) == 25
+        assert await count(sessions, NotificationDB) == 10 + 20
+
+    run(scenario())
+```
+
+Each test uses its own SQLite file, so concurrent sessions really do contend for the database, just as they would in production.
+
+The benchmark below grows one user's read history in steps of 5,000 old notifications. After each step it measures the median latency of `GET /notifications/{user_id}`, once with the retention worker running after every step and once without it. Without retention, latency grows with the history. With retention it stays flat:
+
+```python
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from main import Base, NotificationArchiveDB, NotificationDB, app, get_session
+from notification_retention import RetentionWorker
+
+STEPS = 5
+HISTORY_PER_STEP = 5_000
+USER_ID = 1
+
+async def _listing_latencies(path, retention: bool):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_session():
+        async with sessions() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    worker = RetentionWorker(NotificationDB, NotificationArchiveDB, sessions, max_age=timedelta(days=30))
+    old = datetime.utcnow() - timedelta(days=90)
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for step in range(STEPS):
+            async with sessions() as session:
+                session.add_all(
+                    NotificationDB(task_id=1, user_id=USER_ID, message="old", read=True, created_at=old)
+                    for _ in range(HISTORY_PER_STEP)
+                )
+                session.add(NotificationDB(task_id=1, user_id=USER_ID, message=f"fresh {step}"))
+                await session.commit()
+            if retention:
+                await worker.run_once()
+            samples = []
+            for _ in range(20):
+                start = time.perf_counter()
+                response = await client.get(f"/notifications/{USER_ID}")
+                samples.append(time.perf_counter() - start)
+                assert response.status_code == 200
+            latencies.append(statistics.median(samples))
+    await engine.dispose()
+    return latencies
+
+@pytest.mark.perf
+def test_benchmark_listing_latency_with_retention(tmp_path):
+    without = asyncio.run(_listing_latencies(tmp_path / "without.db", retention=False))
+    with_retention = asyncio.run(_listing_latencies(tmp_path / "with.db", retention=True))
+    for step, (a, b) in enumerate(zip(without, with_retention), start=1):
+        print(f"{step * HISTORY_PER_STEP:>6} old rows: without {a * 1000:.1f} ms, with retention {b * 1000:.1f} ms")
+    assert with_retention[-1] < with_retention[0] * 1.5
+```
@@ -1,17 +1,34 @@
 Here are the unit tests that cover success cases, error cases, data validation, and edge cases:
 
 ```python
+import asyncio
+from types import SimpleNamespace
+
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 import pytest
 
-from main import app, Base, NotificationDB
+import fastjson
+import main
+from main import app, Base, NotificationDB, format_sse, get_session, hub
+from notification_hub import Event
 
 engine = create_engine("sqlite:///./test.db")
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base.metadata.create_all(bind=engine)
 
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+async def override_get_session():
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
+app.dependency_overrides[get_session] = override_get_session
+
 client = TestClient(app)
 
 def test_create_notification():
@@ -30,6 +47,16 @@ def test_create_notification():
     response = client.post("/notifications/", json={"task_id": "invalid", "user_id": 1, "message": "Test"})
     assert response.status_code == 422
 
+def test_create_notification_without_startup():
+    # This module's client never runs the startup hook, so the hub was never started
+    queue = hub.subscribe(1)
+    try:
+        response = client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": "Test"})
+        assert response.status_code == 200
+        assert queue.get_nowait().id == response.json()["id"]
+    finally:
+        hub.unsubscribe(1, queue)
+
 def test_read_notifications():
     # Test normal case
     response = client.get("/notifications/1")
@@ -58,6 +85,197 @@ def test_mark_notification_as_read():
     response = client.put("/notifications/999")
     assert response.status_code == 404
 
+def test_read_notifications_unread_only_and_paging():
+    ids = [
+        client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": f"Test {i}"}).json()["id"]
+        for i in range(3)
+    ]
+    client.put(f"/notifications/{ids[0]}")
+
+    # Test unread only
+    response = client.get("/notifications/1", params={"unread_only": True})
+    assert [n["id"] for n in response.json()] == ids[1:]
+
+    # Test paging with since_id as the cursor
+    response = client.get("/notifications/1", params={"limit": 2})
+    assert [n["id"] for n in response.json()] == ids[:2]
+    response = client.get("/notifications/1", params={"limit": 2, "since_id": ids[1]})
+    assert [n["id"] for n in response.json()] == ids[2:]
+
+    # Test limit validation
+    response = client.get("/notifications/1", params={"limit": 0})
+    assert response.status_code == 422
+
+def test_read_unread_count():
+    for i in range(3):
+        client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": f"Test {i}"})
+    client.post("/notifications/", json={"task_id": 1, "user_id": 2, "message": "Other user"})
+    first_id = client.get("/notifications/1").json()[0]["id"]
+    client.put(f"/notifications/{first_id}")
+
+    response = client.get("/notifications/1/unread_count")
+    assert response.status_code == 200
+    assert response.json() == {"user_id": 1, "unread": 2}
+
+def test_mark_all_notifications_as_read():
+    for i in range(3):
+        client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": f"Test {i}"})
+    client.post("/notifications/", json={"task_id": 1, "user_id": 2, "message": "Other user"})
+
+    response = client.put("/notifications/1/read-all")
+    assert response.status_code == 200
+    assert response.json() == {"user_id": 1, "updated": 3}
+    assert client.get("/notifications/2/unread_count").json()["unread"] == 1
+
+    # Test that already read notifications are not counted again
+    response = client.put("/notifications/1/read-all")
+    assert response.json()["updated"] == 0
+
+def test_mark_as_read_racing_read_all():
+    created = client.post("/notifications/", json={"task_id": 1, "user_id": 55, "message": "Race"}).json()
+    db = TestingSessionLocal()
+    try:
+        # Loaded as PUT /notifications/{id} loads it, then read-all commits in between
+        notification = db.get(NotificationDB, created["id"])
+        assert client.put("/notifications/55/read-all").json()["updated"] == 1
+        notification.read = True
+        db.commit()  # last writer wins: no stale-version error
+        assert notification.revision == 3
+    finally:
+        db.close()
+    assert client.put(f"/notifications/{created['id']}").status_code == 200
+
+def test_mark_notifications_as_read_batch():
+    ids = [
+        client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": f"Test {i}"}).json()["id"]
+        for i in range(4)
+    ]
+
+    # Test list of ids
+    response = client.put("/notifications/1/read", json={"ids": [ids[0], 999999]})
+    assert response.json() == {"user_id": 1, "updated": 1}
+
+    # Test watermark
+    response = client.put("/notifications/1/read", json={"up_to_id": ids[2]})
+    assert response.json() == {"user_id": 1, "updated": 2}
+    assert client.get("/notifications/1/unread_count").json()["unread"] == 1
+
+    # Test invalid selection
+    response = client.put("/notifications/1/read", json={"ids": [ids[3]], "up_to_id": ids[3]})
+    assert response.status_code == 422
+    response = client.put("/notifications/1/read", json={})
+    assert response.status_code == 422
+
+def test_read_notifications_fast_json(monkeypatch):
+    client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": "Test"})
+    expected = client.get("/notifications/1")
+    monkeypatch.setattr(fastjson, "FAST_JSON", True)
+    response = client.get("/notifications/1")
+    assert response.json() == expected.json()
+    assert response.headers["ETag"] == expected.headers["ETag"]
+
+def test_format_sse():
+    assert format_sse(7, '{"message": "Test"}') == 'id: 7\nevent: notification\ndata: {"message": "Test"}\n\n'
+
+def test_stream_backlog_is_read_in_pages(monkeypatch):
+    # A fresh engine: asyncio.run below starts a loop of its own
+    session_factory = async_sessionmaker(
+        create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool), expire_on_commit=False
+    )
+    monkeypatch.setattr(main, "SessionLocal", session_factory)
+    monkeypatch.setattr(main, "RESUME_PAGE_SIZE", 2)
+    ids = [
+        client.post("/notifications/", json={"task_id": 1, "user_id": 77, "message": f"Backlog {i}"}).json()["id"]
+        for i in range(5)
+    ]
+
+    async def collect():
+        return [notification.id async for notification in main.backlog_after(77, ids[0] - 1)]
+
+    assert asyncio.run(collect()) == ids
+
+def test_stream_delivers_out_of_order_live_events(monkeypatch):
+    async def backlog(user_id, after_id):
+        for event_id in (11, 12):
+            yield SimpleNamespace(id=event_id, json=lambda: "{}")
+
+    monkeypatch.setattr(main, "backlog_after", backlog)
+
+    async def scenario():
+        response = await main.stream_notifications(88, last_event_id=10)
+        body = response.body_iterator
+        # The replay runs after subscribing, so the hub reaches this stream from here on
+        chunks = [await body.__anext__() for _ in range(2)]
+        # 12 was replayed already; 13 and 14 were committed before 15 but published after it
+        for event_id in (12, 15, 13, 14):
+            hub.deliver(Event(user_id=88, id=event_id, data="{}"))
+        chunks += [await body.__anext__() for _ in range(3)]
+        await body.aclose()
+        return [chunk.split("\n", 1)[0] for chunk in chunks]
+
+    assert asyncio.run(scenario()) == ["id: 11", "id: 12", "id: 15", "id: 13", "id: 14"]
+    assert hub.connection_count() == 0
+
+def test_read_notifications_not_modified():
+    client.post("/notifications/", json={"task_id": 1, "user_id": 1, "message": "Test"})
+    response = client.get("/notifications/1")
+    etag = response.headers["ETag"]
+    assert "Last-Modified" in response.headers
+
+    # Test unchanged list
+    response = client.get("/notifications/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Test that marking a notification as read changes the ETag
+    notification_id = client.get("/notifications/1").json()[0]["id"]
+    client.put(f"/notifications/{notification_id}")
+    response = client.get("/notifications/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def test_broadcast_notification_to_user_ids():
+    response = client.post(
+        "/notifications/broadcast", json={"task_id": 1, "message": "Deadline moved", "user_ids": [1, 2, 2, 3]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"task_id": 1, "recipients": 3}
+    for user_id in (1, 2, 3):
+        notifications = client.get(f"/notifications/{user_id}").json()
+        assert [n["message"] for n in notifications] == ["Deadline moved"]
+
+def test_broadcast_notification_to_task_audience():
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS tasks (id INTEGER PRIMARY KEY, owner_id INTEGER)"))
+        conn.execute(text("CREATE TABLE IF NOT EXISTS comments (id INTEGER PRIMARY KEY, task_id INTEGER, author_id INTEGER)"))
+        conn.execute(text("INSERT INTO tasks (id, owner_id) VALUES (7, 1)"))
+        conn.execute(
+            text("INSERT INTO comments (task_id, author_id) VALUES (7, 2), (7, 2), (7, 1), (7, NULL), (8, 3)")
+        )
+    try:
+        response = client.post(
+            "/notifications/broadcast",
+            json={"task_id": 7, "message": "Task closed", "audience": "task_owner_and_commenters"},
+        )
+        assert response.json() == {"task_id": 7, "recipients": 2}
+        assert client.get("/notifications/3/unread_count").json()["unread"] == 0
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE tasks"))
+            conn.execute(text("DROP TABLE comments"))
+
+def test_broadcast_notification_invalid_audience():
+    # Test both selectors
+    response = client.post(
+        "/notifications/broadcast",
+        json={"task_id": 1, "message": "Test", "user_ids": [1], "audience": "task_owner_and_commenters"},
+    )
+    assert response.status_code == 422
+
+    # Test no selector
+    response = client.post("/notifications/broadcast", json={"task_id": 1, "message": "Test"})
+    assert response.status_code == 422
+
 @pytest.fixture(autouse=True, scope="function")
 def clean_up():
     yield
@@ -69,4 +287,84 @@ def clean_up():
     finally:
         session.close()
 ```
-These tests will cover the normal cases for each endpoint, cases where invalid data is passed, and cases where the requested resource does not exist. The fixture at the end ensures that the database is cleaned up after each test so that the tests do not interfere with each other. Please replace the `main` in the import statement with your actual Python file name.
\ No newline at end of file
+These tests will cover the normal cases for each endpoint, cases where invalid data is passed, and cases where the requested resource does not exist. The fixture at the end ensures that the database is cleaned up after each test so that the tests do not interfere with each other. The `get_session` dependency is overridden so that the endpoints use the same SQLite file through an async engine. Please replace the `main` in the import statement with your actual Python file name.
+
+The following benchmark measures p99 latency for 500 concurrent readers. The "before" case mounts the old blocking handler (a shared synchronous session inside an `async def`) next to the async one, so both run against the same data:
+
+```python
+import asyncio
+import statistics
+import time
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from main import app, Base, NotificationDB
+
+CONCURRENCY = 500
+USER_ID = 1
+
+sync_engine = create_engine("sqlite:///./notifications.db")
+blocking_session = sessionmaker(bind=sync_engine)()
+
+@app.get("/bench/blocking/notifications/{user_id}")
+async def read_notifications_blocking(user_id: int):
+    # Mirrors the previous implementation: one global session, blocking calls on the event loop
+    return blocking_session.query(NotificationDB).filter(NotificationDB.user_id == user_id).all()
+
+def _p99(samples):
+    return statistics.quantiles(samples, n=100)[98]
+
+async def _run_readers(path):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def read():
+            start = time.perf_counter()
+            response = await client.get(path)
+            assert response.status_code == 200
+            return time.perf_counter() - start
+
+        return await asyncio.gather(*(read() for _ in range(CONCURRENCY)))
+
+@pytest.mark.perf
+def test_benchmark_concurrent_readers():
+    Base.metadata.create_all(bind=sync_engine)
+    blocking_session.add_all(
+        NotificationDB(task_id=i, user_id=USER_ID, message=f"notification {i}") for i in range(200)
+    )
+    blocking_session.commit()
+
+    before = asyncio.run(_run_readers(f"/bench/blocking/notifications/{USER_ID}"))
+    after = asyncio.run(_run_readers(f"/notifications/{USER_ID}"))
+
+    print(f"blocking session p99: {_p99(before) * 1000:.1f} ms")
+    print(f"async session p99: {_p99(after) * 1000:.1f} ms")
+```
+
+The next benchmark broadcasts one notification to 50,000 users in a single request, and checks that the set-based insert stays under a second:
+
+```python
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+RECIPIENTS = 50_000
+
+@pytest.mark.perf
+def test_benchmark_broadcast_50k_recipients():
+    client = TestClient(app)
+    payload = {"task_id": 1, "message": "Release is out", "user_ids": list(range(1, RECIPIENTS + 1))}
+
+    start = time.perf_counter()
+    response = client.post("/notifications/broadcast", json=payload)
+    elapsed = time.perf_counter() - start
+
+    assert response.json()["recipients"] == RECIPIENTS
+    print(f"broadcast to {RECIPIENTS} users: {elapsed * 1000:.0f} ms")
+    assert elapsed < 1.0
+```
@@ -0,0 +1,141 @@
+Here are tests for the sampling profiler. They cover the wall and CPU modes, the SQL statement ranking, and the endpoint's token check and output formats:
+
+```python
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+import profiler
+from profiler import SamplingProfiler, add_profiler
+
+def spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+def idle(seconds):
+    time.sleep(seconds)
+
+def run_threads(*targets):
+    threads = [threading.Thread(target=fn, args=(0.3,), name=fn.__name__) for fn in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def stacks_of(sampler, thread_name):
+    return {stack: count for stack, count in sampler.stacks.items() if stack.startswith(thread_name + ";")}
+
+def test_wall_mode_samples_running_and_waiting_threads():
+    sampler = SamplingProfiler("wall", interval=0.005)
+    sampler.start()
+    run_threads(spin, idle)
+    sampler.stop()
+
+    assert sampler.samples > 10
+    assert any("spin (test_profiler.py" in stack for stack in stacks_of(sampler, "spin"))
+    assert stacks_of(sampler, "idle")
+    for line in sampler.collapsed().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+
+@pytest.mark.skipif(not hasattr(time, "pthread_getcpuclockid"), reason="needs per-thread CPU clocks")
+def test_cpu_mode_skips_waiting_threads():
+    sampler = SamplingProfiler("cpu", interval=0.005)
+    sampler.start()
+    run_threads(spin, idle)
+    sampler.stop()
+
+    assert sum(stacks_of(sampler, "spin").values()) > 100_000  # microseconds
+    assert not stacks_of(sampler, "idle")
+
+def test_top_statements_are_ranked_by_time():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    sampler = SamplingProfiler(interval=0.05)
+    sampler.start()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        for _ in range(3):
+            conn.execute(text("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 20000) SELECT count(*) FROM n"))
+    sampler.stop()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 2"))  # after stop: not recorded
+
+    top = sampler.top_statements()
+    assert top[0]["statement"].startswith("WITH RECURSIVE") and top[0]["count"] == 3
+    assert [entry["statement"] for entry in top[1:]] == ["SELECT 1"]
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", "secret")
+    app = FastAPI()
+    add_profiler(app)
+    return TestClient(app)
+
+def test_endpoint_is_disabled_without_a_token(client, monkeypatch):
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", None)
+    assert client.post("/debug/profile?seconds=0.05").status_code == 404
+
+def test_endpoint_requires_the_token(client):
+    assert client.post("/debug/profile?seconds=0.05").status_code == 403
+    response = client.post("/debug/profile?seconds=0.05", headers={"X-Profiler-Token": "wrong"})
+    assert response.status_code == 403
+
+def test_endpoint_returns_stacks_and_sql(client):
+    response = client.post(
+        "/debug/profile?seconds=0.1&interval_ms=5", headers={"X-Profiler-Token": "secret"}
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["mode"] == "wall"
+    assert report["samples"] > 0
+    assert report["collapsed"].endswith("\n")
+    assert report["top_sql"] == []
+
+def test_endpoint_collapsed_format(client):
+    response = client.post(
+        "/debug/profile?seconds=0.05&format=collapsed", headers={"X-Profiler-Token": "secret"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'filename="profile-wall.folded"' in response.headers["content-disposition"]
+```
+
+Each test starts its own threads, so their stacks can be found by thread name among whatever else the test process is running.
+
+The benchmark below runs the same CPU-bound loop with and without a wall-clock profile at the default 10 ms interval, and checks that profiling slows it down by less than 5%:
+
+```python
+import time
+
+import pytest
+
+from profiler import SamplingProfiler
+
+ROUNDS = 5
+
+def _work():
+    start = time.perf_counter()
+    total = 0
+    for i in range(2_000_000):
+        total += i % 7
+    return time.perf_counter() - start
+
+@pytest.mark.perf
+def test_benchmark_profiler_overhead():
+    plain = min(_work() for _ in range(ROUNDS))
+    sampler = SamplingProfiler("wall")
+    sampler.start()
+    profiled = min(_work() for _ in range(ROUNDS))
+    sampler.stop()
+    print(f"plain:    {plain * 1000:.1f} ms")
+    print(f"profiled: {profiled * 1000:.1f} ms ({sampler.samples} samples)")
+    assert profiled < plain * 1.05
+```
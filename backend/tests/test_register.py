@@ -4,6 +4,8 @@ Here are comprehensive unit tests for the FastAPI endpoints:
 from fastapi.testclient import TestClient
 import pytest
 
+import main
+
 client = TestClient(app)
 
 def test_register_new_user():
@@ -54,6 +56,39 @@ def test_login_no_password():
     response = client.post("/login", data=login_data)
     assert response.status_code == 422
     assert "field required" in str(response.json())
+
+def test_login_returns_signed_token():
+    login_data = {"username": "testuser", "password": "testpassword"}
+    response = client.post("/login", data=login_data)
+    token = response.json()["access_token"]
+    assert response.json()["token_type"] == "bearer"
+    user = main.verify_access_token(token)
+    assert user.username == "testuser"
+
+def test_tampered_token_rejected():
+    login_data = {"username": "testuser", "password": "testpassword"}
+    token = client.post("/login", data=login_data).json()["access_token"]
+    response = client.post("/logout", headers={"Authorization": f"Bearer {token[:-2]}xx"})
+    assert response.status_code == 401
+
+def test_logout_revokes_token():
+    login_data = {"username": "testuser", "password": "testpassword"}
+    token = client.post("/login", data=login_data).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    response = client.post("/logout", headers=headers)
+    assert response.status_code == 204
+    response = client.post("/logout", headers=headers)
+    assert response.status_code == 401
+
+def test_login_hash_pool_saturated(monkeypatch):
+    def saturated(fn, *args):
+        raise main.HashPoolSaturated()
+
+    monkeypatch.setattr(main, "_run_in_hash_pool", saturated)
+    login_data = {"username": "testuser", "password": "testpassword"}
+    response = client.post("/login", data=login_data)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
 ```
 
 These tests cover the following scenarios:
@@ -65,4 +100,100 @@ These tests cover the following scenarios:
 5. Login with valid credentials successfully
 6. Attempt to login with a non-existing username (error case)
 7. Attempt to login with a wrong password (error case)
-8. Attempt to login without providing a password (edge case)
\ No newline at end of file
+8. Attempt to login without providing a password (edge case)
+9. Login returns a signed token that verifies to the right user
+10. A tampered token is rejected (error case)
+11. Logging out revokes the token (edge case)
+12. Login while the hashing pool is saturated returns 503 (load shedding)
+
+The load test below fires a burst of concurrent logins and, at the same time, calls a cheap unrelated endpoint. It reports login throughput, how many logins were shed with 503, and the p99 latency of the unrelated endpoint:
+
+```python
+import asyncio
+import statistics
+import time
+
+import httpx
+import pytest
+
+from main import app
+
+LOGINS = 200
+PINGS = 200
+
+@app.get("/bench/ping")
+def ping():
+    return {"ok": True}
+
+async def _burst():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post(
+            "/register",
+            json={"username": "loaduser", "email": "loaduser@example.com", "password": "loadpassword"},
+        )
+
+        async def login():
+            response = await client.post("/login", data={"username": "loaduser", "password": "loadpassword"})
+            return response.status_code
+
+        async def timed_ping():
+            await asyncio.sleep(0.001)
+            start = time.perf_counter()
+            await client.get("/bench/ping")
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        logins = asyncio.gather(*(login() for _ in range(LOGINS)))
+        pings = asyncio.gather(*(timed_ping() for _ in range(PINGS)))
+        statuses, ping_latencies = await asyncio.gather(logins, pings)
+        return statuses, ping_latencies, time.perf_counter() - start
+
+@pytest.mark.perf
+def test_benchmark_login_burst():
+    statuses, ping_latencies, elapsed = asyncio.run(_burst())
+    succeeded = statuses.count(200)
+    print(f"logins/s: {succeeded / elapsed:.1f} ({statuses.count(503)} shed with 503)")
+    print(f"unrelated endpoint p99: {statistics.quantiles(ping_latencies, n=100)[98] * 1000:.1f} ms")
+    assert set(statuses) <= {200, 503}
+```
+
+The microbenchmark below measures per-request authentication overhead: a token seen for the first time (signature check), a recently verified token (LRU hit), and, for comparison, the per-request user lookup that an id-as-token scheme needs:
+
+```python
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import main
+
+ITERATIONS = 10_000
+
+def _per_call(fn):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) / ITERATIONS
+
+@pytest.mark.perf
+def test_benchmark_auth_overhead(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    main.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    user = main.UserDB(email="bench@example.com", username="bench", hashed_password="x")
+    db.add(user)
+    db.commit()
+
+    tokens = [main.create_access_token(user) for _ in range(ITERATIONS)]
+    fresh = iter(tokens)
+    cold = _per_call(lambda: main.verify_access_token(next(fresh)))
+    warm = _per_call(lambda: main.verify_access_token(tokens[0]))
+    lookup = _per_call(lambda: main.get_user(db, "bench"))
+
+    print(f"signature check: {cold * 1e6:.1f} µs")
+    print(f"cached token: {warm * 1e6:.1f} µs")
+    print(f"database user lookup: {lookup * 1e6:.1f} µs")
+    assert warm < cold
+```
@@ -25,10 +25,34 @@ def test_update_task_status_extra_data():
     response = client.patch("/tasks/1", json={"status": True, "extra": "data"})
     assert response.status_code == 422
     assert "extra fields not permitted" in response.json()["detail"][0]["msg"]
+
+def test_update_task_status_invalidates_cache():
+    client.get("/tasks/1")  # populate the cache
+    response = client.patch("/tasks/1", json={"status": True})
+    assert response.status_code == 200
+    response = client.get("/tasks/1")
+    assert response.json()["status"] is True
+
+def test_update_task_status_changes_task_etag():
+    import tasks
+
+    tasks_client = TestClient(tasks.app)
+    current = client.get("/tasks/1").json()["status"]
+    etag = tasks_client.get("/tasks/1").headers["ETag"]
+
+    response = client.patch("/tasks/1", json={"status": not current})
+    assert response.status_code == 200
+
+    # The tasks API must not answer 304 with the old status
+    response = tasks_client.get("/tasks/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["status"] is (not current)
 ```
 
 In `test_track_task_status_not_found` and `test_update_task_status_not_found`, we're testing that the endpoints return a 404 status code when a task with the specified ID doesn't exist.
 
 In `test_update_task_status_invalid_data`, `test_update_task_status_missing_data`, and `test_update_task_status_extra_data`, we're testing the endpoint's data validation. It should return a 422 status code when the request body contains invalid data, missing data, or extra data, respectively.
 
+`test_update_task_status_invalidates_cache` checks that a status change is visible on the next read, even though reads are served from the status cache. `test_update_task_status_changes_task_etag` checks that a conditional GET on the tasks API sees the change.
+
 Please note that these tests assume that the database is in a certain state (e.g., task with ID 1 exists, task with ID 999 doesn't exist). You may need to adjust the test setup to ensure that these conditions are met, or use a library like Factory Boy to create the necessary data for each test.
\ No newline at end of file
@@ -4,9 +4,21 @@ Here are the comprehensive unit tests for the FastAPI endpoints:
 from fastapi.testclient import TestClient
 from main import app
 from datetime import datetime
+from types import SimpleNamespace
+import fastjson
+import pytest
+import profiler
+import register
+from register import create_access_token
 
 client = TestClient(app)
 
+def bearer(user_id=1, username="tester"):
+    token = create_access_token(SimpleNamespace(id=user_id, username=username))
+    return {"Authorization": f"Bearer {token}"}
+
+AUTH = bearer()
+
 # Test Creating Task
 def test_create_task():
     response = client.post(
@@ -19,10 +31,44 @@ def test_create_task():
             "status": False,
             "owner_id": 1,
         },
+        headers=AUTH,
     )
     assert response.status_code == 200
     assert response.json()["title"] == "test task"
 
+# Test Creating Task Without A Token
+def test_create_task_unauthenticated():
+    task = {
+        "title": "test task",
+        "description": "test description",
+        "due_date": datetime.now().isoformat(),
+        "priority": 1,
+        "status": False,
+    }
+    response = client.post("/tasks/", json=task)
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    response = client.post("/tasks/", json=task, headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401
+
+# Test Logout Revokes The Token
+def test_logout_revokes_token():
+    headers = bearer()
+    task = {
+        "title": "test task",
+        "description": "test description",
+        "due_date": datetime.now().isoformat(),
+        "priority": 1,
+        "status": False,
+    }
+    assert client.post("/tasks/", json=task, headers=headers).status_code == 200
+
+    response = TestClient(register.app).post("/logout", headers=headers)
+    assert response.status_code == 204
+
+    assert client.post("/tasks/", json=task, headers=headers).status_code == 401
+
 # Test Creating Task with Invalid Data
 def test_create_task_invalid_data():
     response = client.post(
@@ -35,6 +81,7 @@ def test_create_task_invalid_data():
             "status": False,
             "owner_id": 1,
         },
+        headers=AUTH,
     )
     assert response.status_code == 422
 
@@ -44,12 +91,129 @@ def test_read_tasks():
     assert response.status_code == 200
     assert isinstance(response.json(), list)
 
+# Test Filtering And Sorting Tasks
+def test_read_tasks_filtered_and_sorted():
+    response = client.get(
+        "/tasks/",
+        params={"status": False, "priority_min": 1, "priority_max": 3, "sort": "-priority"},
+    )
+    assert response.status_code == 200
+    tasks = response.json()
+    assert all(1 <= task["priority"] <= 3 and task["status"] is False for task in tasks)
+    assert [task["priority"] for task in tasks] == sorted((task["priority"] for task in tasks), reverse=True)
+
+# Test Fast JSON Path Matches The Default Response
+def test_read_tasks_fast_json(monkeypatch):
+    expected = client.get("/tasks/").json()
+    monkeypatch.setattr(fastjson, "FAST_JSON", True)
+    response = client.get("/tasks/")
+    assert response.status_code == 200
+    assert response.json() == expected
+
+# Test Sparse Fieldsets
+def test_read_tasks_fields():
+    response = client.get("/tasks/", params={"fields": "id,title,status,due_date"})
+    assert response.status_code == 200
+    for task in response.json():
+        assert set(task) == {"id", "title", "status", "due_date"}
+
+# Test Sparse Fieldsets With Cursor Pagination
+def test_read_tasks_fields_cursor():
+    response = client.get("/tasks/", params={"fields": "title", "cursor": "", "limit": 1})
+    assert response.status_code == 200
+    page = response.json()
+    assert all(set(task) == {"title"} for task in page["items"])
+    assert "next_cursor" in page
+
+# Test Sparse Fieldsets With An Unknown Field
+def test_read_tasks_unknown_field():
+    response = client.get("/tasks/", params={"fields": "id,hashed_password"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Unknown fields: hashed_password"}
+
+# Test Sorting With An Unknown Key
+def test_read_tasks_invalid_sort():
+    response = client.get("/tasks/", params={"sort": "title"})
+    assert response.status_code == 422
+
+# Test Sorting Combined With A Cursor
+def test_read_tasks_sort_with_cursor():
+    response = client.get("/tasks/", params={"sort": "priority", "cursor": ""})
+    assert response.status_code == 400
+
+# Test Reading Tasks With Cursor Pagination
+def test_read_tasks_cursor():
+    response = client.get("/tasks/", params={"cursor": "", "limit": 1})
+    assert response.status_code == 200
+    page = response.json()
+    assert isinstance(page["items"], list)
+    assert "next_cursor" in page
+
+    if page["next_cursor"]:
+        response = client.get("/tasks/", params={"cursor": page["next_cursor"], "limit": 1})
+        assert response.status_code == 200
+        assert response.json()["items"][0]["id"] != page["items"][0]["id"]
+
+# Test Reading Tasks With An Out Of Range Limit
+def test_read_tasks_invalid_limit():
+    for limit in (0, -1, 1001):
+        response = client.get("/tasks/", params={"cursor": "", "limit": limit})
+        assert response.status_code == 422
+
+# Test Reading Tasks With Invalid Cursor
+def test_read_tasks_invalid_cursor():
+    response = client.get("/tasks/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+
+# Test Searching Tasks
+def test_search_tasks():
+    client.post(
+        "/tasks/",
+        json={
+            "title": "quarterly zebra report",
+            "description": "count the zebras",
+            "due_date": datetime.now().isoformat(),
+            "priority": 1,
+            "status": False,
+        },
+        headers=AUTH,
+    )
+    response = client.get("/tasks/search", params={"q": "zebra"})
+    assert response.status_code == 200
+    assert response.json()[0]["title"] == "quarterly zebra report"
+
+# Test Searching With Query Syntax Characters
+def test_search_tasks_escapes_query_syntax():
+    response = client.get("/tasks/search", params={"q": 'zebra" OR NEAR(*'})
+    assert response.status_code == 200
+
+# Test Searching Without A Query
+def test_search_tasks_requires_query():
+    response = client.get("/tasks/search")
+    assert response.status_code == 422
+
 # Test Reading Task
 def test_read_task():
     response = client.get("/tasks/1")
     assert response.status_code == 200
     assert "title" in response.json()
 
+# Test Conditional Read Of A Task
+def test_read_task_not_modified():
+    response = client.get("/tasks/1")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert "Last-Modified" in response.headers
+
+    response = client.get("/tasks/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.get("/tasks/1", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+
 # Test Reading Non-Existent Task
 def test_read_non_existent_task():
     response = client.get("/tasks/1000000")
@@ -70,6 +234,39 @@ def test_update_task():
     assert response.status_code == 200
     assert response.json()["title"] == "updated test task"
 
+# Test Updating A Task Keeps Cache, Search, Change Log And Summary In Step
+def test_update_task_side_effects():
+    task = {
+        "title": "unpatched kiwi",
+        "description": "patch description",
+        "due_date": datetime.now().isoformat(),
+        "priority": 1,
+        "status": True,
+    }
+    task_id = client.post("/tasks/", json=task, headers=AUTH).json()["id"]
+    client.get(f"/tasks/{task_id}")  # populate the cache
+    since = client.get("/tasks/changes", params={"since": 0, "limit": 5000}).json()["next_since"]
+    summary = client.get("/users/1/task-summary").json()
+
+    response = client.patch(f"/tasks/{task_id}", json=dict(task, title="patched kiwi", status=False))
+    assert response.status_code == 200
+    assert response.json()["status"] is False
+
+    assert client.get(f"/tasks/{task_id}").json()["title"] == "patched kiwi"
+    assert [t["id"] for t in client.get("/tasks/search", params={"q": "patched kiwi"}).json()] == [task_id]
+    changes = client.get("/tasks/changes", params={"since": since}).json()["items"]
+    assert [c["fields"] for c in changes if c["task_id"] == task_id] == [{"title": "patched kiwi", "status": False}]
+    after = client.get("/users/1/task-summary").json()
+    assert (after["open"], after["done"]) == (summary["open"] + 1, summary["done"] - 1)
+
+# Test Task Summary Reconcile Is Ops-Only
+def test_reconcile_task_summary_requires_the_profiler_token(monkeypatch):
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", "secret")
+    assert client.post("/task-summary/reconcile", headers=AUTH).status_code == 403
+    response = client.post("/task-summary/reconcile", headers={"X-Profiler-Token": "secret"})
+    assert response.status_code == 200
+    assert "drift" in response.json()
+
 # Test Updating Non-Existent Task
 def test_update_non_existent_task():
     response = client.patch(
@@ -94,6 +291,178 @@ def test_delete_task():
 def test_delete_non_existent_task():
     response = client.delete("/tasks/1000000")
     assert response.status_code == 404
+
+# Test Bulk Task Creation
+def test_create_tasks_bulk():
+    task = {
+        "title": "bulk task",
+        "description": "bulk description",
+        "due_date": datetime.now().isoformat(),
+        "priority": 1,
+        "status": False,
+    }
+    titles = ["bulk task a", "bulk task b", "bulk task c"]
+    response = client.post("/tasks/bulk", json={"tasks": [dict(task, title=t) for t in titles]}, headers=AUTH)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 3
+    assert all(result["status"] == "created" for result in results)
+    # Each result belongs to the submitted item at the same position
+    lookup = client.post("/tasks/lookup", json={"ids": [r["id"] for r in results]}).json()["results"]
+    assert [r["task"]["title"] for r in lookup] == titles
+
+def bulk_task_ids(n, headers=AUTH):
+    task = {"title": "bulk owned", "due_date": datetime.now().isoformat(), "priority": 1, "status": False}
+    results = client.post("/tasks/bulk", json={"tasks": [task] * n}, headers=headers).json()["results"]
+    return [r["id"] for r in results]
+
+# Test Bulk Task Update
+def test_update_tasks_bulk():
+    (task_id,) = bulk_task_ids(1)
+    response = client.patch(
+        "/tasks/bulk", json={"ids": [task_id, 1000000], "changes": {"status": True}}, headers=AUTH
+    )
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"id": task_id, "status": "updated"},
+        {"id": 1000000, "status": "not_found"},
+    ]
+
+# Test Bulk Task Update Without Changes
+def test_update_tasks_bulk_no_changes():
+    response = client.patch("/tasks/bulk", json={"ids": [1], "changes": {}}, headers=AUTH)
+    assert response.status_code == 400
+
+# Test Bulk Task Update With A Null Field
+def test_update_tasks_bulk_null_field():
+    response = client.patch("/tasks/bulk", json={"ids": [1], "changes": {"status": None}}, headers=AUTH)
+    assert response.status_code == 422
+
+# Test Bulk Task Deletion
+def test_delete_tasks_bulk():
+    (task_id,) = bulk_task_ids(1)
+    response = client.request("DELETE", "/tasks/bulk", json={"ids": [task_id, 1000000]}, headers=AUTH)
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"id": task_id, "status": "deleted"},
+        {"id": 1000000, "status": "not_found"},
+    ]
+
+# Test Bulk Writes Require Authentication And Ownership
+def test_bulk_writes_only_touch_the_callers_tasks():
+    (task_id,) = bulk_task_ids(1)
+    other = bearer(user_id=2, username="other")
+    assert client.patch("/tasks/bulk", json={"ids": [task_id], "changes": {"status": True}}).status_code == 401
+    assert client.request("DELETE", "/tasks/bulk", json={"ids": [task_id]}).status_code == 401
+
+    response = client.patch("/tasks/bulk", json={"ids": [task_id], "changes": {"status": True}}, headers=other)
+    assert response.json()["results"] == [{"id": task_id, "status": "not_found"}]
+    response = client.request("DELETE", "/tasks/bulk", json={"ids": [task_id]}, headers=other)
+    assert response.json()["results"] == [{"id": task_id, "status": "not_found"}]
+    assert client.get(f"/tasks/{task_id}").json()["status"] is False
+
+# Test Bulk Request With Too Many Items
+def test_delete_tasks_bulk_too_many_ids():
+    response = client.request("DELETE", "/tasks/bulk", json={"ids": list(range(5001))}, headers=AUTH)
+    assert response.status_code == 422
+
+# Test Including Related Data Without N+1 Queries
+@pytest.mark.max_statements(4)
+def test_read_tasks_include():
+    response = client.get("/tasks/", params={"limit": 20, "include": "owner,comments_count,latest_comment"})
+    assert response.status_code == 200
+    for task in response.json():
+        assert {"owner", "comments_count", "latest_comment"} <= set(task)
+        assert task["comments_count"] >= 0
+
+# Test Including Related Data On A Single Task
+def test_read_task_include():
+    task_id = client.post(
+        "/tasks/",
+        json={
+            "title": "included task",
+            "description": "include description",
+            "due_date": datetime.now().isoformat(),
+            "priority": 1,
+            "status": False,
+        },
+        headers=AUTH,
+    ).json()["id"]
+    response = client.get(f"/tasks/{task_id}", params={"include": "comments_count"})
+    assert response.status_code == 200
+    assert response.json()["comments_count"] == 0
+    assert "owner" not in response.json()
+
+    # The ETag covers the included data
+    etag = response.headers["ETag"]
+    assert etag != client.get(f"/tasks/{task_id}").headers["ETag"]
+    response = client.get(
+        f"/tasks/{task_id}", params={"include": "comments_count"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+# Test Include With An Unknown Relation
+def test_read_tasks_unknown_include():
+    response = client.get("/tasks/", params={"include": "owner,watchers"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown include: watchers"
+
+# Test Batch Lookup By Id
+def test_lookup_tasks():
+    task_id = client.post(
+        "/tasks/",
+        json={
+            "title": "looked up task",
+            "description": "lookup description",
+            "due_date": datetime.now().isoformat(),
+            "priority": 1,
+            "status": False,
+        },
+        headers=AUTH,
+    ).json()["id"]
+    response = client.post("/tasks/lookup", json={"ids": [task_id, 1000000, task_id]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["id"], r["found"]) for r in results] == [(task_id, True), (1000000, False), (task_id, True)]
+    assert results[0]["task"]["title"] == "looked up task"
+    assert results[1]["task"] is None
+
+# Test Batch Lookup Without Ids
+def test_lookup_tasks_empty():
+    response = client.post("/tasks/lookup", json={"ids": []})
+    assert response.status_code == 422
+
+# Test Incremental Sync From The Change Log
+def test_read_task_changes():
+    since = client.get("/tasks/changes", params={"since": 0, "limit": 5000}).json()["next_since"]
+    task_id = client.post(
+        "/tasks/",
+        json={
+            "title": "synced task",
+            "description": "synced description",
+            "due_date": datetime.now().isoformat(),
+            "priority": 1,
+            "status": False,
+        },
+        headers=AUTH,
+    ).json()["id"]
+    client.patch("/tasks/bulk", json={"ids": [task_id], "changes": {"priority": 3}})
+    client.delete(f"/tasks/{task_id}")
+
+    response = client.get("/tasks/changes", params={"since": since})
+    assert response.status_code == 200
+    page = response.json()
+    changes = [change for change in page["items"] if change["task_id"] == task_id]
+    assert [change["op"] for change in changes] == ["create", "update", "delete"]
+    assert changes[0]["fields"]["title"] == "synced task"
+    assert changes[1]["fields"] == {"priority": 3}
+    assert page["next_since"] == page["items"][-1]["seq"]
+    assert client.get("/tasks/changes", params={"since": page["next_since"]}).json()["items"] == []
+
+# Test Change Log With A Negative Sequence
+def test_read_task_changes_invalid_since():
+    response = client.get("/tasks/changes", params={"since": -1})
+    assert response.status_code == 422
 ```
 
 These tests cover the following scenarios:
@@ -101,4 +470,410 @@ These tests cover the following scenarios:
 - Success cases: The tests `test_create_task`, `test_read_tasks`, `test_read_task`, `test_update_task`, and `test_delete_task` ensure that the endpoints work as expected when provided with valid data.
 - Error cases: The tests `test_create_task_invalid_data`, `test_read_non_existent_task`, `test_update_non_existent_task`, and `test_delete_non_existent_task` check how the endpoints handle errors such as invalid data or requests for non-existent resources.
 - Data validation: The test `test_create_task_invalid_data` checks that the endpoint validates the provided data and rejects invalid inputs.
-- Edge cases: Reading, updating, and deleting a non-existent task are edge cases that test how the API handles uncommon but possible situations.
\ No newline at end of file
+- Edge cases: Reading, updating, and deleting a non-existent task are edge cases that test how the API handles uncommon but possible situations.
+- Authentication: Task writes send a bearer token minted with `create_access_token`. `test_create_task_unauthenticated` checks that a missing or invalid token gets 401, and `test_logout_revokes_token` that a token stops working after `/logout`.
+- Filtering: `test_read_tasks_filtered_and_sorted` and the sort validation tests cover the server-side filters and `sort`.
+- Fast JSON: `test_read_tasks_fast_json` checks that the orjson row path returns exactly what the default `response_model` path returns.
+- Projection: `test_read_tasks_fields*` check that `fields` returns only the requested keys, including in cursor mode, and rejects unknown fields.
+- Search: `test_search_tasks*` check ranked full-text results, that user input cannot inject FTS query syntax, and that `q` is required.
+- Conditional requests: `test_read_task_not_modified` checks that a matching `If-None-Match` yields an empty 304 and a stale one the full task.
+- Bulk operations: The `test_*_tasks_bulk` tests check the per-item results of the bulk endpoints, in submission order, including `not_found` entries and the batch size limit. `test_bulk_writes_only_touch_the_callers_tasks` checks that bulk updates and deletes need a token and report other users' tasks as `not_found`.
+- Includes: `test_read_task*_include` check that related data is added only when requested, and with a fixed number of SQL statements per request (`max_statements`, see `conftest.py`).
+- Batch lookup: `test_lookup_tasks*` check that `POST /tasks/lookup` answers in request order with `found: false` markers and rejects an empty list.
+- Single-task update: `test_update_task_side_effects` checks that `PATCH /tasks/{task_id}` can set `status` to false, and that the cached read, the search index, the change log and the summary counters all follow the update.
+- Change log: `test_read_task_changes` checks that a create, update and delete show up in order in `GET /tasks/changes`, and that polling from `next_since` returns nothing new.
+
+To compare offset and cursor pagination, the following benchmark builds a million-row SQLite fixture and times page 1 and page 10,000 in both modes:
+
+```python
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+import services
+from conftest import timed
+
+ROWS = 1_000_000
+PAGE_SIZE = 100
+DEEP_PAGE = 10_000
+
+@pytest.fixture(scope="module")
+def bench_db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("bench") / "tasks.db"
+    engine = create_engine(f"sqlite:///{path}")
+    models.Base.metadata.create_all(bind=engine)
+
+    start = datetime(2020, 1, 1)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO tasks (id, title, description, due_date, priority, status, owner_id, revision, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, 0, 1, 1, ?)",
+        (
+            (i, f"task {i}", "benchmark", (start + timedelta(minutes=i % 50_000)).isoformat(" "), i % 5, start.isoformat(" "))
+            for i in range(1, ROWS + 1)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+def _cursor_at(db, offset):
+    # Key of the last row before the requested page, found once outside the timing
+    key = (models.Task.due_date, models.Task.priority, models.Task.id)
+    task = db.query(models.Task).order_by(*key).offset(offset - 1).first()
+    return services.encode_cursor(task)
+
+@pytest.mark.perf
+def test_benchmark_offset_vs_cursor(bench_db):
+    deep_offset = (DEEP_PAGE - 1) * PAGE_SIZE
+    deep_cursor = _cursor_at(bench_db, deep_offset)
+
+    results = {
+        "offset page 1": timed(lambda: services.get_tasks(bench_db, skip=0, limit=PAGE_SIZE)),
+        "offset page 10000": timed(lambda: services.get_tasks(bench_db, skip=deep_offset, limit=PAGE_SIZE)),
+        "cursor page 1": timed(lambda: services.get_tasks_page(bench_db, cursor=None, limit=PAGE_SIZE)),
+        "cursor page 10000": timed(lambda: services.get_tasks_page(bench_db, cursor=deep_cursor, limit=PAGE_SIZE)),
+    }
+    for name, seconds in results.items():
+        print(f"{name}: {seconds * 1000:.2f} ms")
+
+    # Deep cursor pages should cost about the same as the first one
+    assert results["cursor page 10000"] < results["cursor page 1"] * 3
+```
+
+The bulk endpoints are benchmarked in rows per second against the per-row service functions, on a fresh SQLite file for each run:
+
+```python
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+import schemas
+import services
+
+ROWS = 10_000
+
+@pytest.fixture
+def bench_db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tasks.db'}")
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+def _task(i):
+    return schemas.TaskCreate(
+        title=f"task {i}", description="benchmark", due_date=datetime(2024, 1, 1), priority=i % 5, status=False
+    )
+
+def _rate(fn):
+    start = time.perf_counter()
+    fn()
+    return ROWS / (time.perf_counter() - start)
+
+@pytest.mark.perf
+def test_benchmark_per_row_create(bench_db):
+    tasks = [_task(i) for i in range(ROWS)]
+    rate = _rate(lambda: [services.create_user_task(bench_db, task, user_id=1) for task in tasks])
+    print(f"per-row create: {rate:,.0f} rows/s")
+
+@pytest.mark.perf
+def test_benchmark_bulk_create_update_delete(bench_db):
+    tasks = [_task(i) for i in range(ROWS)]
+    ids = []
+
+    def create():
+        ids.extend(result.id for result in services.create_user_tasks(bench_db, tasks, user_id=1))
+
+    print(f"bulk create: {_rate(create):,.0f} rows/s")
+    changes = schemas.TaskPatch(status=True)
+    print(f"bulk update: {_rate(lambda: services.update_tasks(bench_db, ids, changes)):,.0f} rows/s")
+    print(f"bulk delete: {_rate(lambda: services.delete_tasks(bench_db, ids)):,.0f} rows/s")
+```
+
+Search latency is benchmarked against a million-task FTS5 index built directly with `sqlite3`, for a common term, a rare term and a two-term query:
+
+```python
+import random
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+import search
+from conftest import timed
+
+ROWS = 1_000_000
+WORDS = [f"word{i}" for i in range(20_000)]
+
+@pytest.fixture(scope="module")
+def search_db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("bench") / "search.db"
+    engine = create_engine(f"sqlite:///{path}")
+    models.Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(0)
+    # Zipf-like vocabulary: low-numbered words are common, high-numbered ones rare
+    pick = lambda: WORDS[min(int(rng.paretovariate(1.1)) - 1, len(WORDS) - 1)]
+    rows = [(i, " ".join(pick() for _ in range(5)), " ".join(pick() for _ in range(30))) for i in range(1, ROWS + 1)]
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO tasks (id, title, description, due_date, priority, status, owner_id, revision, updated_at) "
+        "VALUES (?, ?, ?, '2024-01-01', 1, 0, 1, 1, '2024-01-01')",
+        rows,
+    )
+    conn.executemany("INSERT INTO task_fts (rowid, title, description) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+@pytest.mark.perf
+@pytest.mark.parametrize("q", ["word1", "word5000", "word2 word40"])
+def test_benchmark_search_latency(search_db, q):
+    seconds = timed(lambda: search.search_task_ids(search_db, q, limit=20))
+    print(f"{q!r}: {seconds * 1000:.2f} ms")
+```
+
+Removing tasks from the index also removes their comments. `comment_fts` keeps the comment id as its rowid, so the first test below checks that only the removed task's comments stop matching. The second one starts from a database created before search existed, and checks that `create_all` adds the search tables and indexes the rows already there:
+
+```python
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import models
+import search
+
+def test_remove_tasks_removes_their_comments():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    for task_id in (1, 2):
+        db.add(models.Task(id=task_id, title=f"task {task_id}", due_date=datetime(2024, 1, 1), priority=1, status=False, owner_id=1))
+    db.flush()
+    comments = [models.Comment(task_id=task_id, text=f"giraffe note {task_id}") for task_id in (1, 1, 2)]
+    db.add_all(comments)
+    db.flush()
+    for comment in comments:
+        search.index_comment(db, comment)
+
+    search.remove_tasks(db, [1])
+
+    assert db.execute(text("SELECT rowid FROM comment_fts")).scalars().all() == [comments[2].id]
+    assert search.search_task_ids(db, "giraffe") == [2]
+    db.close()
+
+def test_create_all_backfills_search_on_an_existing_database():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE task_fts"))
+        conn.execute(text("DROP TABLE comment_fts"))
+        conn.execute(
+            text(
+                "INSERT INTO tasks (id, title, description, due_date, priority, status, owner_id, revision, updated_at) "
+                "VALUES (1, 'legacy okapi', NULL, '2024-01-01', 1, 0, 1, 1, '2024-01-01')"
+            )
+        )
+        conn.execute(text("INSERT INTO comments (id, text, task_id, revision, updated_at) VALUES (1, 'legacy tapir', 1, 1, '2024-01-01')"))
+
+    models.Base.metadata.create_all(bind=engine)
+
+    db = sessionmaker(bind=engine)()
+    assert search.search_task_ids(db, "okapi") == [1]
+    assert search.search_task_ids(db, "tapir") == [1]
+    db.close()
+```
+
+The query-plan regression tests below run `EXPLAIN QUERY PLAN` for every combination of the supported filters, and for every sort. They fail if SQLite would answer any of them with a full table scan instead of one of the composite indexes:
+
+```python
+import itertools
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+import schemas
+import services
+
+FILTER_VALUES = {
+    "owner_id": 1,
+    "status": False,
+    "priority_min": 1,
+    "priority_max": 3,
+    "due_after": datetime(2024, 1, 1),
+    "due_before": datetime(2024, 2, 1),
+}
+FILTER_COMBINATIONS = [
+    combination
+    for size in range(1, len(FILTER_VALUES) + 1)
+    for combination in itertools.combinations(FILTER_VALUES, size)
+]
+TABLE_SCAN = re.compile(r"^SCAN (TABLE )?tasks(?! USING)")
+
+@pytest.fixture(scope="module")
+def plan_db():
+    engine = create_engine("sqlite:///:memory:")
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+def query_plan(db, query):
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    rows = db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), params).all()
+    return [row[-1] for row in rows]
+
+@pytest.mark.parametrize("combination", FILTER_COMBINATIONS, ids="+".join)
+def test_filters_use_an_index(plan_db, combination):
+    filters = schemas.TaskFilters(**{name: FILTER_VALUES[name] for name in combination})
+    plan = query_plan(plan_db, services.tasks_query(plan_db, filters))
+    assert any(line.startswith("SEARCH tasks USING") for line in plan), plan
+    assert not any(TABLE_SCAN.match(line) for line in plan), plan
+
+# "id" is the table's own rowid order, so walking the table is the index there
+@pytest.mark.parametrize("sort", [sort for sort in services.TASK_SORTS if sort != "id"])
+def test_sorts_do_not_scan_the_table(plan_db, sort):
+    plan = query_plan(plan_db, services.tasks_query(plan_db, sort=sort).limit(100))
+    assert not any(TABLE_SCAN.match(line) for line in plan), plan
+```
+
+Serialization cost per 1,000 rows is compared between the full path (ORM entities validated through `schemas.Task`, then JSON-encoded) and the projected path (`fields=id,title,status,due_date`, selected as columns and encoded from plain dicts):
+
+```python
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+import schemas
+import services
+from conftest import timed
+
+ROWS = 1_000
+LIST_FIELDS = ["id", "title", "status", "due_date"]
+
+@pytest.fixture(scope="module")
+def projection_db():
+    engine = create_engine("sqlite:///:memory:")
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        models.Task(
+            title=f"task {i}", description="lorem ipsum " * 50, due_date=datetime(2024, 1, 1),
+            priority=i % 5, status=False, owner_id=1,
+        )
+        for i in range(ROWS)
+    )
+    db.commit()
+    yield db
+    db.close()
+
+@pytest.mark.perf
+def test_benchmark_projection_serialization(projection_db):
+    def full():
+        db_tasks = services.get_tasks(projection_db, limit=ROWS)
+        return json.dumps(jsonable_encoder([schemas.Task.from_orm(task) for task in db_tasks])).encode()
+
+    def projected():
+        return json.dumps(services.get_task_fields(projection_db, LIST_FIELDS, limit=ROWS)).encode()
+
+    projection_db.expire_all()
+    full_time, full_size = timed(full, repeat=50), len(full())
+    projected_time, projected_size = timed(projected, repeat=50), len(projected())
+    print(f"full: {full_time * 1000:.2f} ms / 1,000 rows, {full_size:,} bytes")
+    print(f"projected: {projected_time * 1000:.2f} ms / 1,000 rows, {projected_size:,} bytes")
+    assert projected_size < full_size
+```
+
+The task summary counters are checked at the service level, against a fresh SQLite file per test. Every write path has to leave counters that a full reconciliation agrees with:
+
+```python
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+import models
+import schemas
+import services
+from task_summary import TaskSummary
+
+@pytest.fixture
+def summary_db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'summary.db'}")
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+def _new_task(priority, due_date, status=False):
+    return schemas.TaskCreate(
+        title="summary task", description="summary", due_date=due_date, priority=priority, status=status
+    )
+
+def test_task_summary_follows_writes(summary_db):
+    past, future = datetime.utcnow() - timedelta(days=1), datetime.utcnow() + timedelta(days=1)
+    overdue = services.create_user_task(summary_db, _new_task(1, past), user_id=1)
+    services.create_user_tasks(summary_db, [_new_task(1, future), _new_task(2, future)], user_id=1)
+    services.create_user_task(summary_db, _new_task(3, future), user_id=2)
+    done = services.create_user_task(summary_db, _new_task(2, future), user_id=1)
+
+    services.update_tasks(summary_db, [done.id], schemas.TaskPatch(status=True))
+    services.delete_task(summary_db, overdue.id)
+    services.create_user_task(summary_db, _new_task(1, past), user_id=1)
+
+    summary = services.get_task_summary(summary_db, 1)
+    assert (summary.open, summary.done, summary.overdue) == (3, 1, 1)
+    assert [(p.priority, p.open, p.done) for p in summary.by_priority] == [(1, 2, 0), (2, 1, 1)]
+    assert services.reconcile_task_summary(summary_db).drift == []
+
+def test_reconcile_reports_and_repairs_drift(summary_db):
+    services.create_user_task(summary_db, _new_task(1, datetime.utcnow()), user_id=1)
+    summary_db.execute(update(TaskSummary).values(count=5))
+    summary_db.commit()
+
+    report = services.reconcile_task_summary(summary_db)
+
+    assert [(d.owner_id, d.priority, d.status, d.stored, d.actual) for d in report.drift] == [(1, 1, False, 5, 1)]
+    assert services.get_task_summary(summary_db, 1).open == 1
+    assert services.reconcile_task_summary(summary_db).drift == []
+
+def test_reconcile_counts_null_status_as_open(summary_db):
+    for _ in range(2):
+        services.create_user_task(summary_db, _new_task(1, datetime.utcnow()), user_id=1)
+    summary_db.execute(update(models.Task).where(models.Task.id == 1).values(status=None))
+    summary_db.commit()
+
+    assert services.reconcile_task_summary(summary_db).drift == []
+    summary = services.get_task_summary(summary_db, 1)
+    assert (summary.open, summary.overdue) == (2, 2)
+```